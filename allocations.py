@@ -0,0 +1,215 @@
+# allocations.py
+# Módulo para diagnosticar las asignaciones de memoria por frame y controlar el recolector de basura
+
+import gc
+import time
+import logging
+import linecache
+import tracemalloc
+from collections import Counter
+
+from metrics import percentile
+
+class AllocationTracker:
+    """
+    Diagnóstico de asignaciones con tracemalloc. En cada frame compara una
+    instantánea con la del frame anterior y acumula, por línea de código,
+    los bloques y bytes que han quedado vivos; además mide el pico de
+    memoria temporal del frame (lo que se asigna y se libera dentro de él).
+
+    Es caro (una instantánea por frame), así que solo sirve para encontrar
+    qué líneas asignan memoria en cada frame, no para medir tiempos. Con
+    interval > 1 la comparación se hace cada varios frames (acumulando lo
+    asignado entre medias), que es mucho más rápido en sesiones largas.
+    """
+
+    def __init__(self, interval=1, top=15, depth=1):
+        """
+        Inicializa el diagnóstico (sin arrancarlo).
+
+        Args:
+            interval (int): Frames entre dos instantáneas
+            top (int): Número de líneas que se incluyen en el informe
+            depth (int): Profundidad de la pila guardada por asignación
+        """
+        self.interval: int = max(1, interval)
+        self.top: int = top
+        self.depth: int = depth
+        self.frames = 0
+        self.blocks: Counter = Counter()
+        self.sizes: Counter = Counter()
+        self.peaks: list[int] = []
+
+        self._filters = (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, linecache.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        )
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self._frame_start_memory = 0
+
+    def start(self):
+        """Empieza a registrar las asignaciones."""
+        tracemalloc.start(self.depth)
+        self._snapshot = self._take_snapshot()
+        logging.info("Diagnóstico de asignaciones activo (tracemalloc)")
+
+    def _take_snapshot(self):
+        """
+        Toma una instantánea filtrada (sin las asignaciones del propio diagnóstico).
+
+        Returns:
+            tracemalloc.Snapshot: Instantánea actual
+        """
+        return tracemalloc.take_snapshot().filter_traces(self._filters)
+
+    def begin_frame(self):
+        """Marca el inicio de un frame para medir su pico de memoria temporal."""
+        self._frame_start_memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def end_frame(self):
+        """Acumula las asignaciones del frame por línea de código."""
+        peak = tracemalloc.get_traced_memory()[1]
+        self.peaks.append(peak - self._frame_start_memory)
+        self.frames += 1
+        if self.frames % self.interval:
+            return
+
+        snapshot = self._take_snapshot()
+        for stat in snapshot.compare_to(self._snapshot, "lineno"):
+            if stat.count_diff > 0:
+                frame = stat.traceback[0]
+                site = f"{frame.filename}:{frame.lineno}"
+                self.blocks[site] += stat.count_diff
+                self.sizes[site] += stat.size_diff
+        self._snapshot = snapshot
+
+    def stop(self):
+        """Deja de registrar y escribe el informe en el log."""
+        if not tracemalloc.is_tracing():
+            return
+        tracemalloc.stop()
+        self._snapshot = None
+        self.log_report()
+
+    def report(self):
+        """
+        Genera el informe de asignaciones.
+
+        Returns:
+            list: Filas (línea de código, bloques por frame, bytes por frame)
+                de las que más bloques asignan, de mayor a menor
+        """
+        frames = max(1, self.frames)
+        return [
+            (site, count / frames, self.sizes[site] / frames)
+            for site, count in self.blocks.most_common(self.top)
+        ]
+
+    def log_report(self):
+        """Registra en el log las líneas que más asignan y el pico temporal por frame."""
+        peaks = sorted(self.peaks)
+        if peaks:
+            logging.info(
+                f"Asignaciones en {self.frames} frames: pico temporal p50 {percentile(peaks, 0.50) / 1024:.1f} KiB, "
+                f"p99 {percentile(peaks, 0.99) / 1024:.1f} KiB, máx {peaks[-1] / 1024:.1f} KiB"
+            )
+        for site, blocks, size in self.report():
+            logging.info(f"  {site}: {blocks:.2f} bloques/frame, {size:.0f} bytes/frame")
+
+class GCPolicy:
+    """
+    Controla el recolector de basura cíclico para que sus pausas no caigan
+    en plena partida:
+
+    - Tras la carga inicial, gc.freeze() mueve todos los objetos vivos
+      (fuentes, superficies, módulos...) a una generación permanente que
+      el recolector ya no recorre.
+    - Mientras se juega, las colecciones de la generación 2 (las caras)
+      se aplazan; las generaciones jóvenes siguen funcionando con normalidad.
+    - Al salir de la partida (pausa, menú, fin de partida) se hace la
+      colección completa pendiente, donde la pausa no se nota.
+
+    También mide la duración de cada colección para el resumen final.
+    """
+
+    # Umbral de la generación 2 mientras se juega (en la práctica, nunca)
+    DEFERRED_THRESHOLD = 1_000_000
+
+    def __init__(self, freeze=True, defer_full=True):
+        """
+        Inicializa la política (sin aplicarla).
+
+        Args:
+            freeze (bool): Congelar los objetos de la carga inicial
+            defer_full (bool): Aplazar la generación 2 mientras se juega
+        """
+        self.freeze: bool = freeze
+        self.defer_full: bool = defer_full
+        self.playing = False
+        self.thresholds: tuple = gc.get_threshold()
+
+        # Duración (ms) de las colecciones por generación y por estado
+        self.pauses: dict[tuple[int, bool], list[float]] = {}
+        self._collect_start = 0
+
+    def start(self):
+        """Aplica la política; llamar cuando termina la carga inicial."""
+        if self.freeze:
+            gc.collect()
+            gc.freeze()
+            logging.info(f"Recolector: {gc.get_freeze_count()} objetos congelados tras la carga inicial")
+        gc.callbacks.append(self._on_collect)
+
+    def stop(self):
+        """Restaura la configuración del recolector y registra sus pausas."""
+        if self._on_collect in gc.callbacks:
+            gc.callbacks.remove(self._on_collect)
+        gc.set_threshold(*self.thresholds)
+        if self.freeze:
+            gc.unfreeze()
+        self.log_summary()
+
+    def update(self, playing):
+        """
+        Informa del estado del juego; llamar una vez por frame.
+
+        Args:
+            playing (bool): True si la partida está en curso
+        """
+        if playing == self.playing:
+            return
+        self.playing = playing
+        if not self.defer_full:
+            return
+        if playing:
+            gc.set_threshold(self.thresholds[0], self.thresholds[1], self.DEFERRED_THRESHOLD)
+        else:
+            gc.set_threshold(*self.thresholds)
+            gc.collect()
+
+    def _on_collect(self, phase, info):
+        """
+        Callback del recolector: mide cada colección.
+
+        Args:
+            phase (str): "start" o "stop"
+            info (dict): Información de la colección (incluye la generación)
+        """
+        if phase == "start":
+            self._collect_start = time.perf_counter_ns()
+        else:
+            key = (info["generation"], self.playing)
+            self.pauses.setdefault(key, []).append((time.perf_counter_ns() - self._collect_start) / 1e6)
+
+    def log_summary(self):
+        """Registra en el log las colecciones por generación, dentro y fuera de la partida."""
+        for (generation, playing), pauses in sorted(self.pauses.items()):
+            pauses.sort()
+            logging.info(
+                f"Recolector gen {generation} ({'jugando' if playing else 'fuera de partida'}): "
+                f"{len(pauses)} colecciones, p99 {percentile(pauses, 0.99):.3f} ms, máx {pauses[-1]:.3f} ms"
+            )
@@ -0,0 +1,178 @@
+# animation.py
+# Módulo con un sistema de animaciones no bloqueante basado en frames
+
+def linear(t):
+    """
+    Curva de interpolación lineal.
+
+    Args:
+        t (float): Progreso normalizado (0.0 - 1.0)
+
+    Returns:
+        float: Progreso interpolado
+    """
+    return t
+
+def ease_out_quad(t):
+    """
+    Curva de interpolación que desacelera al final.
+
+    Args:
+        t (float): Progreso normalizado (0.0 - 1.0)
+
+    Returns:
+        float: Progreso interpolado
+    """
+    return 1 - (1 - t) * (1 - t)
+
+class Tween:
+    """
+    Interpola un valor numérico entre dos extremos durante un tiempo dado.
+    """
+
+    def __init__(self, start, end, duration, easing=linear):
+        """
+        Inicializa la interpolación.
+
+        Args:
+            start (float): Valor inicial
+            end (float): Valor final
+            duration (int): Duración en milisegundos
+            easing (callable): Curva de interpolación
+        """
+        self.start = start
+        self.end = end
+        self.duration: int = max(1, duration)
+        self.easing = easing
+
+    def value(self, elapsed):
+        """
+        Obtiene el valor interpolado para un tiempo transcurrido.
+
+        Args:
+            elapsed (int): Milisegundos transcurridos desde el inicio
+
+        Returns:
+            float: Valor interpolado (limitado a los extremos)
+        """
+        t = min(1.0, max(0.0, elapsed / self.duration))
+        return self.start + (self.end - self.start) * self.easing(t)
+
+class TimedEffect:
+    """
+    Efecto que se dibuja durante un tiempo limitado.
+    En cada frame llama a una función de dibujo con el tiempo transcurrido.
+    """
+
+    def __init__(self, duration, draw):
+        """
+        Inicializa el efecto.
+
+        Args:
+            duration (int): Duración del efecto en milisegundos
+            draw (callable): Función draw(elapsed, progress) que dibuja el efecto
+        """
+        self.duration: int = max(1, duration)
+        self.draw_callback = draw
+        self.elapsed = 0
+
+    @property
+    def finished(self):
+        """bool: True si el efecto ya ha terminado."""
+        return self.elapsed >= self.duration
+
+    def update(self, dt):
+        """
+        Avanza el efecto.
+
+        Args:
+            dt (int): Milisegundos transcurridos desde el último frame
+        """
+        self.elapsed = min(self.duration, self.elapsed + dt)
+
+    def draw(self):
+        """Dibuja el estado actual del efecto."""
+        self.draw_callback(self.elapsed, self.elapsed / self.duration)
+
+class AnimationTimeline:
+    """
+    Línea de tiempo que gestiona los efectos activos.
+    Los efectos añadidos con play() se reproducen en paralelo, y los
+    añadidos con queue() esperan a que termine el anterior de la cola.
+    """
+
+    def __init__(self):
+        """Inicializa una línea de tiempo vacía."""
+        self.active: list[TimedEffect] = []
+        self.pending: list[TimedEffect] = []
+        self.current: TimedEffect | None = None
+
+    def play(self, effect):
+        """
+        Reproduce un efecto inmediatamente, en paralelo con los demás.
+
+        Args:
+            effect (TimedEffect): Efecto a reproducir
+
+        Returns:
+            TimedEffect: El efecto añadido
+        """
+        self.active.append(effect)
+        return effect
+
+    def queue(self, effect):
+        """
+        Añade un efecto a la cola secuencial.
+
+        Args:
+            effect (TimedEffect): Efecto a encolar
+
+        Returns:
+            TimedEffect: El efecto añadido
+        """
+        if self.current is None:
+            self.current = effect
+        else:
+            self.pending.append(effect)
+        return effect
+
+    def update(self, dt):
+        """
+        Avanza todos los efectos y descarta los que han terminado.
+
+        Args:
+            dt (int): Milisegundos transcurridos desde el último frame
+        """
+        for effect in self.active:
+            effect.update(dt)
+        self.active = [effect for effect in self.active if not effect.finished]
+
+        # Avanzar la cola secuencial (el tiempo sobrante pasa al siguiente)
+        while self.current is not None and dt > 0:
+            remaining = self.current.duration - self.current.elapsed
+            self.current.update(dt)
+            dt -= remaining
+            if self.current.finished:
+                self.current = self.pending.pop(0) if self.pending else None
+
+    def draw(self):
+        """Dibuja todos los efectos en curso."""
+        for effect in self.active:
+            effect.draw()
+        if self.current is not None:
+            self.current.draw()
+
+    def clear(self):
+        """Cancela todos los efectos."""
+        self.active.clear()
+        self.pending.clear()
+        self.current = None
+
+    def is_running(self):
+        """
+        Indica si hay algún efecto en curso.
+
+        Returns:
+            bool: True si hay efectos activos o en cola
+        """
+        return bool(self.active) or self.current is not None
@@ -0,0 +1,314 @@
+# arena.py
+# Módulo con la vista de arena: muchas partidas automáticas en una ventana
+
+import math
+import time
+import logging
+import pygame
+
+from board import Board
+from pieces import PieceGenerator
+from bot import best_move
+from render_backend import SurfaceBackend, render_block
+from startup import init_pygame, sys_font
+from constants import (
+    GRID_WIDTH, GRID_HEIGHT, FPS, PALETTE, BG_COLOR, BORDER_COLOR, TEXT_COLOR,
+    ARENA_WIDTH, ARENA_HEIGHT
+)
+
+class ArenaGame:
+    """
+    Partida automática de la arena: un tablero, su generador de piezas y
+    un jugador automático que coloca cada pieza.
+    """
+
+    def __init__(self, fall_interval=3):
+        """
+        Inicializa la partida.
+
+        Args:
+            fall_interval (int): Frames entre cada caída de la pieza
+        """
+        self.fall_interval: int = fall_interval
+        self.games_played = 0
+        self.best_score = 0
+        self.reset()
+
+    def reset(self):
+        """Empieza una partida nueva (el tablero se sustituye)."""
+        self.board = Board()
+        self.piece_generator = PieceGenerator()
+        self.frame = 0
+        self._spawn()
+
+    def _spawn(self):
+        """Saca la siguiente pieza y calcula su jugada."""
+        self.current_piece = self.piece_generator.get_next_piece()
+        self.target = best_move(self.board, self.current_piece)
+
+    def step(self):
+        """
+        Avanza la partida un frame: una acción del jugador automático y,
+        cada fall_interval frames, la caída de la pieza.
+        """
+        self.frame += 1
+        piece = self.current_piece
+
+        # Acercar la pieza a la jugada elegida (una acción por frame)
+        if self.target is not None:
+            rotation, x = self.target
+            original = (piece.x, piece.rotation)
+            if piece.rotation != rotation:
+                piece.rotate()
+            elif piece.x < x:
+                piece.move_right()
+            elif piece.x > x:
+                piece.move_left()
+            if not self.board.is_valid_position(piece):
+                # Movimiento bloqueado: abandonar la jugada y dejar caer
+                piece.x, piece.rotation = original
+                self.target = None
+
+        if self.frame % self.fall_interval:
+            return
+
+        # Caída
+        piece.move_down()
+        if self.board.is_valid_position(piece):
+            return
+        piece.y -= 1
+        if not self.board.add_piece(piece) or not self._spawn_fits():
+            self.games_played += 1
+            self.best_score = max(self.best_score, self.board.score)
+            self.reset()
+
+    def _spawn_fits(self):
+        """
+        Saca la siguiente pieza y comprueba si cabe.
+
+        Returns:
+            bool: False si la nueva pieza no cabe (fin de la partida)
+        """
+        self._spawn()
+        return self.board.is_valid_position(self.current_piece)
+
+class ArenaView:
+    """
+    Vista que dibuja muchas partidas en miniatura en una sola ventana.
+    Cada tablero tiene su propia superficie cacheada en la que solo se
+    vuelven a dibujar las filas que han cambiado, los bloques salen de un
+    atlas compartido y todo se compone con una única llamada a blits().
+    """
+
+    def __init__(self, games, surface_size, cell_size=None):
+        """
+        Inicializa la vista.
+
+        Args:
+            games (list): Partidas a mostrar (ArenaGame)
+            surface_size (tuple): Tamaño del área de dibujo (ancho, alto)
+            cell_size (int, opcional): Tamaño de celda (por defecto, el mayor que cabe)
+        """
+        self.games = games
+        self._calculate_layout(surface_size, cell_size)
+
+        # Atlas compartido: un bloque por índice de paleta
+        size = self.cell_size
+        self.atlas = pygame.Surface((size * len(PALETTE), size))
+        self.atlas_areas: list[pygame.Rect] = []
+        for index, color in enumerate(PALETTE):
+            area = pygame.Rect(index * size, 0, size, size)
+            if index:
+                self.atlas.blit(render_block(color, size), area)
+            else:
+                self.atlas.fill(BG_COLOR, area)
+            self.atlas_areas.append(area)
+
+        self.font = sys_font('Arial', max(10, int(size * 1.6)), bold=True)
+
+        # Fondo estático con el marco de cada tablero (se dibuja una vez)
+        self.background = pygame.Surface(surface_size)
+        self.background.fill(BG_COLOR)
+        for index in range(len(games)):
+            x, y = self._board_origin(index)
+            pygame.draw.rect(
+                self.background,
+                BORDER_COLOR,
+                (x - 1, y - 1, self.board_width + 2, self.board_height + 2),
+                1
+            )
+
+        # Caché por tablero: superficie, filas dibujadas, versión y etiqueta
+        self._board_surfaces: list[pygame.Surface] = []
+        self._drawn_rows: list[list] = []
+        self._drawn_versions: list = []
+        self._labels: list = []
+        for _ in games:
+            board_surface = pygame.Surface((self.board_width, self.board_height))
+            board_surface.fill(BG_COLOR)
+            self._board_surfaces.append(board_surface)
+            self._drawn_rows.append([None] * GRID_HEIGHT)
+            self._drawn_versions.append(None)
+            self._labels.append((None, None))
+
+    def _calculate_layout(self, surface_size, cell_size):
+        """
+        Reparte los tableros en la rejilla que permite celdas más grandes.
+
+        Args:
+            surface_size (tuple): Tamaño del área de dibujo (ancho, alto)
+            cell_size (int, opcional): Tamaño de celda forzado
+        """
+        width, height = surface_size
+        count = max(1, len(self.games))
+        best = None
+        for columns in range(1, count + 1):
+            rows = math.ceil(count / columns)
+            # Cada tablero deja una celda de margen y dos filas para la etiqueta
+            size = min(width // (columns * (GRID_WIDTH + 1)), height // (rows * (GRID_HEIGHT + 3)))
+            if best is None or size > best[0]:
+                best = (size, columns, rows)
+        fitted_size, self.columns, self.rows = best
+        self.cell_size: int = max(2, cell_size or fitted_size)
+
+        self.board_width = GRID_WIDTH * self.cell_size
+        self.board_height = GRID_HEIGHT * self.cell_size
+        self.tile_width: int = width // self.columns
+        self.tile_height: int = height // self.rows
+
+    def _board_origin(self, index):
+        """
+        Calcula la posición en pantalla de un tablero.
+
+        Args:
+            index (int): Índice del tablero
+
+        Returns:
+            tuple: Esquina superior izquierda del tablero
+        """
+        column = index % self.columns
+        row = index // self.columns
+        x = column * self.tile_width + (self.tile_width - self.board_width) // 2
+        y = row * self.tile_height + 2 * self.cell_size
+        return x, y
+
+    def _refresh_board(self, index, board):
+        """
+        Actualiza la superficie cacheada de un tablero, redibujando solo las
+        filas cuyo contenido ha cambiado desde el último frame.
+
+        Args:
+            index (int): Índice del tablero
+            board (Board): Tablero de la partida
+        """
+        if self._drawn_versions[index] == (id(board), board.version):
+            return
+        self._drawn_versions[index] = (id(board), board.version)
+
+        board_surface = self._board_surfaces[index]
+        drawn_rows = self._drawn_rows[index]
+        size = self.cell_size
+        grid = board.grid
+        for y in range(GRID_HEIGHT):
+            row = grid[y * GRID_WIDTH:(y + 1) * GRID_WIDTH]
+            if row == drawn_rows[y]:
+                continue
+            drawn_rows[y] = bytes(row)
+            board_surface.blits(
+                [(self.atlas, (x * size, y * size), self.atlas_areas[cell]) for x, cell in enumerate(row)],
+                doreturn=False
+            )
+
+    def _label(self, index, game):
+        """
+        Obtiene la etiqueta (puntuación) de un tablero, renderizándola solo
+        si ha cambiado.
+
+        Args:
+            index (int): Índice del tablero
+            game (ArenaGame): Partida del tablero
+
+        Returns:
+            pygame.Surface: Etiqueta renderizada
+        """
+        text = f"{game.board.score}  ({game.games_played})"
+        cached_text, label = self._labels[index]
+        if cached_text != text:
+            label = self.font.render(text, True, TEXT_COLOR)
+            self._labels[index] = (text, label)
+        return label
+
+    def draw(self, surface):
+        """
+        Dibuja todos los tableros.
+
+        Args:
+            surface (pygame.Surface): Superficie destino
+        """
+        size = self.cell_size
+        sequence = [(self.background, (0, 0))]
+        for index, game in enumerate(self.games):
+            self._refresh_board(index, game.board)
+            x, y = self._board_origin(index)
+
+            # Tablero cacheado y etiqueta
+            sequence.append((self._board_surfaces[index], (x, y)))
+            sequence.append((self._label(index, game), (x, y - 2 * size)))
+
+            # Pieza actual
+            piece = game.current_piece
+            area = self.atlas_areas[piece.color_index]
+            for cx, cy in piece.get_coordinates():
+                if cy >= 0:
+                    sequence.append((self.atlas, (x + cx * size, y + cy * size), area))
+
+        surface.blits(sequence, doreturn=False)
+
+def run_arena(count, max_frames=None, recorder=None, uncapped=False):
+    """
+    Ejecuta la arena con varias partidas automáticas.
+
+    Args:
+        count (int): Número de partidas simultáneas
+        max_frames (int, opcional): Número de frames tras el que se termina
+        recorder (FrameRecorder, opcional): Grabador de frames y tiempos de render
+        uncapped (bool): Si es True, no limita los FPS (benchmarks)
+    """
+    init_pygame()
+    backend = SurfaceBackend((ARENA_WIDTH, ARENA_HEIGHT), f"Tetris - Arena ({count})")
+    games = [ArenaGame() for _ in range(count)]
+    view = ArenaView(games, (ARENA_WIDTH, ARENA_HEIGHT))
+    logging.info(
+        f"Arena: {count} partidas en {view.columns}x{view.rows}, celdas de {view.cell_size}px"
+    )
+
+    clock = pygame.time.Clock()
+    frame = 0
+    running = True
+    try:
+        while running:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    running = False
+
+            for game in games:
+                game.step()
+
+            render_start = time.perf_counter()
+            view.draw(backend.surface)
+            backend.present()
+            frame += 1
+            if recorder is not None:
+                recorder.record(frame, backend, (time.perf_counter() - render_start) * 1000)
+
+            if max_frames is not None and frame >= max_frames:
+                running = False
+            if not uncapped:
+                clock.tick(FPS)
+    finally:
+        played = sum(game.games_played for game in games)
+        best = max((game.best_score for game in games), default=0)
+        logging.info(f"Arena terminada: {frame} frames, {played} partidas, mejor puntuación {best}")
+        pygame.quit()
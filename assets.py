@@ -0,0 +1,190 @@
+# assets.py
+# Módulo para cargar los recursos del juego (imágenes, música) en segundo plano
+
+import logging
+import threading
+from typing import NamedTuple
+
+import pygame
+
+# Imagen de la pantalla de carga (se carga antes que nada, es muy pequeña)
+SPLASH_IMAGE = "./content/images/splash.jpeg"
+
+class Asset(NamedTuple):
+    """Recurso a cargar: nombre, tipo ("image" o "music"), ruta y grupo."""
+    name: str
+    kind: str
+    path: str
+    group: str
+
+# Recursos del juego. El grupo "menu" es lo que necesita el menú principal
+# para mostrarse; el resto se sigue cargando detrás del menú.
+ASSETS: tuple[Asset, ...] = (
+    Asset("icon", "image", "./content/images/icon.ico", "menu"),
+    Asset("title_music", "music", "./content/sounds/title.ogg", "menu"),
+    Asset("main_music", "music", "./content/sounds/main.ogg", "game"),
+)
+
+def load_splash():
+    """
+    Carga la imagen de la pantalla de carga en el hilo principal.
+
+    Returns:
+        pygame.Surface: Imagen, o None si no se puede cargar
+    """
+    try:
+        return _convert(pygame.image.load(SPLASH_IMAGE))
+    except (pygame.error, FileNotFoundError) as e:
+        logging.warning(f"No se pudo cargar la pantalla de carga: {e}")
+        return None
+
+def _convert(surface, alpha=False):
+    """
+    Convierte una imagen al formato de la ventana (blits más rápidos). Con
+    el backend de texturas no hay superficie de ventana y se deja tal cual.
+
+    Args:
+        surface (pygame.Surface): Imagen decodificada
+        alpha (bool): Conservar la transparencia
+
+    Returns:
+        pygame.Surface: Imagen convertida
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+class AssetLoader:
+    """
+    Carga los recursos en un hilo propio mientras el hilo principal sigue
+    dibujando (la pantalla de carga y, en cuanto su grupo está listo, el
+    menú). Las imágenes se decodifican y convierten al formato de la
+    ventana; la música se lee entera una vez (queda en la caché de disco
+    del sistema, así que al reproducirla no hay que esperar al disco) y se
+    entrega su ruta.
+
+    Un recurso que no se puede cargar queda como None y se registra en el
+    log: el juego funciona igual sin él.
+    """
+
+    def __init__(self, assets=ASSETS):
+        """
+        Inicializa el cargador (sin arrancar el hilo).
+
+        Args:
+            assets (tuple): Recursos a cargar, en orden
+        """
+        self.assets: tuple[Asset, ...] = tuple(assets)
+        self.loaded: dict[str, object] = {}
+        self.done = 0
+
+        # Recursos pendientes por grupo y aviso de grupo completo
+        self._pending: dict[str, int] = {}
+        for asset in self.assets:
+            self._pending[asset.group] = self._pending.get(asset.group, 0) + 1
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        """Arranca el hilo de carga."""
+        self._thread = threading.Thread(target=self._run, name="asset-loader", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        """Bucle del hilo: carga los recursos uno a uno, en orden."""
+        for asset in self.assets:
+            try:
+                value = self._load(asset)
+            except (pygame.error, IOError, OSError) as e:
+                logging.warning(f"No se pudo cargar '{asset.path}': {e}")
+                value = None
+            with self._condition:
+                self.loaded[asset.name] = value
+                self.done += 1
+                self._pending[asset.group] -= 1
+                self._condition.notify_all()
+        logging.info(f"Recursos cargados: {self.done} de {len(self.assets)}")
+
+    def _load(self, asset):
+        """
+        Carga un recurso.
+
+        Args:
+            asset (Asset): Recurso a cargar
+
+        Returns:
+            object: Imagen (pygame.Surface) o música (ruta del fichero)
+        """
+        if asset.kind == "image":
+            return _convert(pygame.image.load(asset.path), alpha=True)
+        if asset.kind == "music":
+            with open(asset.path, "rb") as file:
+                while file.read(1 << 20):
+                    pass
+            return asset.path
+        raise ValueError(f"Tipo de recurso desconocido: {asset.kind}")
+
+    def progress(self):
+        """
+        Obtiene el progreso de la carga.
+
+        Returns:
+            float: Fracción de recursos cargados (0.0 a 1.0)
+        """
+        return self.done / len(self.assets) if self.assets else 1.0
+
+    def ready(self, group):
+        """
+        Comprueba si todos los recursos de un grupo están cargados.
+
+        Args:
+            group (str): Nombre del grupo
+
+        Returns:
+            bool: True si el grupo está completo
+        """
+        return self._pending.get(group, 0) == 0
+
+    def wait(self, group=None, timeout=None):
+        """
+        Espera a que termine de cargarse un grupo (o todo).
+
+        Args:
+            group (str, opcional): Grupo a esperar (None = todos los recursos)
+            timeout (float, opcional): Espera máxima en segundos
+
+        Returns:
+            bool: True si la carga ha terminado
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self.done == len(self.assets) if group is None else self.ready(group),
+                timeout
+            )
+
+    def wait_for(self, name, timeout=None):
+        """
+        Espera a que se cargue un recurso concreto.
+
+        Args:
+            name (str): Nombre del recurso
+            timeout (float, opcional): Espera máxima en segundos
+
+        Returns:
+            object: El recurso, o None si falló o se agotó la espera
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: name in self.loaded, timeout)
+            return self.loaded.get(name)
+
+    def get(self, name):
+        """
+        Obtiene un recurso cargado.
+
+        Args:
+            name (str): Nombre del recurso
+
+        Returns:
+            object: El recurso, o None si aún no está cargado o falló
+        """
+        return self.loaded.get(name)
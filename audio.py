@@ -0,0 +1,267 @@
+# audio.py
+# Módulo con la música y los efectos de sonido del juego
+
+import os
+import math
+import time
+import queue
+import logging
+import threading
+from array import array
+
+import pygame
+
+# Configuración del mezclador: búfer pequeño para que los efectos suenen
+# sin retraso (512 muestras a 44,1 kHz son unos 12 ms)
+AUDIO_FREQUENCY = 44100
+AUDIO_BUFFER = 512
+
+MUSIC_VOLUME = 0.5
+SFX_VOLUME = 0.6
+
+# Música de cada estado del juego (el resto de estados usa la del título)
+STATE_MUSIC: dict[str, str] = {
+    "PLAYING": "main_music",
+}
+
+# Efectos de sonido. Si existe content/sounds/<nombre>.wav (u .ogg) se usa
+# ese fichero; si no, se sintetiza con estas notas: (frecuencias en Hz,
+# duración de cada nota en ms, volumen)
+SOUND_EFFECTS: dict[str, tuple[tuple[float, ...], int, float]] = {
+    "move": ((440,), 30, 0.25),
+    "rotate": ((660,), 45, 0.3),
+    "lock": ((180,), 70, 0.5),
+    "line_clear": ((523, 784), 70, 0.5),
+    "tetris": ((523, 659, 784, 1047), 80, 0.6),
+    "game_over": ((440, 330, 262, 196), 160, 0.6),
+}
+SOUNDS_DIR = "./content/sounds"
+
+# Intervalo (s) con el que se comprueba si los efectos han terminado antes
+# de tocar la música (ver AudioManager)
+EFFECTS_POLL = 0.005
+
+def _synthesize(notes, note_ms, volume, frequency, channels):
+    """
+    Genera un efecto corto (notas seguidas con caída de volumen) en PCM
+    de 16 bits con signo, en el formato del mezclador.
+
+    Args:
+        notes (tuple): Frecuencias de las notas (Hz)
+        note_ms (int): Duración de cada nota (ms)
+        volume (float): Volumen (0.0 a 1.0)
+        frequency (int): Frecuencia de muestreo del mezclador
+        channels (int): Canales del mezclador
+
+    Returns:
+        bytes: Muestras entrelazadas
+    """
+    samples = array("h")
+    note_length = max(1, frequency * note_ms // 1000)
+    amplitude = 32767 * volume
+    for note in notes:
+        step = 2 * math.pi * note / frequency
+        for i in range(note_length):
+            envelope = 1.0 - i / note_length
+            value = int(amplitude * envelope * math.sin(step * i))
+            samples.extend((value,) * channels)
+    return samples.tobytes()
+
+class AudioManager:
+    """
+    Música y efectos de sonido. Todas las llamadas al mezclador (abrir
+    el mezclador, preparar los efectos, cambiar de pista, disparar un
+    efecto) se hacen en un hilo propio; el hilo del juego solo encola
+    órdenes, que no bloquean.
+
+    Cuidado con el GIL: cuando termina un efecto, el hilo de mezcla de
+    SDL pide el GIL con el audio bloqueado para soltar el Sound del
+    canal, y pygame.mixer.music pide el bloqueo del audio sin soltar el
+    GIL. Si coinciden, el juego se queda colgado para siempre. Por eso
+    las órdenes de música esperan a que todos los canales hayan soltado
+    su Sound (Channel.get_sound() es None): entonces no queda ningún
+    final de efecto pendiente, y como todos se disparan desde este mismo
+    hilo, no puede empezar otro mientras tanto. La música se lee de un
+    fichero y no de un objeto de Python por el mismo motivo.
+
+    La música se reproduce en streaming con pygame.mixer.music desde el
+    fichero que ya leyó el AssetLoader (queda en la caché de disco). Los
+    efectos son objetos Sound decodificados de antemano.
+
+    Si no hay dispositivo de audio (o se desactiva), todo queda en silencio
+    y el juego funciona igual.
+    """
+
+    def __init__(self, assets, enabled=True):
+        """
+        Inicializa el gestor (sin abrir el dispositivo de audio).
+
+        Args:
+            assets (AssetLoader): Cargador del que se toma la música
+            enabled (bool): False para no usar audio en absoluto
+        """
+        self.assets = assets
+        self.enabled: bool = enabled
+        self.sounds: dict[str, pygame.mixer.Sound] = {}
+        self._channels: list[pygame.mixer.Channel] = []
+
+        self._music: str | None = None
+        self._paused = False
+        self._commands: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        """Arranca el hilo de audio (abre el mezclador en segundo plano)."""
+        if not self.enabled:
+            return
+        self._thread = threading.Thread(target=self._run, name="audio", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Detiene la música, el hilo de audio y el mezclador."""
+        if self._thread is None:
+            return
+        self._commands.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        """Bucle del hilo: abre el mezclador, prepara los efectos y atiende órdenes."""
+        if not self._open_mixer():
+            self.enabled = False
+            # Vaciar la cola hasta la orden de parada
+            while self._commands.get() is not None:
+                pass
+            return
+
+        self._load_sounds()
+        while True:
+            command = self._commands.get()
+            if command is None:
+                break
+            try:
+                command()
+            except pygame.error as e:
+                logging.warning(f"Error de audio: {e}")
+
+        self._wait_for_effects()
+        pygame.mixer.music.stop()
+        pygame.mixer.quit()
+
+    def _open_mixer(self):
+        """
+        Abre el dispositivo de audio con el búfer pequeño.
+
+        Returns:
+            bool: True si hay audio; False si no hay dispositivo
+        """
+        try:
+            pygame.mixer.pre_init(AUDIO_FREQUENCY, -16, 2, AUDIO_BUFFER)
+            pygame.mixer.init()
+        except (pygame.error, NotImplementedError) as e:
+            logging.warning(f"Sin audio (no hay dispositivo disponible): {e}")
+            return False
+        frequency, size, channels = pygame.mixer.get_init()
+        logging.info(f"Audio: {frequency} Hz, {channels} canales, búfer de {AUDIO_BUFFER} muestras")
+        pygame.mixer.music.set_volume(MUSIC_VOLUME)
+        return True
+
+    def _load_sounds(self):
+        """Decodifica (o sintetiza) todos los efectos de sonido."""
+        frequency, size, channels = pygame.mixer.get_init()
+        for name, (notes, note_ms, volume) in SOUND_EFFECTS.items():
+            try:
+                for extension in (".wav", ".ogg"):
+                    path = os.path.join(SOUNDS_DIR, name + extension)
+                    if os.path.isfile(path):
+                        sound = pygame.mixer.Sound(path)
+                        break
+                else:
+                    sound = pygame.mixer.Sound(
+                        buffer=_synthesize(notes, note_ms, volume, frequency, channels)
+                    )
+                sound.set_volume(SFX_VOLUME)
+                self.sounds[name] = sound
+            except pygame.error as e:
+                logging.warning(f"No se pudo preparar el efecto '{name}': {e}")
+
+    def play(self, name):
+        """
+        Reproduce un efecto de sonido (no bloquea; si aún no está listo o
+        no hay audio, no hace nada).
+
+        Args:
+            name (str): Nombre del efecto (ver SOUND_EFFECTS)
+        """
+        sound = self.sounds.get(name)
+        if sound is not None:
+            self._commands.put(sound.play)
+
+    def on_state(self, state_name):
+        """
+        Ajusta la música al estado del juego; llamar cuando cambia.
+
+        Args:
+            state_name (str): Nombre del nuevo estado
+        """
+        if not self.enabled:
+            return
+        if state_name == "PAUSED":
+            self._commands.put(self._pause_music)
+        elif state_name == "GAME_OVER":
+            self._commands.put(self._stop_music)
+            self.play("game_over")
+        else:
+            music = STATE_MUSIC.get(state_name, "title_music")
+            self._commands.put(lambda: self._play_music(music))
+
+    def _play_music(self, name):
+        """
+        Pone una pista en bucle, o la reanuda si es la que estaba en pausa
+        (hilo de audio).
+
+        Args:
+            name (str): Nombre de la pista en el AssetLoader
+        """
+        self._wait_for_effects()
+        if name == self._music:
+            if self._paused:
+                pygame.mixer.music.unpause()
+                self._paused = False
+            return
+
+        path: str | None = self.assets.wait_for(name)
+        if path is None:
+            return
+        # Por ruta y no desde un BytesIO: SDL lee la música en su hilo de
+        # mezcla con el audio bloqueado, y leer de un objeto de Python le
+        # obligaría a pedir el GIL (ver la nota de la clase)
+        pygame.mixer.music.load(path)
+        pygame.mixer.music.play(loops=-1)
+        self._music = name
+        self._paused = False
+
+    def _pause_music(self):
+        """Pausa la música actual (hilo de audio)."""
+        if self._music is not None and not self._paused:
+            self._wait_for_effects()
+            pygame.mixer.music.pause()
+            self._paused = True
+
+    def _stop_music(self):
+        """Detiene la música (hilo de audio)."""
+        self._wait_for_effects()
+        pygame.mixer.music.stop()
+        self._music = None
+        self._paused = False
+
+    def _wait_for_effects(self):
+        """
+        Espera a que terminen los efectos que están sonando y el hilo de
+        mezcla suelte sus Sound (hilo de audio; los efectos son cortos).
+        Consultar un canal no bloquea el audio.
+        """
+        if not self._channels:
+            self._channels = [pygame.mixer.Channel(i) for i in range(pygame.mixer.get_num_channels())]
+        while any(channel.get_sound() is not None for channel in self._channels):
+            time.sleep(EFFECTS_POLL)
@@ -1,7 +1,10 @@
 # board.py
 # Módulo para manejar el tablero y la lógica de juego del Tetris
 
-from constants import GRID_WIDTH, GRID_HEIGHT, SCORE_SINGLE, SCORE_DOUBLE, SCORE_TRIPLE, SCORE_TETRIS
+from constants import (
+    GRID_WIDTH, GRID_HEIGHT, SCORE_SINGLE, SCORE_DOUBLE, SCORE_TRIPLE, SCORE_TETRIS,
+    GARBAGE_INDEX
+)
 
 class Board:
     """
@@ -12,16 +15,28 @@ class Board:
     def __init__(self):
         """
         Inicializa un tablero de juego vacío.
-        El tablero es una matriz donde cada celda contiene el color de la pieza
-        si está ocupada, o None si está vacía.
+        El tablero es un bytearray de GRID_WIDTH x GRID_HEIGHT celdas (fila a fila)
+        donde cada celda contiene el índice de paleta de la pieza si está ocupada
+        (1-7, ver SHAPE_INDICES; GARBAGE_INDEX para la basura del modo versus),
+        o 0 si está vacía.
+        
+        El buffer nunca cambia de tamaño: la interfaz lo comparte sin copiarlo
+        con una superficie de 8 bits, así que todas las modificaciones se hacen
+        en el sitio.
         """
-        # Crear un tablero vacío como una matriz 2D (GRID_HEIGHT x GRID_WIDTH)
-        self.grid: list[list[None]] = [[None for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
+        # Crear un tablero vacío (GRID_HEIGHT filas de GRID_WIDTH celdas)
+        self.grid: bytearray = bytearray(GRID_WIDTH * GRID_HEIGHT)
         
         # Inicializar la puntuación y líneas eliminadas
         self.score = 0
         self.lines_cleared = 0
         self.level = 1
+        
+        # Versión del contenido del tablero (aumenta con cada modificación)
+        self.version = 0
+        
+        # Líneas eliminadas en la última fijación (índice -> celdas antes de eliminarla)
+        self.last_cleared_rows: dict[int, bytes] = {}
     
     def is_valid_position(self, piece):
         """
@@ -44,7 +59,7 @@ class Board:
                 continue
             
             # Verificar colisión con otras piezas en el tablero
-            if self.grid[y][x] is not None:
+            if self.grid[y * GRID_WIDTH + x]:
                 return False
                 
         return True
@@ -67,7 +82,8 @@ class Board:
                 return False
             
             # Añadir la pieza al tablero
-            self.grid[y][x] = piece.color
+            self.grid[y * GRID_WIDTH + x] = piece.color_index
+            self.version += 1
             
         # Buscar y eliminar líneas completas
         lines_removed: int = self.clear_lines()
@@ -88,15 +104,23 @@ class Board:
         
         # Buscar líneas completas
         for y in range(GRID_HEIGHT):
-            if all(cell is not None for cell in self.grid[y]):
+            if 0 not in self.grid[y * GRID_WIDTH:(y + 1) * GRID_WIDTH]:
                 lines_to_clear.append(y)
         
-        # Eliminar líneas completas (de abajo hacia arriba)
-        for y in sorted(lines_to_clear, reverse=True):
-            # Eliminar la línea completa
-            del self.grid[y]
-            # Añadir una nueva línea vacía en la parte superior
-            self.grid.insert(0, [None for _ in range(GRID_WIDTH)])
+        # Guardar el contenido de las líneas para los efectos visuales
+        self.last_cleared_rows = {
+            y: bytes(self.grid[y * GRID_WIDTH:(y + 1) * GRID_WIDTH]) for y in lines_to_clear
+        }
+        
+        # Eliminar líneas completas (de arriba hacia abajo, sin cambiar el tamaño)
+        for y in lines_to_clear:
+            # Desplazar una fila hacia abajo todo lo que hay encima de la línea
+            self.grid[GRID_WIDTH:(y + 1) * GRID_WIDTH] = self.grid[0:y * GRID_WIDTH]
+            # Dejar una nueva línea vacía en la parte superior
+            self.grid[0:GRID_WIDTH] = bytes(GRID_WIDTH)
+        
+        if lines_to_clear:
+            self.version += 1
         
         # Actualizar contador de líneas eliminadas
         self.lines_cleared += len(lines_to_clear)
@@ -132,6 +156,37 @@ class Board:
         # Multiplicar puntos por nivel actual
         self.score += points * self.level
     
+    def add_garbage(self, count, hole):
+        """
+        Añade líneas de basura por debajo (modo versus): todo el contenido
+        sube count filas y las filas nuevas quedan llenas salvo un hueco.
+        
+        Args:
+            count (int): Número de líneas de basura
+            hole (int): Columna del hueco de las líneas de basura
+            
+        Returns:
+            bool: False si algún bloque ha salido por arriba del tablero
+        """
+        count = min(count, GRID_HEIGHT)
+        if count <= 0:
+            return True
+        
+        # Bloques que se saldrían del tablero al subir
+        overflow = any(self.grid[0:count * GRID_WIDTH])
+        
+        # Subir el contenido (en el sitio, sin cambiar el tamaño del buffer)
+        self.grid[0:(GRID_HEIGHT - count) * GRID_WIDTH] = self.grid[count * GRID_WIDTH:]
+        
+        # Rellenar las filas inferiores con la basura
+        row = bytearray([GARBAGE_INDEX]) * GRID_WIDTH
+        row[hole] = 0
+        for y in range(GRID_HEIGHT - count, GRID_HEIGHT):
+            self.grid[y * GRID_WIDTH:(y + 1) * GRID_WIDTH] = row
+        
+        self.version += 1
+        return not overflow
+    
     def is_game_over(self):
         """
         Verifica si el juego ha terminado (hay piezas en la parte superior del tablero).
@@ -140,21 +195,22 @@ class Board:
             bool: True si el juego ha terminado, False en caso contrario
         """
         # Si hay piezas en la primera fila, el juego ha terminado
-        return any(cell is not None for cell in self.grid[0])
+        return any(self.grid[0:GRID_WIDTH])
     
     def get_board_state(self):
         """
         Obtiene el estado actual del tablero.
         
         Returns:
-            list: Una copia de la matriz del tablero
+            bytes: Una copia inmutable del tablero (índices de paleta, fila a fila)
         """
-        # Devolver una copia profunda del tablero
-        return [row[:] for row in self.grid]
+        # Copia compacta del buffer (200 bytes)
+        return bytes(self.grid)
     
     def preview_piece_position(self, piece):
         """
-        Calcula la posición más baja posible para una pieza (para hard drop).
+        Calcula la posición más baja posible para una pieza (para hard drop
+        y para la pieza fantasma). No modifica la pieza.
         
         Args:
             piece (Piece): La pieza a calcular su posición más baja
@@ -162,21 +218,33 @@ class Board:
         Returns:
             int: La coordenada Y más baja posible para la pieza
         """
-        # Hacer una copia de la pieza para no modificar la original
-        test_piece = piece
-        original_y = test_piece.y
-        
-        # Mover la pieza hacia abajo hasta que colisione
-        while self.is_valid_position(test_piece):
-            test_piece.y += 1
+        coords = piece.get_coordinates()
         
-        # Retroceder un paso (la última posición válida)
-        final_y = test_piece.y - 1
+        # Bajar las coordenadas hasta que colisionen
+        distance = 0
+        while self._coordinates_fit(coords, distance + 1):
+            distance += 1
         
-        # Restaurar la posición original
-        test_piece.y = original_y
+        return piece.y + distance
+    
+    def _coordinates_fit(self, coords, dy):
+        """
+        Verifica si unas coordenadas desplazadas verticalmente son válidas.
         
-        return final_y
+        Args:
+            coords (list): Lista de tuplas (x, y)
+            dy (int): Desplazamiento vertical
+            
+        Returns:
+            bool: True si todas las celdas caben en el tablero sin colisión
+        """
+        for x, y in coords:
+            y += dy
+            if y >= GRID_HEIGHT:
+                return False
+            if y >= 0 and self.grid[y * GRID_WIDTH + x]:
+                return False
+        return True
     
     def hard_drop(self, piece):
         """
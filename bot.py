@@ -0,0 +1,123 @@
+# bot.py
+# Módulo con un jugador automático sencillo para demos, torneos y pruebas
+
+from constants import GRID_WIDTH, GRID_HEIGHT, SHAPES
+
+# Pesos de la heurística (altura total, líneas, huecos, irregularidad)
+HEIGHT_WEIGHT = -0.51
+LINES_WEIGHT = 0.76
+HOLES_WEIGHT = -0.36
+BUMPINESS_WEIGHT = -0.18
+
+def _shape_cells(shape_name, rotation_index):
+    """
+    Obtiene las celdas ocupadas de una forma en una rotación.
+
+    Args:
+        shape_name (str): Nombre de la forma
+        rotation_index (int): Índice de rotación (0-3)
+
+    Returns:
+        tuple: Tuplas (columna, fila) relativas a la esquina de la forma
+    """
+    shape = SHAPES[shape_name][rotation_index]
+    return tuple(
+        (j, i) for i in range(len(shape)) for j in range(len(shape[0])) if shape[i][j]
+    )
+
+# Celdas precalculadas de cada forma y rotación (sin rotaciones repetidas)
+SHAPE_CELLS: dict[str, list[tuple[int, tuple]]] = {}
+for _name in SHAPES:
+    _seen = set()
+    SHAPE_CELLS[_name] = []
+    for _rotation in range(4):
+        _cells = _shape_cells(_name, _rotation)
+        if _cells not in _seen:
+            _seen.add(_cells)
+            SHAPE_CELLS[_name].append((_rotation, _cells))
+
+def _fits(grid, cells, x, y):
+    """
+    Verifica si unas celdas caben en el tablero en una posición.
+
+    Args:
+        grid (bytearray): Celdas del tablero (índices de paleta, fila a fila)
+        cells (tuple): Celdas relativas de la pieza
+        x (int): Columna de la pieza
+        y (int): Fila de la pieza
+
+    Returns:
+        bool: True si la posición es válida
+    """
+    for j, i in cells:
+        cx, cy = x + j, y + i
+        if cx < 0 or cx >= GRID_WIDTH or cy >= GRID_HEIGHT:
+            return False
+        if cy >= 0 and grid[cy * GRID_WIDTH + cx]:
+            return False
+    return True
+
+def evaluate(grid):
+    """
+    Evalúa un tablero: cuanto más alto, mejor posición.
+
+    Args:
+        grid (bytearray): Celdas del tablero (sin líneas completas)
+
+    Returns:
+        float: Puntuación heurística (sin contar las líneas eliminadas)
+    """
+    heights = [0] * GRID_WIDTH
+    holes = 0
+    for x in range(GRID_WIDTH):
+        block_found = False
+        for y in range(GRID_HEIGHT):
+            if grid[y * GRID_WIDTH + x]:
+                if not block_found:
+                    heights[x] = GRID_HEIGHT - y
+                    block_found = True
+            elif block_found:
+                holes += 1
+    bumpiness = sum(abs(heights[x] - heights[x + 1]) for x in range(GRID_WIDTH - 1))
+    return HEIGHT_WEIGHT * sum(heights) + HOLES_WEIGHT * holes + BUMPINESS_WEIGHT * bumpiness
+
+def best_move(board, piece):
+    """
+    Busca la mejor rotación y columna para la pieza actual.
+
+    Args:
+        board (Board): Tablero de juego
+        piece (Piece): Pieza a colocar
+
+    Returns:
+        tuple: (rotación en grados, columna X), o None si no hay jugada posible
+    """
+    best = None
+    best_score = float("-inf")
+    for rotation_index, cells in SHAPE_CELLS[piece.shape_name]:
+        for x in range(-3, GRID_WIDTH):
+            if not _fits(board.grid, cells, x, piece.y):
+                continue
+
+            # Dejar caer la pieza
+            y = piece.y
+            while _fits(board.grid, cells, x, y + 1):
+                y += 1
+            if any(y + i < 0 for _, i in cells):
+                continue
+
+            # Simular la colocación y eliminar las líneas completas
+            grid = bytearray(board.grid)
+            for j, i in cells:
+                grid[(y + i) * GRID_WIDTH + x + j] = piece.color_index
+            rows = [grid[r * GRID_WIDTH:(r + 1) * GRID_WIDTH] for r in range(GRID_HEIGHT)]
+            remaining = [row for row in rows if 0 in row]
+            lines = GRID_HEIGHT - len(remaining)
+            if lines:
+                grid = bytearray(GRID_WIDTH * lines) + b"".join(remaining)
+
+            score = evaluate(grid) + LINES_WEIGHT * lines
+            if score > best_score:
+                best_score = score
+                best = (rotation_index * 90, x)
+    return best
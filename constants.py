@@ -22,6 +22,13 @@ CELL_SIZE: Literal[25] = 25
 # FPS objetivo
 FPS: Literal[60] = 60
 
+# Dimensiones de la ventana de la arena (muchas partidas a la vez)
+ARENA_WIDTH = 1280
+ARENA_HEIGHT = 720
+
+# Puerto por defecto del servidor de la clasificación global
+LEADERBOARD_PORT = 7777
+
 # -----------------------------
 # Colores (RGB)
 # -----------------------------
@@ -44,6 +51,15 @@ TEXT_COLOR: tuple[Literal[240], Literal[240], Literal[255]] = (240, 240, 255)  #
 UI_BG_COLOR: tuple[Literal[25], Literal[25], Literal[40]] = (25, 25, 40)     # Azul oscuro (fondos de la interfaz)
 BORDER_COLOR: tuple[Literal[100], Literal[100], Literal[120]] = (100, 100, 120)  # Gris azulado medio (bordes)
 
+# Color de las líneas de basura del modo versus
+GARBAGE_COLOR: tuple[int, int, int] = (110, 110, 110)  # Gris
+
+# Paleta del tablero: índice 0 = celda vacía, 1-7 = piezas en el orden de COLORS,
+# y a continuación las líneas de basura
+SHAPE_INDICES: dict[str, int] = {name: index + 1 for index, name in enumerate(COLORS)}
+GARBAGE_INDEX: int = len(COLORS) + 1
+PALETTE: list[tuple[int, int, int]] = [BG_COLOR] + list(COLORS.values()) + [GARBAGE_COLOR]
+
 # -----------------------------
 # Configuración del juego
 # -----------------------------
@@ -62,6 +78,9 @@ SCORE_TETRIS = 1200          # Puntos por 4 líneas
 # Retraso para eliminación de líneas (ms)
 LINE_CLEAR_DELAY = 200
 
+# Modo versus: líneas de basura enviadas al rival según las líneas eliminadas
+GARBAGE_LINES: dict[int, int] = {1: 0, 2: 1, 3: 2, 4: 4}
+
 # -----------------------------
 # Formas de las piezas
 # -----------------------------
@@ -280,6 +299,24 @@ KEY_DOWN: int = pygame.K_DOWN
 KEY_ROTATE: int = pygame.K_UP
 KEY_HARD_DROP: int = pygame.K_SPACE
 
+# Teclas de cada jugador en el modo versus (jugador 1 a la izquierda)
+VERSUS_CONTROLS: list[dict[str, int]] = [
+    {
+        "left": pygame.K_a,
+        "right": pygame.K_d,
+        "down": pygame.K_s,
+        "rotate": pygame.K_w,
+        "hard_drop": pygame.K_LSHIFT,
+    },
+    {
+        "left": pygame.K_LEFT,
+        "right": pygame.K_RIGHT,
+        "down": pygame.K_DOWN,
+        "rotate": pygame.K_UP,
+        "hard_drop": pygame.K_RSHIFT,
+    },
+]
+
 # Teclas de menú
 KEY_PAUSE: int = pygame.K_p
 KEY_ESCAPE: int = pygame.K_ESCAPE
@@ -0,0 +1,111 @@
+# headless.py
+# Módulo para capturar frames y medir el coste de renderizado sin pantalla
+
+import os
+import sys
+import json
+import logging
+import pygame
+
+from metrics import percentile
+
+class FrameRecorder:
+    """
+    Registra el coste de renderizado de cada frame y, opcionalmente,
+    guarda frames seleccionados como PNG o todos los frames como un
+    flujo RAW (RGB24 sin cabecera) para comparaciones con imágenes de
+    referencia.
+    """
+
+    def __init__(self, capture_frames=(), output_dir="frames", raw_stream=None, report_file=None):
+        """
+        Inicializa el grabador.
+
+        Args:
+            capture_frames (iterable): Números de frame (desde 1) a guardar como PNG
+            output_dir (str): Carpeta donde se guardan los PNG
+            raw_stream (str, opcional): Fichero para el flujo RAW ("-" = salida estándar)
+            report_file (str, opcional): Fichero JSON donde guardar el informe
+        """
+        self.capture_frames: set[int] = set(capture_frames)
+        self.output_dir: str = output_dir
+        self.report_file: str | None = report_file
+        self.render_times: list[float] = []
+
+        self._raw = None
+        self._close_raw = False
+        if raw_stream == "-":
+            self._raw = sys.stdout.buffer
+        elif raw_stream:
+            self._raw = open(raw_stream, "wb")
+            self._close_raw = True
+
+        if self.capture_frames:
+            os.makedirs(self.output_dir, exist_ok=True)
+
+    def record(self, frame_number, backend, render_ms):
+        """
+        Registra un frame ya renderizado.
+
+        Args:
+            frame_number (int): Número del frame (desde 1)
+            backend: Backend de renderizado de la interfaz
+            render_ms (float): Tiempo de renderizado del frame en milisegundos
+        """
+        self.render_times.append(render_ms)
+
+        capture_png = frame_number in self.capture_frames
+        if not capture_png and self._raw is None:
+            return
+
+        surface = backend.frame_surface()
+        if capture_png:
+            path = os.path.join(self.output_dir, f"frame_{frame_number:05d}.png")
+            pygame.image.save(surface, path)
+        if self._raw is not None:
+            self._raw.write(pygame.image.tobytes(surface, "RGB"))
+
+    def summary(self):
+        """
+        Calcula las estadísticas del coste de renderizado.
+
+        Returns:
+            dict: Número de frames y tiempos (ms) medio, p50, p95, p99 y máximo
+        """
+        times = sorted(self.render_times)
+        count = len(times)
+        return {
+            "frames": count,
+            "mean_ms": sum(times) / count if count else 0.0,
+            "p50_ms": percentile(times, 0.50),
+            "p95_ms": percentile(times, 0.95),
+            "p99_ms": percentile(times, 0.99),
+            "max_ms": times[-1] if times else 0.0,
+        }
+
+    def close(self):
+        """
+        Cierra el flujo RAW y registra (y guarda, si se pidió) el informe.
+
+        Returns:
+            dict: Estadísticas del coste de renderizado
+        """
+        if self._raw is not None:
+            self._raw.flush()
+            if self._close_raw:
+                self._raw.close()
+            self._raw = None
+
+        stats = self.summary()
+        logging.info(
+            f"Renderizado: {stats['frames']} frames, media {stats['mean_ms']:.3f} ms, "
+            f"p50 {stats['p50_ms']:.3f} ms, p95 {stats['p95_ms']:.3f} ms, "
+            f"p99 {stats['p99_ms']:.3f} ms, máx {stats['max_ms']:.3f} ms"
+        )
+        if self.report_file:
+            try:
+                with open(self.report_file, "w") as file:
+                    json.dump({"summary": stats, "render_ms": self.render_times}, file)
+            except (IOError, OSError) as e:
+                logging.error(f"Error al guardar el informe de renderizado: {e}")
+        return stats
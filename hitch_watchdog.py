@@ -0,0 +1,206 @@
+# hitch_watchdog.py
+# Módulo con un vigilante de tirones: muestrea la pila del hilo principal
+# cuando un frame supera su presupuesto de tiempo
+
+import os
+import sys
+import time
+import logging
+import threading
+import logging.handlers
+from collections import Counter
+
+# Función del juego -> fase del frame (se busca de la más interna a la más externa)
+PHASE_FUNCTIONS: dict[str, str] = {
+    "_handle_events": "events",
+    "_update": "update",
+    "draw_board": "render.board",
+    "draw_piece": "render.piece",
+    "draw_animations": "render.effects",
+    "draw_next_pieces": "render.preview",
+    "draw_score_panel": "render.panel",
+    "draw_timing_overlay": "render.overlay",
+    "present": "flip",
+    "_render": "render",
+}
+
+# Máximo de muestras por tirón (los tirones muy largos no crecen sin límite)
+MAX_SAMPLES = 500
+
+def collapse_stack(frame):
+    """
+    Convierte una pila en una línea "fichero:función;..." (de la raíz a la
+    función actual), el formato de las herramientas de flamegraphs.
+
+    Args:
+        frame (types.FrameType): Frame más interno de la pila
+
+    Returns:
+        tuple: (pila colapsada, fase del frame o None)
+    """
+    names = []
+    phase = None
+    while frame is not None:
+        code = frame.f_code
+        if phase is None:
+            phase = PHASE_FUNCTIONS.get(code.co_name)
+        names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+        frame = frame.f_back
+    names.reverse()
+    return ";".join(names), phase
+
+class HitchWatchdog:
+    """
+    Hilo vigilante de tirones. El bucle principal solo marca el inicio y el
+    final de cada frame (dos asignaciones y un Event.set), y el vigilante
+    duerme hasta que el frame en curso agota su presupuesto. Solo entonces
+    toma muestras de la pila del hilo principal con sys._current_frames()
+    hasta que el frame termina, y escribe un informe con el estado del
+    juego, la fase y las pilas colapsadas en un log rotativo.
+    """
+
+    def __init__(self, state_getter, budget_ms=1000 / 60, sample_interval_ms=1.0,
+                 log_file="hitches.log", max_bytes=1_000_000, backup_count=3):
+        """
+        Inicializa el vigilante (sin arrancar el hilo).
+
+        Args:
+            state_getter (callable): Devuelve el nombre del estado actual del juego
+            budget_ms (float): Presupuesto de tiempo por frame
+            sample_interval_ms (float): Intervalo entre muestras durante un tirón
+            log_file (str): Fichero del log de tirones
+            max_bytes (int): Tamaño máximo del log antes de rotarlo
+            backup_count (int): Número de logs rotados que se conservan
+        """
+        self.state_getter = state_getter
+        self.budget: float = budget_ms / 1000
+        self.sample_interval: float = sample_interval_ms / 1000
+        self.hitches = 0
+
+        # Log propio, separado del log general del juego
+        self.logger = logging.getLogger("tetris.hitches")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+        self._handler = None
+        try:
+            self._handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+            )
+            self._handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+            self.logger.addHandler(self._handler)
+        except (IOError, OSError) as e:
+            logging.error(f"No se pudo abrir el log de tirones: {e}")
+
+        # Frame en curso y último terminado, como (id, duración) (escritos
+        # solo por el hilo principal; cada asignación es atómica)
+        self._frame_id = 0
+        self._frame_start: float | None = None
+        self._ended: tuple[int, float] = (0, 0.0)
+
+        # Frame lento que se está muestreando y su final, que el hilo
+        # principal guarda aparte para que no lo tapen los frames siguientes
+        self._watched_id = 0
+        self._watched_end: tuple[int, float] = (0, 0.0)
+
+        self._main_ident: int | None = None
+        self._new_frame = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        """Arranca el vigilante. Debe llamarse desde el hilo a vigilar."""
+        self._main_ident = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="hitch-watchdog", daemon=True)
+        self._thread.start()
+        logging.info(f"Vigilante de tirones activo (presupuesto {self.budget * 1000:.1f} ms)")
+
+    def stop(self):
+        """Detiene el vigilante y cierra su log."""
+        self._stop.set()
+        self._new_frame.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._handler is not None:
+            self.logger.removeHandler(self._handler)
+            self._handler.close()
+            self._handler = None
+        if self.hitches:
+            logging.info(f"Tirones registrados: {self.hitches}")
+
+    def frame_start(self):
+        """Marca el inicio de un frame (hilo principal)."""
+        self._frame_start = time.perf_counter()
+        self._frame_id += 1
+        self._new_frame.set()
+
+    def frame_end(self):
+        """Marca el final del frame en curso (hilo principal)."""
+        ended = (self._frame_id, time.perf_counter() - self._frame_start)
+        self._ended = ended
+        if ended[0] == self._watched_id:
+            self._watched_end = ended
+
+    def _run(self):
+        """
+        Bucle del vigilante: espera a que empiece un frame, duerme hasta su
+        límite y, si el frame sigue en curso, muestrea hasta que termine.
+        """
+        while not self._stop.is_set():
+            self._new_frame.wait()
+            self._new_frame.clear()
+            if self._stop.is_set():
+                break
+
+            frame_id = self._frame_id
+            remaining = self._frame_start + self.budget - time.perf_counter()
+            if remaining > 0 and self._stop.wait(remaining):
+                break
+            # Marcar el frame como vigilado antes de comprobar si terminó:
+            # si termina después, su final queda en _watched_end
+            self._watched_id = frame_id
+            if self._ended[0] >= frame_id or self._frame_id != frame_id:
+                continue  # El frame terminó a tiempo
+
+            self._sample_hitch(frame_id)
+
+    def _sample_hitch(self, frame_id):
+        """
+        Muestrea la pila del hilo principal mientras dure el frame lento y
+        escribe el informe.
+
+        Args:
+            frame_id (int): Frame que ha superado el presupuesto
+        """
+        state = self.state_getter()
+        stacks: Counter = Counter()
+        phases: Counter = Counter()
+        while self._watched_end[0] != frame_id and self._frame_id == frame_id:
+            frame = sys._current_frames().get(self._main_ident)
+            if frame is None:
+                break
+            stack, phase = collapse_stack(frame)
+            del frame
+            stacks[stack] += 1
+            phases[phase or "?"] += 1
+            if sum(stacks.values()) >= MAX_SAMPLES or self._stop.wait(self.sample_interval):
+                break
+
+        # Esperar (brevemente) a que el frame termine para conocer su duración
+        deadline = time.perf_counter() + 1.0
+        while self._watched_end[0] != frame_id and self._frame_id == frame_id and time.perf_counter() < deadline:
+            if self._stop.wait(self.sample_interval):
+                break
+        ended_id, duration = self._watched_end
+        duration_ms = duration * 1000 if ended_id == frame_id else -1.0
+
+        self.hitches += 1
+        phase = phases.most_common(1)[0][0] if phases else "?"
+        lines = [
+            f"HITCH frame={frame_id} duration_ms={duration_ms:.1f} budget_ms={self.budget * 1000:.1f} "
+            f"state={state} phase={phase} samples={sum(stacks.values())}"
+        ]
+        for stack, count in stacks.most_common():
+            lines.append(f"  {count} {stack}")
+        self.logger.info("\n".join(lines))
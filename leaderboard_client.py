@@ -0,0 +1,234 @@
+# leaderboard_client.py
+# Módulo del cliente de la clasificación global (ver leaderboard_server.py)
+
+import json
+import random
+import socket
+import logging
+import threading
+
+from constants import LEADERBOARD_PORT
+
+# Envíos agrupados: tras el primer récord pendiente se espera un poco por
+# si llegan más, y se mandan juntos (como mucho BATCH_SIZE por mensaje)
+BATCH_DELAY = 0.2
+BATCH_SIZE = 50
+
+# Reintentos: espera exponencial (con variación aleatoria, para que las
+# máquinas no reconecten todas a la vez) entre estos límites, en segundos
+BACKOFF_MIN = 0.5
+BACKOFF_MAX = 30.0
+
+# Cada cuánto se actualiza la clasificación cacheada (s) y espera máxima
+# de una respuesta del servidor (s)
+REFRESH_INTERVAL = 30.0
+TIMEOUT = 5.0
+
+# Generador propio para la variación de los reintentos (no altera la
+# secuencia de random del juego, que puede ir con semilla)
+_jitter = random.Random()
+
+def parse_address(address):
+    """
+    Interpreta una dirección "host:puerto" (o solo "host").
+
+    Args:
+        address (str): Dirección del servidor
+
+    Returns:
+        tuple: (host, puerto)
+
+    Raises:
+        ValueError: Si el puerto no es un número
+    """
+    host, _, port = address.rpartition(":")
+    if not host:
+        return port, LEADERBOARD_PORT
+    return host, int(port)
+
+class LeaderboardClient:
+    """
+    Cliente de la clasificación global para el juego. Todo el tráfico va
+    por un hilo propio con una conexión persistente: el hilo del juego
+    solo deja los récords en una lista (submit) y lee la última
+    clasificación recibida (top), así que nunca espera a la red.
+
+    Los récords pendientes se mandan agrupados y no se descartan si el
+    servidor no responde: se reintenta con espera exponencial hasta que
+    se confirman (el servidor ignora los repetidos).
+    """
+
+    def __init__(self, host, port=LEADERBOARD_PORT, limit=10, refresh_interval=REFRESH_INTERVAL):
+        """
+        Inicializa el cliente (sin conectar).
+
+        Args:
+            host (str): Servidor
+            port (int): Puerto del servidor
+            limit (int): Récords de la clasificación cacheada
+            refresh_interval (float): Segundos entre actualizaciones de la clasificación
+        """
+        self.host: str = host
+        self.port: int = port
+        self.limit: int = limit
+        self.refresh_interval: float = refresh_interval
+
+        # Última clasificación recibida (None hasta la primera) y su versión
+        self.top: tuple | None = None
+        self.version = 0
+        self.connected = False
+
+        self._condition = threading.Condition()
+        self._pending: list[dict] = []
+        self._sending = 0
+        self._refresh = True
+        self._stopping = False
+        self._socket: socket.socket | None = None
+        self._file = None
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        """Arranca el hilo del cliente."""
+        self._thread = threading.Thread(target=self._run, name="leaderboard", daemon=True)
+        self._thread.start()
+
+    def submit(self, entry):
+        """
+        Programa el envío de un récord (no bloquea).
+
+        Args:
+            entry (dict): Récord con los campos de score.HIGHSCORE_FIELDS
+        """
+        with self._condition:
+            self._pending.append(dict(entry))
+            self._condition.notify_all()
+
+    def refresh(self):
+        """Pide una actualización de la clasificación cacheada (no bloquea)."""
+        with self._condition:
+            self._refresh = True
+            self._condition.notify_all()
+
+    def flush(self, timeout=None):
+        """
+        Espera a que el servidor confirme todos los récords programados.
+
+        Args:
+            timeout (float, opcional): Espera máxima en segundos
+
+        Returns:
+            bool: True si no queda nada pendiente
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._sending, timeout)
+
+    def close(self, timeout=1.0):
+        """
+        Intenta mandar lo pendiente y detiene el hilo.
+
+        Args:
+            timeout (float): Espera máxima para los envíos pendientes
+        """
+        if self._thread is None:
+            return
+        if not self.flush(timeout):
+            logging.warning("Clasificación global: quedan récords sin enviar")
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        self._thread.join(TIMEOUT)
+        self._thread = None
+
+    def _run(self):
+        """Bucle del hilo: envía los récords pendientes y actualiza la clasificación."""
+        failures = 0
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._pending or self._refresh or self._stopping, self.refresh_interval
+                )
+                if self._stopping:
+                    break
+                if self._pending:
+                    # Dar tiempo a que se junten más récords en el mismo envío
+                    self._condition.wait_for(lambda: self._stopping, BATCH_DELAY)
+                batch = self._pending[:BATCH_SIZE]
+                del self._pending[:BATCH_SIZE]
+                self._sending = len(batch)
+                self._refresh = False
+
+            try:
+                if batch:
+                    self._request({"op": "submit", "scores": batch})
+                self._update_top()
+                failures = 0
+            except (OSError, ValueError) as e:
+                self._disconnect()
+                with self._condition:
+                    # Devolver el lote a la cola, delante de lo que haya llegado
+                    self._pending[:0] = batch
+                    self._refresh = True
+                failures += 1
+                backoff = min(BACKOFF_MAX, BACKOFF_MIN * 2 ** (failures - 1)) * _jitter.uniform(0.5, 1.0)
+                logging.warning(f"Clasificación global no disponible ({e}); reintento en {backoff:.1f} s")
+                with self._condition:
+                    self._sending = 0
+                    self._condition.notify_all()
+                    if self._condition.wait_for(lambda: self._stopping, backoff):
+                        break
+                continue
+
+            with self._condition:
+                self._sending = 0
+                self._condition.notify_all()
+
+        self._disconnect()
+
+    def _update_top(self):
+        """Pide la clasificación y la cachea si ha cambiado (hilo del cliente)."""
+        response = self._request({"op": "top", "limit": self.limit})
+        if self.top is None or response["version"] != self.version:
+            self.top = tuple(response["scores"])
+            self.version = response["version"]
+
+    def _request(self, message):
+        """
+        Manda un mensaje y espera su respuesta, conectando si hace falta.
+
+        Args:
+            message (dict): Mensaje del protocolo
+
+        Returns:
+            dict: Respuesta del servidor
+
+        Raises:
+            OSError: Si falla la conexión
+            ValueError: Si la respuesta no es válida o es un error
+        """
+        if self._socket is None:
+            self._socket = socket.create_connection((self.host, self.port), TIMEOUT)
+            self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._file = self._socket.makefile("rb")
+            self.connected = True
+            logging.info(f"Conectado a la clasificación global en {self.host}:{self.port}")
+
+        self._socket.sendall(json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n")
+        line = self._file.readline()
+        if not line:
+            raise ConnectionResetError("el servidor cerró la conexión")
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise ValueError(response.get("error", "respuesta no válida"))
+        return response
+
+    def _disconnect(self):
+        """Cierra la conexión (se reabre en el siguiente envío)."""
+        if self._socket is not None:
+            try:
+                self._file.close()
+                self._socket.close()
+            except OSError:
+                pass
+        self._socket = None
+        self._file = None
+        self.connected = False
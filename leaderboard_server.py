@@ -0,0 +1,301 @@
+# leaderboard_server.py
+# Servidor de la clasificación global (asyncio, un solo proceso y un solo hilo)
+#
+# Uso:
+#   python leaderboard_server.py [--host 0.0.0.0] [--port 7777] [--file leaderboard.json]
+#
+# Protocolo: TCP con un mensaje JSON por línea, en conexiones persistentes.
+#   {"op": "submit", "scores": [récord, ...]} -> {"ok": true, "accepted": n}
+#   {"op": "top", "limit": n}                  -> {"ok": true, "version": v, "scores": [...]}
+# Un error se responde con {"ok": false, "error": "..."} sin cerrar la conexión.
+
+import sys
+import json
+import bisect
+import asyncio
+import logging
+import argparse
+
+from constants import LEADERBOARD_PORT
+from persistence import JsonWriter, read_json_with_backup
+from score import validate_highscores
+
+# Dirección por defecto del servidor
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = LEADERBOARD_PORT
+
+# Récords que guarda el servidor y máximo que se puede pedir de una vez
+CAPACITY = 1000
+
+# Tamaño máximo de un mensaje (una línea) en bytes
+MAX_MESSAGE = 1 << 20
+
+# Espera antes de guardar en disco: todos los envíos de ese intervalo se
+# guardan de una vez (copiar la clasificación en cada envío costaría más
+# que atenderlo)
+SAVE_DELAY = 1.0
+
+def _rank_key(entry):
+    """
+    Clave de orden de la clasificación (de mayor a menor puntuación).
+
+    Args:
+        entry (dict): Récord
+
+    Returns:
+        int: Puntuación cambiada de signo
+    """
+    return -entry["score"]
+
+def _entry_key(entry):
+    """
+    Identidad de un récord para descartar duplicados (reenvíos del cliente).
+
+    Args:
+        entry (dict): Récord
+
+    Returns:
+        tuple: (jugador, puntuación, fecha)
+    """
+    return entry["player"], entry["score"], entry["date"]
+
+class LeaderboardServer:
+    """
+    Clasificación global compartida por todas las máquinas. Toda la
+    lógica corre en el bucle de asyncio (sin bloqueos ni hilos por
+    conexión), así que un solo núcleo atiende miles de conexiones: cada
+    envío es una inserción con bisect y cada consulta devuelve una
+    respuesta ya serializada, que se reutiliza mientras la clasificación
+    no cambie. El fichero se escribe en segundo plano con JsonWriter.
+    """
+
+    def __init__(self, path="leaderboard.json", capacity=CAPACITY):
+        """
+        Inicializa el servidor y carga la clasificación guardada.
+
+        Args:
+            path (str): Fichero de la clasificación
+            capacity (int): Récords que se conservan
+        """
+        self.path: str = path
+        self.capacity: int = capacity
+        self.rankings: list[dict] = []
+        self.version = 0
+        self.connections = 0
+
+        self._keys: set[tuple] = set()
+        self._responses: dict[int, bytes] = {}
+        self._writer = JsonWriter(path)
+        self._save_handle: asyncio.TimerHandle | None = None
+
+        rankings, source = read_json_with_backup(path, validate_highscores)
+        if source is not None:
+            self.rankings = rankings[:capacity]
+            self._keys = {_entry_key(entry) for entry in self.rankings}
+            logging.info(f"Clasificación cargada de {path}: {len(self.rankings)} récords")
+
+    def add(self, entries):
+        """
+        Añade récords a la clasificación (los no válidos, repetidos o que
+        no entran se ignoran).
+
+        Args:
+            entries (list): Récords recibidos
+
+        Returns:
+            int: Récords aceptados
+        """
+        accepted = 0
+        for entry in validate_highscores(entries):
+            key = _entry_key(entry)
+            if key in self._keys:
+                continue
+            if len(self.rankings) >= self.capacity and entry["score"] <= self.rankings[-1]["score"]:
+                continue
+            entry = {field: entry[field] for field in ("player", "score", "level", "lines", "date")}
+            bisect.insort_right(self.rankings, entry, key=_rank_key)
+            self._keys.add(key)
+            accepted += 1
+            if len(self.rankings) > self.capacity:
+                self._keys.discard(_entry_key(self.rankings.pop()))
+
+        if accepted:
+            self.version += 1
+            self._responses.clear()
+            self._schedule_save()
+        return accepted
+
+    def _schedule_save(self):
+        """
+        Programa el guardado de la clasificación (fuera del bucle de
+        asyncio, se guarda ya).
+        """
+        if self._save_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._save()
+            return
+        self._save_handle = loop.call_later(SAVE_DELAY, self._save)
+
+    def _save(self):
+        """Entrega la clasificación al escritor en segundo plano."""
+        self._save_handle = None
+        self._writer.submit(self.rankings)
+
+    def top_response(self, limit):
+        """
+        Obtiene la respuesta serializada con los mejores récords.
+
+        Args:
+            limit (int): Récords a devolver
+
+        Returns:
+            bytes: Línea JSON de respuesta
+        """
+        limit = max(0, min(limit, self.capacity))
+        response = self._responses.get(limit)
+        if response is None:
+            response = _encode({"ok": True, "version": self.version, "scores": self.rankings[:limit]})
+            self._responses[limit] = response
+        return response
+
+    def handle_message(self, line):
+        """
+        Atiende un mensaje del protocolo.
+
+        Args:
+            line (bytes): Línea recibida
+
+        Returns:
+            bytes: Línea de respuesta
+        """
+        try:
+            message = json.loads(line)
+            op = message["op"]
+            if op == "submit":
+                return _encode({"ok": True, "accepted": self.add(message["scores"])})
+            if op == "top":
+                return self.top_response(int(message.get("limit", 10)))
+            raise ValueError(f"operación desconocida: {op}")
+        except (ValueError, KeyError, TypeError) as e:
+            return _encode({"ok": False, "error": str(e)})
+
+    async def handle_connection(self, reader, writer):
+        """
+        Atiende una conexión persistente hasta que el cliente la cierra.
+
+        Args:
+            reader (asyncio.StreamReader): Entrada de la conexión
+            writer (asyncio.StreamWriter): Salida de la conexión
+        """
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Mensaje más largo que MAX_MESSAGE: no se puede seguir leyendo
+                    writer.write(_encode({"ok": False, "error": "mensaje demasiado largo"}))
+                    break
+                if not line:
+                    break
+                writer.write(self.handle_message(line))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT, ready=None):
+        """
+        Acepta conexiones hasta que se cancela.
+
+        Args:
+            host (str): Dirección en la que escuchar
+            port (int): Puerto (0 elige uno libre)
+            ready (callable, opcional): Recibe el puerto cuando ya se aceptan conexiones
+        """
+        server = await asyncio.start_server(
+            self.handle_connection, host, port, limit=MAX_MESSAGE, backlog=1024
+        )
+        port = server.sockets[0].getsockname()[1]
+        logging.info(f"Servidor de clasificación en {host}:{port}")
+        if ready is not None:
+            ready(port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.close()
+
+    def close(self):
+        """Escribe lo pendiente en disco y detiene el escritor."""
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save()
+        self._writer.close()
+
+def _encode(message):
+    """
+    Serializa un mensaje del protocolo.
+
+    Args:
+        message (dict): Mensaje
+
+    Returns:
+        bytes: Línea JSON terminada en salto de línea
+    """
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+def parse_args(argv=None):
+    """
+    Analiza las opciones del servidor.
+
+    Args:
+        argv (list, opcional): Argumentos a analizar (por defecto sys.argv)
+
+    Returns:
+        argparse.Namespace: Opciones
+    """
+    parser = argparse.ArgumentParser(description="Servidor de la clasificación global del Tetris")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"dirección (por defecto {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"puerto (por defecto {DEFAULT_PORT})")
+    parser.add_argument(
+        "--file",
+        default="leaderboard.json",
+        metavar="FICHERO",
+        help="fichero de la clasificación (por defecto leaderboard.json)"
+    )
+    parser.add_argument(
+        "--capacity",
+        type=int,
+        default=CAPACITY,
+        metavar="N",
+        help=f"récords que se conservan (por defecto {CAPACITY})"
+    )
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """
+    Punto de entrada del servidor.
+
+    Args:
+        argv (list, opcional): Argumentos (por defecto sys.argv)
+
+    Returns:
+        int: Código de salida
+    """
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s: %(message)s")
+    args = parse_args(argv)
+    server = LeaderboardServer(args.file, args.capacity)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        logging.info("Servidor detenido")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+# log_setup.py
+# Módulo para configurar el logging del juego sin escribir a disco desde el bucle principal
+
+import os
+import queue
+import atexit
+import logging
+import logging.handlers
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+CONSOLE_FORMAT = '%(levelname)s: %(message)s'
+
+def setup_logging(log_file="tetris.log", level=logging.INFO, max_bytes=1_000_000, backup_count=3):
+    """
+    Configura el logger raíz para que ninguna llamada de log haga E/S en
+    el hilo que la emite. Los registros se dejan en una cola (sin límite,
+    nunca bloquea) y un hilo en segundo plano (QueueListener) los escribe
+    en el fichero y en la consola.
+
+    El fichero rota por tamaño. Además, cada ejecución empieza con un log
+    nuevo: el de la ejecución anterior pasa a ser tetris.log.1, y así
+    sucesivamente hasta backup_count.
+
+    Args:
+        log_file (str): Fichero del log
+        level (int): Nivel del logger raíz
+        max_bytes (int): Tamaño máximo del fichero antes de rotarlo
+        backup_count (int): Número de ficheros rotados que se conservan
+
+    Returns:
+        logging.handlers.QueueListener: Hilo escritor (ya arrancado; se
+            detiene solo al salir del programa, vaciando la cola)
+    """
+    handlers = []
+
+    try:
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True
+        )
+        if os.path.isfile(log_file) and os.path.getsize(log_file) > 0:
+            file_handler.doRollover()
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        handlers.append(file_handler)
+    except (IOError, OSError):
+        # Sin fichero de log: al menos la consola
+        pass
+
+    # Agregar también logs a la consola (solo INFO o superior)
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+    handlers.append(console_handler)
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
@@ -3,32 +3,90 @@
 
 import sys
 import time
+
+# Inicio del arranque, para el informe de tiempos (ver startup.py)
+_START_TIME: float = time.perf_counter()
+
+import argparse
+
+# pygame.pkgdata importa pkg_resources (más de 100 ms) solo para localizar
+# sus propios ficheros; si no está disponible usa las rutas del paquete,
+# con el mismo resultado. Se oculta durante la importación de pygame.
+_hide_pkg_resources: bool = "pkg_resources" not in sys.modules
+if _hide_pkg_resources:
+    sys.modules["pkg_resources"] = None
 import pygame
+if _hide_pkg_resources:
+    del sys.modules["pkg_resources"]
 import logging
 import os
 from enum import Enum, auto
 import traceback
+import random
+import sqlite3
+import queue
+import threading
 
 from board import Board
 from pieces import PieceGenerator, Piece
 from score import ScoreManager
+from score_db import SqliteScoreManager
 from ui import GameUI
+from headless import FrameRecorder
+from arena import run_arena
+from versus import VersusGame
+from simulation import SimulationThread
+from timing import FrameTimer
+from hitch_watchdog import HitchWatchdog
+from profiler import StateProfiler
+from allocations import AllocationTracker, GCPolicy
+from scripted_input import InputRecorder, InputReplay, BotDriver
+from log_setup import setup_logging
+from assets import AssetLoader, load_splash
+from audio import AudioManager
+from stats import StatsLog
+from startup import report as startup_report, cache as startup_cache, init_video, init_pygame
 from constants import FPS
 
-# Configuración de logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    filename='tetris.log',
-    filemode='w'  # Sobreescribir el archivo en cada ejecución
-)
-
-# Agregar también logs a la consola
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.INFO)
-console_formatter = logging.Formatter('%(levelname)s: %(message)s')
-console_handler.setFormatter(console_formatter)
-logging.getLogger().addHandler(console_handler)
+# Configuración de logging: fichero rotativo y consola, escritos desde
+# un hilo propio para que ningún log haga E/S en el bucle del juego
+setup_logging('tetris.log')
+startup_report.begin(_START_TIME)
+startup_report.mark("importaciones")
+
+def open_score_manager(score_db=None, leaderboard=None):
+    """
+    Crea el gestor de puntuaciones: con SQLite si se indica una base de
+    datos, o con highscores.json (también si la base de datos no se puede
+    abrir), y con el cliente de la clasificación global si se indica un servidor.
+    
+    Args:
+        score_db (str, opcional): Fichero de la base de datos SQLite
+        leaderboard (str, opcional): Servidor de la clasificación global ("host:puerto")
+        
+    Returns:
+        ScoreManager: Gestor de puntuaciones
+    """
+    score_manager = None
+    if score_db:
+        try:
+            score_manager = SqliteScoreManager(score_db)
+        except sqlite3.Error as e:
+            logging.error(f"No se pudo abrir la base de datos de récords '{score_db}': {e}")
+    if score_manager is None:
+        score_manager = ScoreManager()
+    
+    if leaderboard:
+        # Solo se carga el cliente (y la red) si se usa
+        from leaderboard_client import LeaderboardClient, parse_address
+        try:
+            host, port = parse_address(leaderboard)
+        except ValueError:
+            logging.error(f"Dirección de la clasificación global no válida: {leaderboard}")
+        else:
+            score_manager.leaderboard = LeaderboardClient(host, port, score_manager.max_records)
+            score_manager.leaderboard.start()
+    return score_manager
 
 # Estados del juego
 class GameState(Enum):
@@ -38,6 +96,8 @@ class GameState(Enum):
     GAME_OVER = auto()   # Fin del juego
     RANKINGS = auto()    # Tabla de clasificación
     SETTINGS = auto()    # Configuración
+    SPLASH = auto()      # Pantalla de carga
+    STATS = auto()       # Estadísticas de las partidas
 
 class Game:
     """
@@ -45,9 +105,27 @@ class Game:
     Coordina la lógica del juego, la interfaz y los eventos.
     """
     
-    def __init__(self):
+    def __init__(self, render_backend="surface", software_renderer=False, threaded_simulation=False,
+                 hitch_budget_ms=1000 / FPS, audio=True, score_db=None, leaderboard=None,
+                 stats=True, stats_pieces=False):
         """
         Inicializa el juego Tetris.
+        
+        Args:
+            render_backend (str): Backend de renderizado ("surface" o "texture")
+            software_renderer (bool): Si es True, el backend de texturas usa
+                el renderer por software de SDL
+            threaded_simulation (bool): Si es True, la lógica de la partida
+                corre a paso fijo en un hilo propio (ver SimulationThread)
+            hitch_budget_ms (float): Presupuesto por frame del vigilante de
+                tirones (0 o None lo desactiva)
+            audio (bool): Si es False, el juego no usa el dispositivo de audio
+            score_db (str, opcional): Base de datos SQLite para los récords
+                (None: highscores.json)
+            leaderboard (str, opcional): Servidor de la clasificación global
+                ("host:puerto")
+            stats (bool): Si es False, no se registran estadísticas de las partidas
+            stats_pieces (bool): Registrar en el historial también cada pieza fijada
         """
         try:
             # Información del entorno
@@ -55,25 +133,85 @@ class Game:
             logging.info(f"Directorio actual: {os.getcwd()}")
 
             # Inicializar componentes del juego
-            self.score_manager = ScoreManager()
-            self.ui = GameUI(self.score_manager)
+            with startup_report.phase("puntuaciones"):
+                self.score_manager = open_score_manager(score_db, leaderboard)
+            self.ui = GameUI(self.score_manager, render_backend, software_renderer)
 
+            # Recursos: la portada se carga ya y el resto en segundo plano,
+            # mientras se muestra la pantalla de carga
+            with startup_report.phase("pantalla de carga"):
+                self.splash_image: pygame.Surface | None = load_splash()
+                self.assets = AssetLoader()
+                self.assets.start()
+            self._menu_assets_pending = True
+            
+            # Música y efectos (el mezclador se abre en su propio hilo)
+            self.audio = AudioManager(self.assets, enabled=audio)
+            self.audio.start()
+            self._audio_state: GameState | None = None
+            
+            # Historial de estadísticas (se abre en su propio hilo)
+            self.stats: StatsLog | None = StatsLog(log_pieces=stats_pieces) if stats else None
+            if self.stats is not None:
+                self.stats.start()
+            else:
+                self.ui.menu_options["main"].remove("Estadísticas")
+            self._play_ms = 0
+            
             # Configuración inicial
             self.clock = pygame.time.Clock()
             self.running = True
-            self.state = GameState.MENU
+            self.state = GameState.SPLASH
             
             # Variables para el manejo de entrada de texto (nombre del jugador)
             self.player_name = ""
             self.input_active = False
             
+            # Último estado renderizado (para invalidar fondos congelados)
+            self._rendered_state = None
+            
+            # Reloj del juego: real, o simulado con un paso fijo por frame
+            # (modo sin pantalla, para que los frames sean reproducibles)
+            self.frame_time_ms: float | None = None
+            self.frame_index = 0
+            
+            # Marca de tiempo del último frame (para avanzar las animaciones)
+            self._last_update_ticks: int = self.get_ticks()
+            
+            # Cerrojo del estado de la partida (entrada y ticks de simulación)
+            self.state_lock = threading.Lock()
+            
+            # Simulación a paso fijo en un hilo propio (opcional). Los efectos
+            # visuales que genera se pasan al hilo principal por una cola.
+            self.simulation: SimulationThread | None = (
+                SimulationThread(self, FPS) if threaded_simulation else None
+            )
+            self._effect_queue: queue.SimpleQueue = queue.SimpleQueue()
+            
+            # Tiempos por fase de cada frame (F3 muestra el panel, F4 exporta)
+            self.timer = FrameTimer(budget_ms=1000 / FPS)
+            self.show_timing = False
+            self.timing_export: str | None = None
+            self._timing_rows: tuple | None = None
+            
+            # Vigilante de tirones (muestrea la pila en los frames lentos)
+            self.watchdog: HitchWatchdog | None = (
+                HitchWatchdog(lambda: self.state.name, budget_ms=hitch_budget_ms)
+                if hitch_budget_ms else None
+            )
+            
+            # Perfilador por estado y entrada guionizada (grabada o del bot)
+            self.profiler: StateProfiler | None = None
+            self.input_script: InputReplay | BotDriver | None = None
+            self.input_recorder: InputRecorder | None = None
+            
+            # Diagnóstico de asignaciones y política del recolector de basura
+            self.allocations: AllocationTracker | None = None
+            self.gc_policy: GCPolicy | None = None
+            
             # Inicializar componentes específicos del juego
             self._init_game()
             
-            # Configurar icono de la ventana
-            icon: pygame.Surface = pygame.image.load("./content/images/icon.ico")
-            pygame.display.set_icon(icon)
-
             logging.info("Juego Tetris inicializado correctamente")
         except Exception as e:
             logging.error(f"Error al inicializar el juego: {e}")
@@ -94,6 +232,10 @@ class Game:
         # Pieza actual
         self.current_piece = self.piece_generator.get_next_piece()
         
+        # Fila de aterrizaje cacheada de la pieza fantasma y su clave de validez
+        self._ghost_key = None
+        self._ghost_y = 0
+        
         # Velocidad de caída inicial desde configuración
         self.fall_speed = 30  # Valor por defecto
         self.fall_counter = 0
@@ -110,34 +252,138 @@ class Game:
         # Reiniciar puntuación
         self.score_manager.reset_score()
         
+        # Empezar a contar las estadísticas de la partida
+        self._play_ms = 0
+        if getattr(self, "stats", None) is not None:
+            self.stats.begin_game()
+        
+        # Cancelar animaciones de la partida anterior
+        if hasattr(self, 'ui'):
+            self.ui.clear_animations()
+        
         if hasattr(self, '_game_over_sound_played'):
             self._game_over_sound_played = False
         
         logging.info("Componentes del juego inicializados")
     
-    def run(self):
+    def get_ticks(self):
+        """
+        Obtiene el tiempo actual del juego en milisegundos.
+        Si hay un paso fijo por frame (frame_time_ms), el tiempo es simulado
+        y depende solo del número de frames ejecutados.
+        
+        Returns:
+            int: Milisegundos transcurridos
+        """
+        if self.frame_time_ms is not None:
+            return int(self.frame_index * self.frame_time_ms)
+        return pygame.time.get_ticks()
+    
+    def skip_splash(self):
+        """
+        Espera a los recursos del menú y pasa directamente al menú, sin
+        pantalla de carga (sesiones guionizadas: así el primer frame del
+        menú no depende de lo que tarde el disco).
+        """
+        self.assets.wait("menu")
+        self._check_assets()
+    
+    def _check_assets(self):
+        """
+        Aplica los recursos del menú en cuanto terminan de cargarse (icono
+        de la ventana) y cierra la pantalla de carga.
+        """
+        if not self._menu_assets_pending or not self.assets.ready("menu"):
+            return
+        self._menu_assets_pending = False
+        
+        icon: pygame.Surface | None = self.assets.get("icon")
+        if icon is not None:
+            self.ui.backend.set_icon(icon)
+        
+        if self.state == GameState.SPLASH:
+            self.state = GameState.MENU
+        logging.info(
+            f"Recursos del menú listos a los {(time.perf_counter() - startup_report.start) * 1000:.1f} ms del arranque"
+        )
+    
+    def start_game(self):
+        """
+        Empieza una partida nueva directamente, sin pasar por el menú.
+        """
+        self._init_game()
+        self.state = GameState.PLAYING
+    
+    def run(self, max_frames=None, recorder=None):
         """
         Ejecuta el bucle principal del juego.
+        
+        Args:
+            max_frames (int, opcional): Número de frames tras el que se termina
+            recorder (FrameRecorder, opcional): Grabador de frames y tiempos de render
         """
         try:
             logging.info("Iniciando bucle principal del juego")
             
+            # Arrancar la simulación en su hilo (si está activada)
+            if self.simulation is not None:
+                self.simulation.start()
+            
+            # Arrancar el vigilante de tirones y el perfilador
+            watchdog = self.watchdog
+            if watchdog is not None:
+                watchdog.start()
+            profiler = self.profiler
+            if profiler is not None:
+                profiler.start()
+            
+            # Con la carga inicial terminada: congelar sus objetos y medir asignaciones
+            gc_policy = self.gc_policy
+            if gc_policy is not None:
+                gc_policy.start()
+            allocations = self.allocations
+            if allocations is not None:
+                allocations.start()
+            
             # Variables para medir rendimiento
             frame_count = 0
             start_time: float = time.time()
             last_fps_log: float = start_time
             
             # Bucle principal
+            timer = self.timer
             while self.running:
+                timer.begin_frame()
+                if watchdog is not None:
+                    watchdog.frame_start()
+                if profiler is not None:
+                    profiler.switch(self.state.name)
+                if gc_policy is not None:
+                    gc_policy.update(self.state == GameState.PLAYING)
+                if allocations is not None:
+                    allocations.begin_frame()
+                
+                # Entrada guionizada: se publica en la cola de eventos de pygame
+                if self.input_script is not None:
+                    self.input_script.before_frame(self)
+                
                 # Gestionar eventos
+                phase_start = time.perf_counter_ns()
                 self._handle_events()
+                timer.add("events", phase_start)
                 
                 # Actualizar el estado del juego
+                phase_start = time.perf_counter_ns()
                 self._update()
+                timer.add("update", phase_start)
                 
                 # Renderizar
                 try:
+                    render_start: float = time.perf_counter()
                     self._render()
+                    if recorder is not None:
+                        render_ms: float = (time.perf_counter() - render_start) * 1000
+                        recorder.record(self.frame_index + 1, self.ui.backend, render_ms)
                 except pygame.error as e:
                     logging.error(f"Error de pygame al renderizar: {e}")
                     if "video system not initialized" in str(e):
@@ -145,6 +391,13 @@ class Game:
                         try:
                             pygame.display.quit()
                             pygame.display.init()
+                            # Cerrar el frame para que los medidores no se
+                            # lo atribuyan al siguiente
+                            timer.end_frame()
+                            if watchdog is not None:
+                                watchdog.frame_end()
+                            if allocations is not None:
+                                allocations.end_frame()
                             continue  # Intentar nuevamente en el siguiente frame
                         except:
                             logging.error("No se pudo reiniciar el sistema de video")
@@ -154,14 +407,29 @@ class Game:
                         # Otro tipo de error, continuar si es posible
                         logging.warning("Continuando a pesar del error...")
                 
+                timer.end_frame()
+                if watchdog is not None:
+                    watchdog.frame_end()
+                if not startup_report.reported:
+                    startup_report.first_frame(self.state.name)
+                if allocations is not None:
+                    allocations.end_frame()
+                
+                # Con tiempo simulado y entrada real, mantener el ritmo de FPS
+                if self.input_recorder is not None:
+                    self.clock.tick(FPS)
+                
                 # Incrementar contador de frames
                 frame_count += 1
+                self.frame_index += 1
+                if max_frames is not None and self.frame_index >= max_frames:
+                    self.running = False
                 
                 # Registrar FPS cada 5 segundos
                 current_time: float = time.time()
                 if current_time - last_fps_log > 5:
                     avg_fps: float = frame_count / (current_time - last_fps_log)
-                    logging.debug(f"FPS promedio: {avg_fps:.2f}")
+                    logging.debug("FPS promedio: %.2f", avg_fps)
                     frame_count = 0
                     last_fps_log: float = current_time
         
@@ -172,8 +440,31 @@ class Game:
             logging.error(traceback.format_exc())
             raise
         finally:
-            # Guardar puntuaciones antes de salir
+            # Detener la simulación y el vigilante antes de liberar nada
+            if self.simulation is not None:
+                self.simulation.stop()
+            if self.watchdog is not None:
+                self.watchdog.stop()
+            if self.profiler is not None:
+                self.profiler.stop()
+            self.audio.stop()
+            if self.stats is not None:
+                self.stats.stop()
+            if self.input_recorder is not None:
+                self.input_recorder.close()
+            if self.allocations is not None:
+                self.allocations.stop()
+            if self.gc_policy is not None:
+                self.gc_policy.stop()
+            
+            # Resumen y exportación de los tiempos por fase
+            self.timer.log_summary()
+            if self.timing_export:
+                self.timer.export(self.timing_export)
+            
+            # Guardar puntuaciones antes de salir (y esperar a que estén en disco)
             self.score_manager.save_highscores()
+            self.score_manager.close()
             
             # Limpiar recursos de pygame
             logging.info("Cerrando pygame y liberando recursos...")
@@ -188,26 +479,49 @@ class Game:
     def _handle_events(self):
         """
         Maneja los eventos de entrada del usuario.
+        Los eventos se leen siempre en el hilo principal (requisito de SDL);
+        con la simulación en un hilo propio se aplican con el cerrojo del
+        estado, entre dos ticks, y se publica el resultado enseguida.
         """
-        for event in pygame.event.get():
-            # Evento de cierre de ventana
-            if event.type == pygame.QUIT:
-                self.running = False
-                return
-            
-            # Manejar eventos según el estado actual
-            if self.state == GameState.MENU:
-                self._handle_menu_events(event)
-            elif self.state == GameState.PLAYING:
-                self._handle_game_events(event)
-            elif self.state == GameState.PAUSED:
-                self._handle_pause_events(event)
-            elif self.state == GameState.GAME_OVER:
-                self._handle_game_over_events(event)
-            elif self.state == GameState.RANKINGS:
-                self._handle_rankings_events(event)
-            elif self.state == GameState.SETTINGS:
-                self._handle_settings_events(event)
+        events = pygame.event.get()
+        if not events:
+            return
+        if self.input_recorder is not None:
+            self.input_recorder.record(self.frame_index, events)
+        
+        with self.state_lock:
+            for event in events:
+                # Evento de cierre de ventana
+                if event.type == pygame.QUIT:
+                    self.running = False
+                    break
+                
+                # Panel de tiempos y exportación (en cualquier estado)
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    self.show_timing = not self.show_timing
+                    continue
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                    self.timer.export(self.timing_export or "frame_timing")
+                    continue
+                
+                # Manejar eventos según el estado actual
+                if self.state == GameState.MENU:
+                    self._handle_menu_events(event)
+                elif self.state == GameState.PLAYING:
+                    self._handle_game_events(event)
+                elif self.state == GameState.PAUSED:
+                    self._handle_pause_events(event)
+                elif self.state == GameState.GAME_OVER:
+                    self._handle_game_over_events(event)
+                elif self.state == GameState.RANKINGS:
+                    self._handle_rankings_events(event)
+                elif self.state == GameState.STATS:
+                    self._handle_stats_events(event)
+                elif self.state == GameState.SETTINGS:
+                    self._handle_settings_events(event)
+        
+        if self.simulation is not None:
+            self.simulation.publish()
     
     def _handle_menu_events(self, event):
         """
@@ -218,11 +532,16 @@ class Game:
         """
         action = self.ui.handle_menu_input(event, self.ui.menu_options["main"])
         if action == "Jugar":
-            self._init_game()
-            self.state = GameState.PLAYING
+            self.start_game()
         elif action == "Rankings":
             self.ui.selected_option = 0
+            self.ui.rankings_offset = 0
+            if self.score_manager.leaderboard is not None:
+                self.score_manager.leaderboard.refresh()
             self.state = GameState.RANKINGS
+        elif action == "Estadísticas":
+            self.ui.selected_option = 0
+            self.state = GameState.STATS
         elif action == "Configuración":
             self.ui.selected_option = 0
             self.state = GameState.SETTINGS
@@ -259,7 +578,7 @@ class Game:
                 self.soft_drop_active = True
 
             self.last_key = event.key
-            self.last_key_time: int = pygame.time.get_ticks()
+            self.last_key_time: int = self.get_ticks()
             self._apply_key_movement(event.key)
         elif event.type == pygame.KEYUP:
             move_down_key = pygame.K_DOWN
@@ -292,28 +611,33 @@ class Game:
         Args:
             event (pygame.event.Event): Evento a manejar
         """
-        # Verificar si es récord
-        if self.score_manager.is_highscore():
-            # Entrada de texto para nombre del jugador
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_RETURN:
-                    # Guardar puntuación
-                    self.score_manager.add_highscore(
-                        self.player_name if self.player_name else "Anónimo",
-                        level=self.board.level,
-                        lines=self.board.lines_cleared
-                    )
-                    # Volver al menú
-                    self.state = GameState.MENU
-                    self.ui.selected_option = 0
-                    self.player_name = ""
-                elif event.key == pygame.K_BACKSPACE:
-                    # Borrar último carácter
-                    self.player_name = self.player_name[:-1]
-                elif len(self.player_name) < 15:  # Limitar longitud
-                    # Añadir carácter
-                    if event.unicode.isalnum() or event.unicode in " -_":
-                        self.player_name += event.unicode
+        if event.type != pygame.KEYDOWN:
+            return
+        
+        # El nombre solo se pide si es récord
+        is_highscore = self.score_manager.is_highscore(self.board.score)
+        if event.key == pygame.K_RETURN:
+            # Guardar la partida (el historial de --score-db las guarda todas;
+            # la tabla de récords, solo si lo es)
+            self.score_manager.add_highscore(
+                self.player_name if is_highscore and self.player_name else "Anónimo",
+                score=self.board.score,
+                level=self.board.level,
+                lines=self.board.lines_cleared
+            )
+            # Volver al menú
+            self.state = GameState.MENU
+            self.ui.selected_option = 0
+            self.player_name = ""
+        elif not is_highscore:
+            return
+        elif event.key == pygame.K_BACKSPACE:
+            # Borrar último carácter
+            self.player_name = self.player_name[:-1]
+        elif len(self.player_name) < 15:  # Limitar longitud
+            # Añadir carácter
+            if event.unicode.isalnum() or event.unicode in " -_":
+                self.player_name += event.unicode
 
     
     def _handle_rankings_events(self, event):
@@ -328,6 +652,21 @@ class Game:
             if event.key == exit_key:
                 self.state = GameState.MENU
                 self.ui.selected_option = 0
+                return
+        
+        # Desplazamiento y paginación de la tabla
+        self.ui.handle_rankings_input(event)
+
+    def _handle_stats_events(self, event):
+        """
+        Maneja los eventos en la pantalla de estadísticas.
+        
+        Args:
+            event (pygame.event.Event): Evento a manejar
+        """
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.state = GameState.MENU
+            self.ui.selected_option = 0
 
     def _handle_settings_events(self, event):
         """
@@ -344,6 +683,33 @@ class Game:
         """
         Actualiza el estado del juego según el estado actual.
         """
+        current_ticks: int = self.get_ticks()
+        dt: int = current_ticks - self._last_update_ticks
+        self._last_update_ticks = current_ticks
+        
+        if self._menu_assets_pending:
+            self._check_assets()
+        
+        # Música del estado actual
+        if self.state != self._audio_state:
+            self._audio_state = self.state
+            self.audio.on_state(self.state.name)
+        
+        if self.state == GameState.PLAYING:
+            self._play_ms += dt
+
+            # Con la simulación en su hilo, aquí solo se avanzan las animaciones
+            if self.simulation is None:
+                self._update_game()
+            
+            # Avanzar animaciones (quedan congeladas fuera de la partida)
+            self.ui.update_animations(dt)
+    
+    def simulation_tick(self):
+        """
+        Ejecuta un tick de la lógica de la partida (desde SimulationThread,
+        con el cerrojo del estado adquirido).
+        """
         if self.state == GameState.PLAYING:
             self._update_game()
     
@@ -351,7 +717,7 @@ class Game:
         """
         Actualiza el estado del juego durante el gameplay.
         """
-        current_time: int = pygame.time.get_ticks()
+        current_time: int = self.get_ticks()
         
         # Manejar repetición de teclas
         if self.last_key and current_time - self.last_key_time > self.key_repeat_delay:
@@ -415,6 +781,10 @@ class Game:
             self.current_piece.y = original_y
             if key == rotate:
                 self.current_piece.rotation = original_rotation
+        elif key == rotate:
+            self.audio.play("rotate")
+        elif key == move_left or key == move_right:
+            self.audio.play("move")
     
     def _move_piece_down(self):
         """
@@ -433,11 +803,13 @@ class Game:
             self.current_piece.y = original_y
             
             # Fijar pieza al tablero
+            score_before = self.board.score
             if not self.board.add_piece(self.current_piece):
                 # Game over si no se puede fijar la pieza
-                self.state = GameState.GAME_OVER
-                logging.info(f"Game Over - Puntuación: {self.score_manager.get_current_score()}")
+                self._game_over()
                 return
+            self._play_line_clear_effects(score_before)
+            self._record_piece()
             
             # Generar nueva pieza
             self.current_piece = self.piece_generator.get_next_piece()
@@ -445,8 +817,17 @@ class Game:
             # Verificar si la nueva pieza puede ser colocada
             if not self.board.is_valid_position(self.current_piece):
                 # Game over si no hay espacio para la nueva pieza
-                self.state = GameState.GAME_OVER
-                logging.info(f"Game Over - Puntuación: {self.score_manager.get_current_score()}")
+                self._game_over()
+    
+    def _game_over(self):
+        """
+        Termina la partida y registra sus estadísticas (con el cerrojo del
+        estado adquirido si la simulación va en su hilo).
+        """
+        self.state = GameState.GAME_OVER
+        logging.info(f"Game Over - Puntuación: {self.board.score}")
+        if self.stats is not None:
+            self.stats.end_game(self.board.score, self.board.lines_cleared, self.board.level, self._play_ms)
     
     def _perform_hard_drop(self):
         """
@@ -456,11 +837,13 @@ class Game:
         distance = self.board.hard_drop(self.current_piece)
 
         # Fijar pieza al tablero
+        score_before = self.board.score
         if not self.board.add_piece(self.current_piece):
             # Game over si no se puede fijar la pieza
-            self.state = GameState.GAME_OVER
-            logging.info(f"Game Over - Puntuación: {self.score_manager.get_current_score()}")
+            self._game_over()
             return
+        self._play_line_clear_effects(score_before)
+        self._record_piece()
             
         # Generar nueva pieza
         self.current_piece = self.piece_generator.get_next_piece()
@@ -468,99 +851,507 @@ class Game:
         # Verificar si la nueva pieza puede ser colocada
         if not self.board.is_valid_position(self.current_piece):
             # Game over si no hay espacio para la nueva pieza
-            self.state = GameState.GAME_OVER
-            logging.info(f"Game Over - Puntuación: {self.score_manager.get_current_score()}")
+            self._game_over()
+    
+    def _play_line_clear_effects(self, score_before):
+        """
+        Lanza los efectos de sonido tras fijar una pieza y, si completa
+        líneas, también los visuales.
+        
+        Args:
+            score_before (int): Puntuación del tablero antes de fijar la pieza
+        """
+        cleared = len(self.board.last_cleared_rows)
+        self.audio.play("tetris" if cleared >= 4 else "line_clear" if cleared else "lock")
+        if not cleared:
+            return
+        points = self.board.score - score_before
+        if self.simulation is not None:
+            # Las animaciones son del hilo principal: se lanzan al renderizar
+            self._effect_queue.put((self.board.last_cleared_rows, points))
+            return
+        self.ui.flash_lines(self.board.last_cleared_rows)
+        self.ui.show_score_effect(points)
+    
+    def _record_piece(self):
+        """
+        Cuenta la pieza recién fijada en las estadísticas de la partida.
+        """
+        if self.stats is not None:
+            self.stats.piece_locked(self.current_piece.shape_name, len(self.board.last_cleared_rows))
+    
+    def _get_ghost_y(self):
+        """
+        Obtiene la fila donde aterrizaría la pieza actual (pieza fantasma).
+        El cálculo se cachea y solo se repite si la pieza se mueve o rota,
+        si cambia la pieza o si cambia el contenido del tablero.
+        
+        Returns:
+            int: Fila de aterrizaje de la pieza actual
+        """
+        piece = self.current_piece
+        key = (id(piece), piece.x, piece.y, piece.rotation, id(self.board), self.board.version)
+        if key != self._ghost_key:
+            self._ghost_y = self.board.preview_piece_position(piece)
+            self._ghost_key = key
+        return self._ghost_y
     
     def _render(self):
         """
         Renderiza el juego en pantalla según el estado actual.
         """
+        render_start = time.perf_counter_ns()
+        
+        # Al cambiar de estado, descartar el fondo congelado anterior
+        if self.state != self._rendered_state:
+            self.ui.invalidate_overlay_background()
+            self._rendered_state = self.state
+        
         # Renderizar según el estado del juego
-        if self.state == GameState.MENU:
+        if self.state == GameState.SPLASH:
+            self.ui.draw_splash(self.splash_image, self.assets.progress())
+        elif self.state == GameState.MENU:
             self.ui.draw_main_menu()
         elif self.state == GameState.PLAYING:
             self._render_game()
         elif self.state == GameState.PAUSED:
-            self._render_game()  # Renderizar juego en el fondo
+            # Renderizar juego en el fondo solo una vez al entrar en pausa
+            if not self.ui.has_overlay_background():
+                self._render_game()
             self.ui.draw_pause_menu()
         elif self.state == GameState.GAME_OVER:
-            self._render_game()  # Renderizar juego en el fondo
+            # Renderizar juego en el fondo solo una vez al entrar en game over
+            if not self.ui.has_overlay_background():
+                self._render_game()
             self.ui.draw_game_over(
-                self.score_manager.get_current_score(),
+                self.board.score,
                 self.board.level,
                 self.board.lines_cleared
             )
             
             # Mostrar entrada de texto si es récord
-            if self.score_manager.is_highscore():
-                # Obtener dimensiones de ventana desde configuración
-                window_width = 800
-                window_height = 600
-                
-                # Fondo para texto
-                text_bg_rect = pygame.Rect(
-                    window_width // 4,
-                    window_height // 2 + 100,
-                    window_width // 2,
-                    40
-                )
-                pygame.draw.rect(self.ui.window, (50, 50, 50), text_bg_rect)
-                pygame.draw.rect(self.ui.window, (100, 100, 100), text_bg_rect, 2)
-                
-                # Mostrar texto de entrada
-                name_text: str = f"Nombre: {self.player_name}"
-                if pygame.time.get_ticks() % 1000 < 500:
-                    name_text += "|"  # Cursor parpadeante
-                self.ui.draw_text(
-                    name_text,
-                    self.ui.medium_font,
-                    (255, 255, 255),
-                    window_width // 2,
-                    window_height // 2 + 120,
-                    center=True
-                )
+            if self.score_manager.is_highscore(self.board.score):
+                self.ui.draw_name_input(self.player_name, self.get_ticks())
                 
         elif self.state == GameState.RANKINGS:
             self.ui.draw_rankings()
+        elif self.state == GameState.STATS:
+            self.ui.draw_stats(self.stats)
         elif self.state == GameState.SETTINGS:
             pass  # Ya no hay config_ui
         
+        # Panel de tiempos por fase
+        if self.show_timing:
+            self._draw_timing_overlay()
+        self.timer.add("render", render_start)
+        
         # Actualizar pantalla
-        pygame.display.flip()
+        flip_start = time.perf_counter_ns()
+        self.ui.present()
+        self.timer.add("flip", flip_start)
+    
+    def _draw_timing_overlay(self):
+        """
+        Dibuja el panel de tiempos por fase. Las estadísticas se recalculan
+        cada 30 frames para que el propio panel apenas cueste.
+        """
+        phase_start = time.perf_counter_ns()
+        if self._timing_rows is None or self.timer.frame_count % 30 == 0:
+            self._timing_rows = self.timer.overlay_rows()
+        self.ui.draw_timing_overlay(self._timing_rows)
+        self.timer.add("render.overlay", phase_start)
     
     def _render_game(self):
         """
         Renderiza el estado actual del juego.
         """
-        # Dibujar fondo
-        self.ui.draw_background()
+        if self.simulation is not None:
+            self._render_snapshot()
+            return
+        
+        timer = self.timer
         
-        # Dibujar tablero
+        # Dibujar fondo y tablero
+        phase_start = time.perf_counter_ns()
+        self.ui.draw_background()
         self.ui.draw_board(self.board)
+        timer.add("render.board", phase_start)
         
-        # Dibujar pieza actual
+        # Dibujar pieza fantasma (posición de aterrizaje) y pieza actual
+        phase_start = time.perf_counter_ns()
+        self.ui.draw_piece(self.current_piece, preview=True, y=self._get_ghost_y())
         self.ui.draw_piece(self.current_piece)
+        timer.add("render.piece", phase_start)
+        
+        # Dibujar animaciones en curso (destellos, puntos)
+        phase_start = time.perf_counter_ns()
+        self.ui.draw_animations()
+        timer.add("render.effects", phase_start)
         
         # Dibujar próximas piezas
+        phase_start = time.perf_counter_ns()
         self.ui.draw_next_pieces(self.piece_generator.peek_next_pieces())
+        timer.add("render.preview", phase_start)
         
         # Dibujar panel de puntuación
+        phase_start = time.perf_counter_ns()
         self.ui.draw_score_panel(
             self.score_manager.get_current_score(),
             self.board.level,
             self.board.lines_cleared,
             self.score_manager.get_highscore()
         )
+        timer.add("render.panel", phase_start)
+
+    
+    def _render_snapshot(self):
+        """
+        Renderiza la partida a partir de la última instantánea publicada por
+        la simulación, interpolando la caída de la pieza entre los dos
+        últimos ticks. No lee el estado vivo, así que no necesita el cerrojo.
+        """
+        previous, current = self.simulation.snapshots()
+        
+        # Lanzar los efectos generados por la simulación
+        while True:
+            try:
+                cleared_rows, points = self._effect_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.ui.flash_lines(cleared_rows)
+            self.ui.show_score_effect(points)
+        
+        piece_y = self.simulation.interpolated_piece_y(previous, current)
+        timer = self.timer
+        
+        phase_start = time.perf_counter_ns()
+        self.ui.draw_background()
+        self.ui.draw_board(current.board)
+        timer.add("render.board", phase_start)
+        
+        phase_start = time.perf_counter_ns()
+        self.ui.draw_piece(current.piece, preview=True, y=current.ghost_y)
+        self.ui.draw_piece(current.piece, y=piece_y)
+        timer.add("render.piece", phase_start)
+        
+        phase_start = time.perf_counter_ns()
+        self.ui.draw_animations()
+        timer.add("render.effects", phase_start)
+        
+        phase_start = time.perf_counter_ns()
+        self.ui.draw_next_pieces(current.next_pieces)
+        timer.add("render.preview", phase_start)
+        
+        phase_start = time.perf_counter_ns()
+        self.ui.draw_score_panel(
+            current.score,
+            current.board.level,
+            current.board.lines_cleared,
+            current.highscore
+        )
+        timer.add("render.panel", phase_start)
+
+
+def parse_args(argv=None):
+    """
+    Analiza los argumentos de la línea de comandos.
+    
+    Args:
+        argv (list, opcional): Argumentos a analizar (por defecto sys.argv)
+        
+    Returns:
+        argparse.Namespace: Opciones de arranque
+    """
+    parser = argparse.ArgumentParser(description="Tetris")
+    parser.add_argument(
+        "--renderer",
+        choices=["surface", "texture"],
+        default="surface",
+        help="backend de renderizado: superficies por software o texturas SDL2"
+    )
+    parser.add_argument(
+        "--software-renderer",
+        action="store_true",
+        help="con --renderer texture, usar el renderer por software de SDL (sin GPU)"
+    )
+    parser.add_argument(
+        "--mute",
+        action="store_true",
+        help="sin música ni efectos (no abre el dispositivo de audio)"
+    )
+    parser.add_argument(
+        "--score-db",
+        nargs="?",
+        const="highscores.db",
+        default=None,
+        metavar="RUTA",
+        help="guardar el historial de récords en SQLite (por defecto highscores.db; "
+             "la primera vez importa highscores.json)"
+    )
+    parser.add_argument(
+        "--leaderboard",
+        default=None,
+        metavar="HOST[:PUERTO]",
+        help="enviar los récords a un servidor de clasificación global (leaderboard_server.py) "
+             "y mostrar su clasificación en Rankings"
+    )
+    parser.add_argument(
+        "--no-stats",
+        action="store_true",
+        help="no registrar estadísticas de las partidas"
+    )
+    parser.add_argument(
+        "--stats-pieces",
+        action="store_true",
+        help="registrar en el historial de estadísticas también cada pieza fijada"
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        default="INFO",
+        help="nivel del log en tetris.log (la consola siempre muestra INFO o superior)"
+    )
+    
+    parser.add_argument(
+        "--arena",
+        type=int,
+        default=0,
+        metavar="N",
+        help="mostrar N partidas automáticas a la vez (demos y torneos, p. ej. 16-64)"
+    )
+    parser.add_argument(
+        "--versus",
+        action="store_true",
+        help="modo versus local para dos jugadores en pantalla dividida"
+    )
+    parser.add_argument(
+        "--cpu",
+        action="store_true",
+        help="con --versus, el jugador 2 lo controla el ordenador"
+    )
+    parser.add_argument(
+        "--sim-thread",
+        action="store_true",
+        help="ejecutar la lógica de la partida a paso fijo en un hilo propio"
+    )
+    parser.add_argument(
+        "--timing",
+        action="store_true",
+        help="mostrar desde el inicio el panel de tiempos por fase (se alterna con F3)"
+    )
+    parser.add_argument(
+        "--hitch-budget",
+        type=float,
+        default=1000 / FPS,
+        metavar="MS",
+        help="presupuesto por frame del vigilante de tirones (por defecto 16.7 ms, 0 lo desactiva); "
+             "los frames lentos se registran en hitches.log"
+    )
+    parser.add_argument(
+        "--timing-export",
+        default=None,
+        metavar="RUTA",
+        help="al salir, exportar los tiempos por fase a RUTA.csv y RUTA.json (F4 exporta en cualquier momento)"
+    )
+    
+    # Perfilado y sesiones reproducibles
+    profiling = parser.add_argument_group("perfilado y sesiones reproducibles")
+    profiling.add_argument(
+        "--profile",
+        action="store_true",
+        help="perfilar la sesión, con resultados separados por estado del juego"
+    )
+    profiling.add_argument(
+        "--profile-mode",
+        choices=["all", "cprofile", "sampling"],
+        default="all",
+        help="cprofile (.pstats), muestreo de pilas (.collapsed) o ambos (por defecto)"
+    )
+    profiling.add_argument(
+        "--profile-dir",
+        default="profiles",
+        help="carpeta de los resultados del perfilador (por defecto 'profiles')"
+    )
+    profiling.add_argument(
+        "--alloc-trace",
+        type=int,
+        nargs="?",
+        const=1,
+        default=None,
+        metavar="N",
+        help="registrar con tracemalloc las asignaciones de memoria por frame y por línea de código "
+             "(con N, una instantánea cada N frames)"
+    )
+    profiling.add_argument(
+        "--gc-tuning",
+        action="store_true",
+        help="congelar los objetos de la carga inicial (gc.freeze) y aplazar las colecciones "
+             "completas del recolector a los momentos sin partida"
+    )
+    script = profiling.add_mutually_exclusive_group()
+    script.add_argument(
+        "--autoplay",
+        action="store_true",
+        help="sesión conducida por el bot (menú, rankings, partida y pausas) durante --frames frames"
+    )
+    script.add_argument(
+        "--replay",
+        default=None,
+        metavar="FICHERO",
+        help="reproducir una sesión grabada con --record-input"
+    )
+    script.add_argument(
+        "--record-input",
+        default=None,
+        metavar="FICHERO",
+        help="grabar la entrada de la sesión (con su semilla) para reproducirla después"
+    )
+    
+    # Modo sin pantalla (benchmarks y pruebas con imágenes de referencia)
+    headless = parser.add_argument_group("modo sin pantalla")
+    headless.add_argument(
+        "--headless",
+        action="store_true",
+        help="renderizar sin ventana (driver de video offscreen/dummy de SDL)"
+    )
+    headless.add_argument(
+        "--frames",
+        type=int,
+        default=600,
+        help="frames a ejecutar en modo sin pantalla o con --autoplay (por defecto 600)"
+    )
+    headless.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="semilla aleatoria para partidas reproducibles"
+    )
+    headless.add_argument(
+        "--capture",
+        default="",
+        help="frames a guardar como PNG, separados por comas (p. ej. 1,60,300)"
+    )
+    headless.add_argument(
+        "--capture-dir",
+        default="frames",
+        help="carpeta para los PNG capturados (por defecto 'frames')"
+    )
+    headless.add_argument(
+        "--raw-stream",
+        default=None,
+        help="fichero donde volcar todos los frames en RGB24 sin cabecera ('-' = stdout)"
+    )
+    headless.add_argument(
+        "--render-report",
+        default=None,
+        help="fichero JSON con el coste de renderizado de cada frame"
+    )
+    return parser.parse_args(argv)
+
+
+def configure_session(game, args):
+    """
+    Prepara las herramientas de diagnóstico y la entrada guionizada de una partida según
+    las opciones de arranque. Las sesiones grabadas, reproducidas o
+    conducidas por el bot usan tiempo simulado (un paso fijo por frame)
+    y una semilla conocida, para que se puedan repetir exactamente.
+    
+    Args:
+        game (Game): Juego a configurar
+        args (argparse.Namespace): Opciones de arranque
+        
+    Returns:
+        bool: True si la entrada es guionizada (la sesión empieza en el menú)
+    """
+    if args.profile:
+        game.profiler = StateProfiler(args.profile_dir, args.profile_mode)
+    if args.alloc_trace is not None:
+        game.allocations = AllocationTracker(args.alloc_trace)
+    if args.gc_tuning:
+        game.gc_policy = GCPolicy()
+    
+    if args.replay:
+        replay = InputReplay(args.replay)
+        if replay.seed is not None:
+            random.seed(replay.seed)
+        game.input_script = replay
+    elif args.autoplay:
+        game.input_script = BotDriver()
+    elif args.record_input:
+        seed = args.seed if args.seed is not None else random.randrange(2 ** 32)
+        random.seed(seed)
+        game.input_recorder = InputRecorder(args.record_input, seed)
+    else:
+        return False
+    
+    game.skip_splash()
+    game.frame_time_ms = 1000 / FPS
+    return game.input_script is not None
+
+
+def run_headless(args):
+    """
+    Ejecuta una partida sin pantalla durante un número fijo de frames,
+    con tiempo simulado a FPS frames por segundo, y registra el coste
+    de renderizado de cada frame.
+    
+    Args:
+        args (argparse.Namespace): Opciones de arranque
+        
+    Returns:
+        dict: Estadísticas del coste de renderizado
+    """
+    if args.seed is not None:
+        random.seed(args.seed)
+    
+    capture_frames = [int(frame) for frame in args.capture.split(",") if frame.strip()]
+    recorder = FrameRecorder(capture_frames, args.capture_dir, args.raw_stream, args.render_report)
+    
+    # Arena sin pantalla: mismas capturas y mismo informe de renderizado
+    if args.arena:
+        try:
+            run_arena(args.arena, max_frames=args.frames, recorder=recorder, uncapped=True)
+        finally:
+            stats = recorder.close()
+        return stats
+    
+    # Sin GPU: el backend de texturas usa siempre el renderer por software
+    if args.versus:
+        # Versus sin pantalla: los dos jugadores los controla el bot
+        game = VersusGame(args.renderer, software_renderer=True, bots=(0, 1))
+        game.frame_time_ms = 1000 / FPS
+    else:
+        game = Game(args.renderer, software_renderer=True, threaded_simulation=args.sim_thread,
+                    hitch_budget_ms=args.hitch_budget, audio=not args.mute, score_db=args.score_db,
+                    leaderboard=args.leaderboard, stats=not args.no_stats, stats_pieces=args.stats_pieces)
+        # Con la simulación en su hilo, el reloj es real (no reproducible)
+        game.frame_time_ms = None if args.sim_thread else 1000 / FPS
+        game.show_timing = args.timing
+        game.timing_export = args.timing_export
+        if not configure_session(game, args):
+            game.start_game()
+    try:
+        # Una sesión reproducida termina en el último frame grabado
+        game.run(max_frames=None if args.replay else args.frames, recorder=recorder)
+    finally:
+        stats = recorder.close()
+    return stats
 
 
 # Punto de entrada principal
 if __name__ == "__main__":
     try:
+        args = parse_args()
+        logging.getLogger().setLevel(args.log_level)
+        
         # Configurar driver de video según el sistema operativo
         drivers: list[str] = []
-        driver_set = False
 
-        if os.name == 'nt':
+        if args.headless:
+            # Sin pantalla: drivers de SDL que renderizan en memoria
+            drivers = ['offscreen', 'dummy']
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        elif os.name == 'nt':
             # Windows
             drivers = ['windows']
         elif sys.platform.startswith("linux"):
@@ -570,16 +1361,8 @@ if __name__ == "__main__":
             # macOS
             drivers = ['cocoa']
 
-        for driver in drivers:
-            try:
-                os.environ["SDL_VIDEODRIVER"] = driver
-                pygame.display.init()
-                logging.info(f"Driver de video '{driver}' inicializado correctamente")
-                driver_set = True
-                break
-            except pygame.error:
-                logging.warning(f"No se pudo inicializar el driver '{driver}'")
-                pygame.display.quit()
+        # Primero se prueba el driver que funcionó en la ejecución anterior
+        driver_set = init_video(drivers) is not None
 
         if not driver_set:
             logging.error("No se pudo inicializar ningún driver de video")
@@ -598,12 +1381,28 @@ if __name__ == "__main__":
         logging.info(f"Pygame versión: {pygame.version.ver}")
         logging.info(f"SDL versión: {pygame.version.SDL}")
         
-        # Inicializar pygame de forma básica
-        pygame.init()
+        # Inicializar solo los módulos de pygame necesarios (sin audio ni joysticks)
+        init_pygame()
         
         # Crear instancia del juego y ejecutar
-        game = Game()
-        game.run()
+        if args.headless:
+            run_headless(args)
+        elif args.arena:
+            run_arena(args.arena)
+        elif args.versus:
+            game = VersusGame(args.renderer, args.software_renderer, bots=(1,) if args.cpu else ())
+            game.run()
+        else:
+            game = Game(args.renderer, args.software_renderer, args.sim_thread, args.hitch_budget,
+                        audio=not args.mute, score_db=args.score_db, leaderboard=args.leaderboard,
+                        stats=not args.no_stats, stats_pieces=args.stats_pieces)
+            game.show_timing = args.timing
+            game.timing_export = args.timing_export
+            configure_session(game, args)
+            game.run(max_frames=args.frames if args.autoplay else None)
+        
+        # Guardar el driver y las fuentes resueltas para el próximo arranque
+        startup_cache.save()
         
     except Exception as e:
         logging.error(f"Error fatal: {e}")
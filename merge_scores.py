@@ -0,0 +1,319 @@
+# merge_scores.py
+# Herramienta para combinar los récords de varias máquinas en una sola clasificación
+#
+# Uso:
+#   python merge_scores.py maquina1/highscores.json maquina2/highscores.db ... [--top N] [--output FICHERO]
+
+import sys
+import json
+import heapq
+import logging
+import sqlite3
+import argparse
+
+from persistence import atomic_write_json
+from score import is_valid_highscore, format_points
+from score_db import COLUMNS
+
+# Tamaño de los bloques en que se leen los JSON (caracteres)
+CHUNK_SIZE = 1 << 16
+
+_decoder = json.JSONDecoder()
+
+def _entry_key(entry):
+    """
+    Identidad de un récord para descartar duplicados.
+
+    Args:
+        entry (dict): Récord
+
+    Returns:
+        tuple: (jugador, puntuación, fecha)
+    """
+    return entry["player"], entry["score"], entry["date"]
+
+def open_source(path, top):
+    """
+    Abre una fuente de récords: un highscores.json o una base de datos de
+    SqliteScoreManager. Las fuentes nunca se modifican.
+
+    Args:
+        path (str): Fichero de récords (.db/.sqlite para SQLite, el resto JSON)
+        top (int): Récords que se van a necesitar como mucho de esta fuente
+
+    Returns:
+        iterator: Récords de mayor a menor puntuación, o None si la fuente
+            no se puede leer (el error ya queda registrado)
+    """
+    if path.endswith((".db", ".sqlite", ".sqlite3")):
+        return _open_db(path)
+    return _open_json(path, top)
+
+def _iter_json_array(file, chunk_size=CHUNK_SIZE):
+    """
+    Lee un array JSON elemento a elemento, por bloques: en memoria solo
+    hay un bloque y el elemento que se está leyendo.
+
+    Args:
+        file (io.TextIOBase): Fichero abierto en modo texto
+        chunk_size (int): Caracteres por bloque
+
+    Yields:
+        object: Cada elemento del array
+
+    Raises:
+        ValueError: Si el contenido no es un array JSON válido
+    """
+    buffer = ""
+    position = 0
+    eof = False
+    # Qué se espera a continuación: "[", un elemento o "]" ("first"),
+    # un elemento ("value") o "," o "]" ("separator")
+    expected = "["
+    while True:
+        # Saltar espacios, leyendo otro bloque si se acaba el actual
+        while position < len(buffer) and buffer[position] in " \t\r\n":
+            position += 1
+        if position == len(buffer):
+            if eof:
+                raise ValueError("el fichero termina antes de cerrar la lista")
+            buffer = file.read(chunk_size)
+            position = 0
+            eof = not buffer
+            continue
+
+        char = buffer[position]
+        if expected == "[":
+            if char != "[":
+                raise ValueError("los récords no son una lista")
+            position += 1
+            expected = "first"
+        elif char == "]" and expected != "value":
+            return
+        elif expected == "separator":
+            if char != ",":
+                raise ValueError(f"se esperaba ',' o ']' en la posición {position} del bloque")
+            position += 1
+            expected = "value"
+        else:
+            try:
+                value, end = _decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                end = None
+            # Un elemento cortado por el final del bloque se vuelve a leer
+            # con más datos (un número puede parecer completo: solo lo
+            # está si lo sigue un separador)
+            complete = end is not None and end < len(buffer) and buffer[end] in " \t\r\n,]"
+            if not complete and not eof:
+                chunk = file.read(chunk_size)
+                eof = not chunk
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+            if end is None:
+                raise ValueError("elemento no válido al final del fichero")
+            yield value
+            position = end
+            expected = "separator"
+
+def _open_json(path, top):
+    """
+    Lee un highscores.json en streaming y se queda con sus top mejores
+    récords distintos. La memoria depende de top, no del tamaño del
+    fichero, y el fichero no tiene por qué estar ordenado.
+
+    Args:
+        path (str): Fichero JSON
+        top (int): Récords a conservar
+
+    Returns:
+        iterator: Récords ordenados, o None si el fichero no es válido
+    """
+    # Montículo con los mejores: (puntuación, -orden, récord); el orden
+    # de lectura desempata como en ScoreManager (primero el más antiguo)
+    best: list[tuple] = []
+    keys: set[tuple] = set()
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            for order, entry in enumerate(_iter_json_array(file)):
+                if not is_valid_highscore(entry):
+                    logging.warning(f"Récord descartado por no ser válido en '{path}': {entry!r}")
+                    continue
+                key = _entry_key(entry)
+                if key in keys:
+                    continue
+                item = (entry["score"], -order, entry)
+                if len(best) < top:
+                    heapq.heappush(best, item)
+                    keys.add(key)
+                elif best and item[:2] > best[0][:2]:
+                    keys.discard(_entry_key(heapq.heapreplace(best, item)[2]))
+                    keys.add(key)
+    except (UnicodeDecodeError, ValueError, OSError) as e:
+        logging.error(f"Fuente descartada '{path}': {e}")
+        return None
+    best.sort(key=lambda item: item[:2], reverse=True)
+    return iter([item[2] for item in best])
+
+def _open_db(path):
+    """
+    Abre una base de datos de récords en solo lectura y comprueba que se
+    puede consultar.
+
+    Args:
+        path (str): Fichero SQLite
+
+    Returns:
+        iterator: Récords ordenados leídos bajo demanda, o None si la base
+            de datos no es válida
+    """
+    try:
+        connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        connection.row_factory = sqlite3.Row
+        cursor = connection.execute(f"SELECT {COLUMNS} FROM scores ORDER BY score DESC, id")
+        first = cursor.fetchone()
+    except sqlite3.Error as e:
+        logging.error(f"Fuente descartada '{path}': {e}")
+        return None
+    return _iter_db(path, connection, cursor, first)
+
+def _iter_db(path, connection, cursor, first):
+    """
+    Recorre el cursor de una base de datos fila a fila (el índice por
+    puntuación ya las da ordenadas); si la base de datos falla a mitad,
+    se registra y la fuente termina ahí.
+
+    Args:
+        path (str): Fichero SQLite (para el log)
+        connection (sqlite3.Connection): Conexión a cerrar al terminar
+        cursor (sqlite3.Cursor): Consulta ordenada por puntuación
+        first (sqlite3.Row): Primera fila, ya leída al abrir
+
+    Yields:
+        dict: Récord
+    """
+    try:
+        row = first
+        while row is not None:
+            yield dict(row)
+            row = cursor.fetchone()
+    except sqlite3.Error as e:
+        logging.error(f"Error leyendo '{path}', se descarta el resto: {e}")
+    finally:
+        connection.close()
+
+def merge_highscores(paths, top=10):
+    """
+    Combina los récords de varias fuentes en una clasificación única.
+
+    Cada fuente da sus récords ordenados (los JSON ya reducidos a sus top
+    mejores distintos, las bases de datos bajo demanda), así que se
+    mezclan con un heap de k entradas (una por fuente) y se para al tener
+    top récords distintos: la memoria depende de top y del número de
+    fuentes, no del total de récords. Los duplicados (mismo jugador,
+    puntuación y fecha, p. ej. una copia de un fichero en dos máquinas) se
+    cuentan una sola vez; como tienen la misma puntuación, solo hay que
+    recordar los de la puntuación actual.
+
+    Args:
+        paths (list): Ficheros de récords (JSON o SQLite)
+        top (int): Récords de la clasificación
+
+    Returns:
+        tuple: (récords combinados de mayor a menor, fuentes descartadas)
+    """
+    sources = []
+    skipped = []
+    for path in paths:
+        source = open_source(path, top)
+        if source is None:
+            skipped.append(path)
+        else:
+            sources.append(source)
+
+    merged = []
+    seen: set[tuple] = set()
+    seen_score = None
+    for entry in heapq.merge(*sources, key=lambda entry: -entry["score"]):
+        if len(merged) >= top:
+            break
+        if entry["score"] != seen_score:
+            seen.clear()
+            seen_score = entry["score"]
+        key = _entry_key(entry)
+        if key in seen:
+            continue
+        seen.add(key)
+        merged.append(entry)
+
+    # Cerrar las bases de datos que no se han leído hasta el final
+    for source in sources:
+        close = getattr(source, "close", None)
+        if close is not None:
+            close()
+    return merged, skipped
+
+def parse_args(argv=None):
+    """
+    Analiza las opciones de la herramienta.
+
+    Args:
+        argv (list, opcional): Argumentos a analizar (por defecto sys.argv)
+
+    Returns:
+        argparse.Namespace: Opciones
+    """
+    parser = argparse.ArgumentParser(
+        description="Combina los récords de varias máquinas en una sola clasificación"
+    )
+    parser.add_argument(
+        "sources",
+        nargs="+",
+        metavar="FICHERO",
+        help="highscores.json o bases de datos de --score-db (.db) de cada máquina"
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        metavar="N",
+        help="récords de la clasificación combinada (por defecto 10)"
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        metavar="FICHERO",
+        help="guardar la clasificación en un JSON con el formato de highscores.json"
+    )
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """
+    Punto de entrada de la herramienta.
+
+    Args:
+        argv (list, opcional): Argumentos (por defecto sys.argv)
+
+    Returns:
+        int: Código de salida (1 si no se pudo leer ninguna fuente)
+    """
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    args = parse_args(argv)
+
+    merged, skipped = merge_highscores(args.sources, max(0, args.top))
+    if skipped:
+        logging.warning(f"Fuentes descartadas: {len(skipped)} de {len(args.sources)}")
+    if len(skipped) == len(args.sources):
+        return 1
+
+    if args.output:
+        atomic_write_json(args.output, merged)
+        logging.info(f"Clasificación guardada en {args.output}")
+
+    for position, entry in enumerate(merged, 1):
+        print(f"{position:>4}  {entry['player']:<15} {format_points(entry['score']):>12}  "
+              f"nivel {entry['level']:<3} {entry['date']}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
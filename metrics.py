@@ -0,0 +1,18 @@
+# metrics.py
+# Módulo con utilidades comunes para las medidas de rendimiento
+
+def percentile(sorted_values, fraction):
+    """
+    Obtiene un percentil de una lista ya ordenada.
+
+    Args:
+        sorted_values (list): Valores ordenados de menor a mayor
+        fraction (float): Percentil deseado (0.0 - 1.0)
+
+    Returns:
+        float: Valor del percentil, o 0.0 si la lista está vacía
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
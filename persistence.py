@@ -0,0 +1,165 @@
+# persistence.py
+# Módulo para guardar ficheros JSON de forma segura (escritura atómica en segundo plano)
+
+import os
+import copy
+import json
+import logging
+import threading
+
+def atomic_write_json(path, data, backup=True):
+    """
+    Escribe un JSON de forma atómica: primero en un fichero temporal, que
+    se vuelca a disco (fsync) y después sustituye al original con un
+    rename. Un corte de luz deja el fichero anterior o el nuevo, nunca uno
+    a medias. Con backup, la versión anterior se conserva como .bak.
+
+    Args:
+        path (str): Fichero de destino
+        data (object): Datos serializables a JSON
+        backup (bool): Conservar la versión anterior en path + ".bak"
+    """
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(data, file, indent=4)
+        file.flush()
+        os.fsync(file.fileno())
+
+    if backup and os.path.exists(path):
+        os.replace(path, path + ".bak")
+    os.replace(temp_path, path)
+    _fsync_directory(os.path.dirname(os.path.abspath(path)))
+
+def _fsync_directory(directory):
+    """
+    Vuelca a disco la entrada del directorio (para que el rename sobreviva
+    a un corte de luz). En Windows no se puede abrir un directorio y se omite.
+
+    Args:
+        directory (str): Directorio del fichero
+    """
+    if os.name == "nt":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def read_json_with_backup(path, validate):
+    """
+    Lee un JSON validando su contenido; si falta, está corrupto o no pasa
+    la validación, lo intenta con la copia de seguridad (.bak). Un fichero
+    principal corrupto se aparta como .corrupt, para que la siguiente
+    escritura no lo convierta en la copia de seguridad.
+
+    Args:
+        path (str): Fichero a leer
+        validate (callable): Recibe los datos leídos y devuelve los datos
+            válidos, o lanza ValueError si no sirven
+
+    Returns:
+        tuple: (datos, origen), con origen "main", "backup" o None si no
+            se pudo leer ninguno de los dos
+    """
+    for source, candidate in (("main", path), ("backup", path + ".bak")):
+        if not os.path.exists(candidate):
+            continue
+        try:
+            with open(candidate, "r", encoding="utf-8") as file:
+                return validate(json.load(file)), source
+        except (json.JSONDecodeError, UnicodeDecodeError, ValueError, IOError, OSError) as e:
+            logging.error(f"Fichero de datos no válido '{candidate}': {e}")
+            if source == "main":
+                try:
+                    os.replace(path, path + ".corrupt")
+                except OSError:
+                    pass
+    return None, None
+
+class JsonWriter:
+    """
+    Escritor de un fichero JSON en un hilo propio. Quien guarda solo deja
+    una copia de los datos y sigue (nunca espera al disco); el hilo escribe
+    con atomic_write_json. Si llegan varios guardados mientras escribe,
+    solo se escribe el último (los intermedios ya estarían obsoletos).
+    """
+
+    def __init__(self, path):
+        """
+        Inicializa el escritor (el hilo arranca con el primer guardado).
+
+        Args:
+            path (str): Fichero de destino
+        """
+        self.path: str = path
+        self.writes = 0
+
+        self._condition = threading.Condition()
+        self._pending = None
+        self._has_pending = False
+        self._writing = False
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    def submit(self, data):
+        """
+        Programa la escritura de los datos (se copian en el momento).
+
+        Args:
+            data (object): Datos serializables a JSON
+        """
+        snapshot = copy.deepcopy(data)
+        with self._condition:
+            self._pending = snapshot
+            self._has_pending = True
+            if self._thread is None:
+                self._stopping = False
+                self._thread = threading.Thread(target=self._run, name="json-writer", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self, timeout=None):
+        """
+        Espera a que se escriba todo lo programado.
+
+        Args:
+            timeout (float, opcional): Espera máxima en segundos
+
+        Returns:
+            bool: True si no queda nada pendiente
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._has_pending and not self._writing, timeout)
+
+    def close(self):
+        """Escribe lo pendiente y detiene el hilo."""
+        with self._condition:
+            if self._thread is None:
+                return
+            self._stopping = True
+            self._condition.notify_all()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        """Bucle del hilo: escribe la última versión programada."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._has_pending or self._stopping)
+                if not self._has_pending:
+                    return
+                data = self._pending
+                self._pending = None
+                self._has_pending = False
+                self._writing = True
+
+            try:
+                atomic_write_json(self.path, data)
+                self.writes += 1
+            except (IOError, OSError, TypeError, ValueError) as e:
+                logging.error(f"Error al guardar '{self.path}': {e}")
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
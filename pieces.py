@@ -2,7 +2,7 @@
 # Módulo para manejar las piezas de Tetris
 
 import random
-from constants import COLORS, SHAPES
+from constants import COLORS, SHAPES, SHAPE_INDICES
 
 class Piece:
     """
@@ -28,6 +28,7 @@ class Piece:
         # Establecer la forma y el color de la pieza
         self.shape: list[list[list[int]]] = SHAPES[self.shape_name]
         self.color: tuple[int, int, int] = COLORS[self.shape_name]
+        self.color_index: int = SHAPE_INDICES[self.shape_name]
         
         # Establecer la rotación inicial (0, 90, 180 o 270 grados)
         self.rotation = 0
@@ -110,6 +111,9 @@ class PieceGenerator:
         self.queue_size: int = queue_size
         self.next_pieces = []
         
+        # Copia de la cola para la vista previa; solo se rehace cuando la cola cambia
+        self._preview: tuple | None = None
+        
         # Inicializar la cola de piezas
         self._refill_queue()
         
@@ -131,6 +135,7 @@ class PieceGenerator:
         """
         # Obtener la primera pieza de la cola
         next_piece = self.next_pieces.pop(0)
+        self._preview = None
         
         # Regenerar la posición inicial correcta para la pieza
         from constants import GRID_WIDTH
@@ -145,9 +150,13 @@ class PieceGenerator:
     def peek_next_pieces(self):
         """
         Muestra las siguientes piezas sin sacarlas de la cola.
+        La copia se reutiliza mientras la cola no cambie, así que llamarla
+        en cada frame no asigna memoria.
         
         Returns:
-            list: Lista de las siguientes piezas en la cola.
+            tuple: Las siguientes piezas en la cola.
         """
-        return self.next_pieces.copy()
+        if self._preview is None:
+            self._preview = tuple(self.next_pieces)
+        return self._preview
 
@@ -0,0 +1,123 @@
+# profiler.py
+# Módulo para perfilar una sesión de juego separando los resultados por estado
+
+import os
+import sys
+import io
+import pstats
+import logging
+import cProfile
+import threading
+from collections import Counter, defaultdict
+
+from hitch_watchdog import collapse_stack
+
+class StateProfiler:
+    """
+    Perfilador de una sesión completa, con los resultados separados por
+    estado del juego (MENU, PLAYING, PAUSED, ...).
+
+    Con cProfile hay un perfil por estado y el bucle principal activa el
+    del estado actual al empezar cada frame; se guarda como .pstats. El
+    muestreador (mucho más ligero) toma la pila del hilo principal cada
+    milisegundo y acumula las pilas colapsadas por estado, listas para
+    flamegraph.pl o speedscope.
+    """
+
+    def __init__(self, output_dir="profiles", mode="all", sample_interval_ms=1.0):
+        """
+        Inicializa el perfilador (sin arrancarlo).
+
+        Args:
+            output_dir (str): Carpeta donde se guardan los resultados
+            mode (str): "cprofile", "sampling" o "all" (ambos)
+            sample_interval_ms (float): Intervalo del muestreador
+        """
+        self.output_dir: str = output_dir
+        self.use_cprofile: bool = mode in ("all", "cprofile")
+        self.use_sampling: bool = mode in ("all", "sampling")
+        self.sample_interval: float = sample_interval_ms / 1000
+
+        self.state: str | None = None
+        self.profiles: dict[str, cProfile.Profile] = {}
+        self.samples: defaultdict[str, Counter] = defaultdict(Counter)
+
+        self._main_ident: int | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        """Arranca el perfilador. Debe llamarse desde el hilo principal."""
+        self._main_ident = threading.get_ident()
+        if self.use_sampling:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._sample, name="profiler", daemon=True)
+            self._thread.start()
+        logging.info(f"Perfilador activo, resultados en '{self.output_dir}'")
+
+    def switch(self, state):
+        """
+        Cambia el estado al que se atribuye el tiempo (al inicio de cada frame).
+
+        Args:
+            state (str): Nombre del estado actual del juego
+        """
+        if state == self.state:
+            return
+        if self.use_cprofile:
+            if self.state is not None:
+                self.profiles[self.state].disable()
+            profile = self.profiles.get(state)
+            if profile is None:
+                profile = self.profiles[state] = cProfile.Profile()
+            profile.enable()
+        self.state = state
+
+    def stop(self):
+        """Detiene el perfilador y guarda los resultados."""
+        if self.use_cprofile and self.state is not None:
+            self.profiles[self.state].disable()
+        self.state = None
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.write()
+
+    def _sample(self):
+        """Bucle del muestreador: acumula la pila del hilo principal por estado."""
+        while not self._stop.wait(self.sample_interval):
+            state = self.state
+            if state is None:
+                continue
+            frame = sys._current_frames().get(self._main_ident)
+            if frame is None:
+                continue
+            stack, _ = collapse_stack(frame)
+            del frame
+            self.samples[state][stack] += 1
+
+    def write(self):
+        """
+        Guarda un .pstats y un .collapsed por estado y registra en el log
+        las funciones más costosas de cada uno.
+        """
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            for state, profile in self.profiles.items():
+                path = os.path.join(self.output_dir, f"{state}.pstats")
+                profile.dump_stats(path)
+
+                # Resumen: las 8 funciones con más tiempo acumulado
+                summary = io.StringIO()
+                pstats.Stats(profile, stream=summary).sort_stats("cumulative").print_stats(8)
+                logging.info(f"Perfil de {state} ({path}):\n{summary.getvalue()}")
+
+            for state, stacks in self.samples.items():
+                path = os.path.join(self.output_dir, f"{state}.collapsed")
+                with open(path, "w", encoding="utf-8") as file:
+                    for stack, count in stacks.most_common():
+                        file.write(f"{stack} {count}\n")
+                logging.info(f"Pilas colapsadas de {state}: {sum(stacks.values())} muestras en {path}")
+        except (IOError, OSError) as e:
+            logging.error(f"Error al guardar los resultados del perfilador: {e}")
@@ -0,0 +1,367 @@
+# render_backend.py
+# Módulo con los backends de renderizado de la interfaz del Tetris
+
+import weakref
+import logging
+import pygame
+
+# Modo de mezcla alfa de SDL (SDL_BLENDMODE_BLEND)
+BLENDMODE_BLEND = 1
+
+# Colores de borde ya calculados (la paleta es pequeña y fija)
+_darker_colors: dict[tuple, tuple] = {}
+
+def darker(color):
+    """
+    Calcula el color del borde de un bloque (efecto 3D). El resultado se
+    guarda por color, para no crear una tupla nueva por bloque y frame.
+
+    Args:
+        color (tuple): Color RGB del bloque
+
+    Returns:
+        tuple: Color RGB oscurecido
+    """
+    result = _darker_colors.get(color)
+    if result is None:
+        result = _darker_colors[color] = tuple(max(0, c - 50) for c in color[:3])
+    return result
+
+def render_block(color, size):
+    """
+    Renderiza un bloque (relleno con borde más oscuro) en una superficie nueva.
+
+    Args:
+        color (tuple): Color RGB del bloque
+        size (int): Tamaño del bloque en píxeles
+
+    Returns:
+        pygame.Surface: Superficie con el bloque
+    """
+    block = pygame.Surface((size, size))
+    block.fill(color)
+    pygame.draw.rect(block, darker(color), (0, 0, size, size), 1)
+    return block
+
+class SurfaceBackend:
+    """
+    Backend por software: dibuja con pygame.draw y blits sobre la
+    superficie de la ventana y la muestra con display.flip().
+    """
+
+    name = "surface"
+
+    def __init__(self, size, title):
+        """
+        Crea la ventana del juego.
+
+        Args:
+            size (tuple): Tamaño de la ventana (ancho, alto)
+            title (str): Título de la ventana
+        """
+        pygame.display.set_caption(title)
+        self.surface: pygame.Surface = pygame.display.set_mode(size)
+
+        # Bloques semi-transparentes, por color, tamaño y opacidad
+        self._alpha_blocks: dict[tuple, pygame.Surface] = {}
+
+    def set_icon(self, icon):
+        """
+        Establece el icono de la ventana.
+
+        Args:
+            icon (pygame.Surface): Imagen del icono
+        """
+        pygame.display.set_icon(icon)
+
+    def fill(self, color, rect=None):
+        """
+        Rellena la ventana (o un rectángulo) con un color opaco.
+
+        Args:
+            color (tuple): Color RGB
+            rect (tuple, opcional): Rectángulo a rellenar
+        """
+        self.surface.fill(color, rect)
+
+    def draw_rect(self, color, rect, width=0):
+        """
+        Dibuja un rectángulo.
+
+        Args:
+            color (tuple): Color RGB
+            rect (tuple): Rectángulo (x, y, ancho, alto)
+            width (int): Grosor del borde (0 = relleno)
+        """
+        pygame.draw.rect(self.surface, color, rect, width)
+
+    def draw_block(self, color, x, y, size, alpha=255):
+        """
+        Dibuja un bloque de pieza con su borde oscuro.
+
+        Args:
+            color (tuple): Color RGB del bloque
+            x (int): Posición X en pantalla
+            y (int): Posición Y en pantalla
+            size (int): Tamaño del bloque
+            alpha (int): Opacidad del relleno (el borde siempre es opaco)
+        """
+        if alpha >= 255:
+            pygame.draw.rect(self.surface, color, (x, y, size, size))
+        else:
+            key = (color, size, alpha)
+            block = self._alpha_blocks.get(key)
+            if block is None:
+                block = pygame.Surface((size, size))
+                block.fill(color)
+                block.set_alpha(alpha)
+                self._alpha_blocks[key] = block
+            self.surface.blit(block, (x, y))
+        pygame.draw.rect(self.surface, darker(color), (x, y, size, size), 1)
+
+    def blit(self, surface, dest, alpha=None):
+        """
+        Copia una superficie a la ventana.
+
+        Args:
+            surface (pygame.Surface): Superficie a copiar
+            dest (tuple): Posición de destino (o rectángulo)
+            alpha (int, opcional): Opacidad global de la copia
+        """
+        if alpha is not None:
+            surface.set_alpha(alpha)
+        self.surface.blit(surface, dest)
+
+    def snapshot(self):
+        """
+        Captura el contenido actual de la ventana.
+
+        Returns:
+            pygame.Surface: Copia del frame en curso
+        """
+        return self.surface.copy()
+
+    def frame_surface(self):
+        """
+        Obtiene el frame actual para leerlo (sin copiarlo si es posible).
+
+        Returns:
+            pygame.Surface: Superficie con el frame actual
+        """
+        return self.surface
+
+    def present(self):
+        """Muestra el frame en pantalla."""
+        pygame.display.flip()
+
+class TextureBackend:
+    """
+    Backend basado en texturas de SDL2 (pygame._sdl2.video).
+    Las superficies cacheadas por la interfaz (fondos, paneles, textos) se
+    suben una sola vez como texturas y los bloques salen de un atlas, de
+    modo que cada frame es una lista de copias de texturas. Con
+    software=True usa el renderer por software de SDL (sin GPU).
+    
+    Las superficies que se copian se tratan como inmutables: para cambiar
+    su contenido hay que crear una superficie nueva (la interfaz ya
+    reconstruye sus cachés así), y la textura antigua se libera sola.
+    """
+
+    name = "texture"
+
+    def __init__(self, size, title, software=False, block_colors=(), block_sizes=()):
+        """
+        Crea la ventana y el renderer.
+
+        Args:
+            size (tuple): Tamaño de la ventana (ancho, alto)
+            title (str): Título de la ventana
+            software (bool): Si es True, fuerza el renderer por software
+            block_colors (iterable): Colores a incluir en el atlas de bloques
+            block_sizes (iterable): Tamaños de bloque a incluir en el atlas
+        """
+        from pygame._sdl2.video import Window, Renderer, Texture
+
+        self._texture_class = Texture
+        self.surface = None
+        self.window = Window(title, size)
+        self.renderer = Renderer(self.window, accelerated=0 if software else -1)
+        logging.info(f"Renderer SDL2 creado ({'software' if software else 'acelerado si es posible'})")
+
+        # Texturas de las superficies ya subidas (se liberan con la superficie)
+        self._textures = weakref.WeakKeyDictionary()
+
+        # Atlas de bloques: (color, tamaño) -> rectángulo dentro del atlas
+        self._atlas = None
+        self._atlas_rects: dict[tuple, pygame.Rect] = {}
+        self._extra_blocks: dict[tuple, object] = {}
+        self._build_atlas(list(block_colors), list(block_sizes))
+
+    def _build_atlas(self, colors, sizes):
+        """
+        Renderiza todos los bloques conocidos en una única textura.
+
+        Args:
+            colors (list): Colores RGB de los bloques
+            sizes (list): Tamaños de bloque
+        """
+        if not colors or not sizes:
+            return
+        width = len(colors) * max(sizes)
+        height = sum(sizes)
+        atlas = pygame.Surface((width, height))
+        y = 0
+        for size in sizes:
+            for i, color in enumerate(colors):
+                rect = pygame.Rect(i * max(sizes), y, size, size)
+                atlas.blit(render_block(color, size), rect)
+                self._atlas_rects[(tuple(color), size)] = rect
+            y += size
+        self._atlas = self._texture_class.from_surface(self.renderer, atlas)
+        self._atlas.blend_mode = BLENDMODE_BLEND  # Permite la opacidad de la pieza fantasma
+
+    def _texture(self, surface):
+        """
+        Obtiene la textura de una superficie, subiéndola la primera vez.
+
+        Args:
+            surface (pygame.Surface): Superficie de origen
+
+        Returns:
+            Texture: Textura asociada a la superficie
+        """
+        texture = self._textures.get(surface)
+        if texture is None:
+            texture = self._texture_class.from_surface(self.renderer, surface)
+            self._textures[surface] = texture
+        return texture
+
+    def set_icon(self, icon):
+        """
+        Establece el icono de la ventana.
+
+        Args:
+            icon (pygame.Surface): Imagen del icono
+        """
+        self.window.set_icon(icon)
+
+    def fill(self, color, rect=None):
+        """
+        Rellena la ventana (o un rectángulo) con un color.
+
+        Args:
+            color (tuple): Color RGB o RGBA
+            rect (tuple, opcional): Rectángulo a rellenar
+        """
+        self.renderer.draw_color = tuple(color[:3]) + (color[3] if len(color) > 3 else 255,)
+        if rect is None:
+            self.renderer.clear()
+        else:
+            self.renderer.fill_rect(rect)
+
+    def draw_rect(self, color, rect, width=0):
+        """
+        Dibuja un rectángulo.
+
+        Args:
+            color (tuple): Color RGB
+            rect (tuple): Rectángulo (x, y, ancho, alto)
+            width (int): Grosor del borde (0 = relleno)
+        """
+        self.renderer.draw_color = tuple(color[:3]) + (255,)
+        if width <= 0:
+            self.renderer.fill_rect(rect)
+            return
+        x, y, w, h = rect
+        for i in range(width):
+            self.renderer.draw_rect((x + i, y + i, w - 2 * i, h - 2 * i))
+
+    def draw_block(self, color, x, y, size, alpha=255):
+        """
+        Dibuja un bloque de pieza copiándolo del atlas.
+
+        Args:
+            color (tuple): Color RGB del bloque
+            x (int): Posición X en pantalla
+            y (int): Posición Y en pantalla
+            size (int): Tamaño del bloque
+            alpha (int): Opacidad del relleno (el borde siempre es opaco)
+        """
+        key = (tuple(color[:3]), size)
+        rect = self._atlas_rects.get(key)
+        if rect is not None:
+            texture = self._atlas
+        else:
+            # Bloque no previsto en el atlas: textura propia (una sola vez)
+            texture = self._extra_blocks.get(key)
+            if texture is None:
+                texture = self._texture_class.from_surface(self.renderer, render_block(color, size))
+                texture.blend_mode = BLENDMODE_BLEND
+                self._extra_blocks[key] = texture
+            rect = None
+
+        if alpha < 255:
+            texture.alpha = alpha
+            texture.draw(srcrect=rect, dstrect=(x, y, size, size))
+            texture.alpha = 255
+            # El borde se mantiene opaco, como en el backend por software
+            self.draw_rect(darker(color), (x, y, size, size), 1)
+        else:
+            texture.draw(srcrect=rect, dstrect=(x, y, size, size))
+
+    def blit(self, surface, dest, alpha=None):
+        """
+        Copia una superficie a la ventana a través de su textura.
+
+        Args:
+            surface (pygame.Surface): Superficie a copiar
+            dest (tuple): Posición de destino (o rectángulo)
+            alpha (int, opcional): Opacidad global de la copia
+        """
+        texture = self._texture(surface)
+        if alpha is not None:
+            texture.alpha = alpha
+        texture.draw(dstrect=(dest[0], dest[1], texture.width, texture.height))
+
+    def snapshot(self):
+        """
+        Captura el contenido actual del renderer.
+
+        Returns:
+            pygame.Surface: Copia del frame en curso
+        """
+        return self.renderer.to_surface()
+
+    def frame_surface(self):
+        """
+        Obtiene el frame actual para leerlo (lectura desde el renderer).
+
+        Returns:
+            pygame.Surface: Superficie con el frame actual
+        """
+        return self.renderer.to_surface()
+
+    def present(self):
+        """Muestra el frame en pantalla."""
+        self.renderer.present()
+
+def create_backend(name, size, title, software=False, block_colors=(), block_sizes=()):
+    """
+    Crea el backend de renderizado indicado.
+
+    Args:
+        name (str): "surface" (por defecto) o "texture"
+        size (tuple): Tamaño de la ventana (ancho, alto)
+        title (str): Título de la ventana
+        software (bool): Si es True, el backend de texturas usa el renderer por software
+        block_colors (iterable): Colores a precargar en el atlas de bloques
+        block_sizes (iterable): Tamaños a precargar en el atlas de bloques
+
+    Returns:
+        SurfaceBackend | TextureBackend: Backend creado
+    """
+    if name == "texture":
+        return TextureBackend(size, title, software, block_colors, block_sizes)
+    if name != "surface":
+        raise ValueError(f"Backend de renderizado desconocido: {name}")
+    return SurfaceBackend(size, title)
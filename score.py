@@ -1,15 +1,124 @@
 # score.py
 # Módulo para manejar el sistema de puntuación y récords del Tetris
 
-import json
-import os
+import bisect
 import datetime
 import logging
 
+from persistence import JsonWriter, read_json_with_backup
+
+# Campos de cada récord y su tipo
+HIGHSCORE_FIELDS: dict[str, type] = {
+    "player": str,
+    "score": int,
+    "level": int,
+    "lines": int,
+    "date": str,
+}
+
+# Formato de la fecha de los récords (ordena igual como texto que como fecha)
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+def validate_highscores(data):
+    """
+    Valida los récords leídos de disco. Las entradas mal formadas se
+    descartan (y se registran); si los datos no son una lista, no sirven.
+    
+    Args:
+        data (object): Datos leídos del JSON
+        
+    Returns:
+        list: Récords válidos, ordenados por puntuación
+        
+    Raises:
+        ValueError: Si los datos no son una lista de récords
+    """
+    if not isinstance(data, list):
+        raise ValueError("los récords no son una lista")
+    
+    valid = []
+    for entry in data:
+        if is_valid_highscore(entry):
+            valid.append(entry)
+        else:
+            logging.warning(f"Récord descartado por no ser válido: {entry!r}")
+    
+    valid.sort(key=lambda x: x["score"], reverse=True)
+    return valid
+
+def is_valid_highscore(entry):
+    """
+    Comprueba que un récord tiene todos los campos con su tipo.
+    
+    Args:
+        entry (object): Récord leído de disco
+        
+    Returns:
+        bool: True si el récord es válido
+    """
+    return (
+        isinstance(entry, dict)
+        and all(
+            isinstance(entry.get(field), kind) and not isinstance(entry.get(field), bool)
+            for field, kind in HIGHSCORE_FIELDS.items()
+        )
+        and entry["score"] >= 0
+    )
+
+def make_highscore(player_name, score, level, lines):
+    """
+    Crea un récord con la fecha y hora actuales.
+    
+    Args:
+        player_name (str): Nombre del jugador
+        score (int): Puntuación
+        level (int): Nivel alcanzado
+        lines (int): Líneas eliminadas
+        
+    Returns:
+        dict: Récord con los campos de HIGHSCORE_FIELDS
+    """
+    return {
+        "player": player_name,
+        "score": score,
+        "level": level,
+        "lines": lines,
+        "date": datetime.datetime.now().strftime(DATE_FORMAT)
+    }
+
+def format_points(score):
+    """
+    Formatea una puntuación con puntos como separadores de miles.
+    
+    Args:
+        score (int): Puntuación
+        
+    Returns:
+        str: Puntuación formateada
+    """
+    return f"{score:,}".replace(",", ".")
+
+def _rank_key(entry):
+    """
+    Clave de orden de los récords (de mayor a menor puntuación).
+    
+    Args:
+        entry (dict): Récord
+        
+    Returns:
+        int: Puntuación cambiada de signo
+    """
+    return -entry["score"]
+
 class ScoreManager:
     """
     Clase que gestiona el sistema de puntuación y récords del juego.
     Maneja la carga, guardado y actualización de puntuaciones.
+    
+    Los récords se mantienen siempre ordenados (de mayor a menor): cada
+    inserción busca su posición con bisect, y la puntuación más alta y la
+    mínima para entrar en la tabla se guardan al cambiar los récords, así
+    que las consultas de cada frame no recorren la lista.
     """
     
     def __init__(self, highscore_file="highscores.json", max_records=10):
@@ -25,43 +134,77 @@ class ScoreManager:
         self.current_score: int = 0
         self.highscores: list[dict] = []
         
+        # Versión de los récords (aumenta cada vez que cambian)
+        self.version = 0
+        
+        # Consultas cacheadas (se actualizan solo al cambiar los récords)
+        self._top_score = 0
+        self._cutoff: int | None = None
+        self._rankings: tuple = ()
+        
+        # Escritura en segundo plano (atómica, con copia de seguridad)
+        self._writer = JsonWriter(self.highscore_file)
+        
+        # Clasificación global (LeaderboardClient), opcional
+        self.leaderboard = None
+        
         # Cargar puntuaciones previas
         self.load_highscores()
     
     def load_highscores(self):
         """
-        Carga las puntuaciones máximas desde el archivo JSON.
-        Si el archivo no existe o está corrupto, inicializa una lista vacía.
-        """
-        try:
-            if os.path.exists(self.highscore_file):
-                with open(self.highscore_file, 'r') as file:
-                    self.highscores = json.load(file)
-                    # Verificar estructura
-                    if not isinstance(self.highscores, list):
-                        self.highscores = []
-            else:
-                self.highscores = []
-                
-        except (json.JSONDecodeError, IOError) as e:
-            logging.error(f"Error al cargar puntuaciones: {e}")
+        Carga las puntuaciones máximas desde el archivo JSON, validando su
+        contenido. Si el archivo está corrupto se recuperan las de la copia
+        de seguridad (y se reescribe el archivo); si no hay ninguno válido,
+        se empieza con una lista vacía.
+        """
+        highscores, source = read_json_with_backup(self.highscore_file, validate_highscores)
+        if source is None:
             self.highscores = []
+        else:
+            # validate_highscores ya los devuelve ordenados
+            self.highscores = highscores[:self.max_records]
+            if source == "backup":
+                logging.warning(f"Puntuaciones recuperadas de la copia de seguridad de {self.highscore_file}")
+                self.save_highscores()
+        
+        self._records_changed()
     
-    def save_highscores(self):
+    def _records_changed(self):
+        """
+        Actualiza las consultas cacheadas y la versión tras cambiar los récords.
         """
-        Guarda las puntuaciones máximas en el archivo JSON.
-        Maneja errores de escritura y permisos.
+        self._top_score = self.highscores[0]["score"] if self.highscores else 0
+        # Con la tabla llena, hay que superar la última puntuación para entrar
+        self._cutoff = self.highscores[-1]["score"] if len(self.highscores) >= self.max_records else None
+        self._rankings = tuple(self.highscores)
+        self.version += 1
+    
+    def save_highscores(self, wait=False):
+        """
+        Guarda las puntuaciones máximas en el archivo JSON. La escritura se
+        hace en segundo plano (ver persistence.JsonWriter), así que no
+        bloquea el bucle del juego; los errores se registran en el log.
         
+        Args:
+            wait (bool): Si es True, espera a que los datos estén en disco
+            
         Returns:
-            bool: True si se guardó correctamente, False en caso contrario
-        """
-        try:
-            with open(self.highscore_file, 'w') as file:
-                json.dump(self.highscores, file, indent=4)
-            return True
-        except (IOError, OSError) as e:
-            logging.error(f"Error al guardar puntuaciones: {e}")
-            return False
+            bool: True si se programó (o, con wait, se completó) el guardado
+        """
+        self._writer.submit(self.highscores)
+        if wait:
+            return self._writer.flush()
+        return True
+    
+    def close(self):
+        """
+        Termina las escrituras pendientes y detiene el escritor y el
+        cliente de la clasificación global (al salir).
+        """
+        self._writer.close()
+        if self.leaderboard is not None:
+            self.leaderboard.close()
     
     def update_score(self, points):
         """
@@ -98,9 +241,7 @@ class ScoreManager:
         Returns:
             int: Puntuación más alta o 0 si no hay récords
         """
-        if not self.highscores:
-            return 0
-        return max(entry["score"] for entry in self.highscores)
+        return self._top_score
     
     def is_highscore(self, score=None):
         """
@@ -115,13 +256,9 @@ class ScoreManager:
         if score is None:
             score = self.current_score
             
-        # Si no hay suficientes récords, cualquier puntuación es récord
-        if len(self.highscores) < self.max_records:
-            return True
-            
-        # Verificar si la puntuación supera el récord más bajo
-        lowest_score = min(entry["score"] for entry in self.highscores)
-        return score > lowest_score
+        # Si no hay suficientes récords, cualquier puntuación es récord;
+        # si no, tiene que superar el récord más bajo
+        return self._cutoff is None or score > self._cutoff
     
     def add_highscore(self, player_name, score=None, level=1, lines=0):
         """
@@ -144,35 +281,53 @@ class ScoreManager:
             return False
             
         # Crear entrada de récord
-        timestamp: str = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        new_entry = {
-            "player": player_name,
-            "score": score,
-            "level": level,
-            "lines": lines,
-            "date": timestamp
-        }
-        
-        # Añadir a la lista
-        self.highscores.append(new_entry)
-        
-        # Ordenar y limitar
-        self.highscores.sort(key=lambda x: x["score"], reverse=True)
+        new_entry: dict = make_highscore(player_name, score, level, lines)
+        
+        # Insertar en orden (detrás de las puntuaciones iguales) y limitar
+        bisect.insort_right(self.highscores, new_entry, key=_rank_key)
         if len(self.highscores) > self.max_records:
-            self.highscores = self.highscores[:self.max_records]
+            del self.highscores[self.max_records:]
+        self._records_changed()
             
-        # Guardar
+        # Guardar (y enviar a la clasificación global)
         self.save_highscores()
+        if self.leaderboard is not None:
+            self.leaderboard.submit(new_entry)
         return True
     
     def get_rankings(self):
         """
-        Obtiene la lista de rankings ordenada por puntuación.
+        Obtiene la lista de rankings ordenada por puntuación: la global si
+        hay un servidor de clasificación que ya ha respondido, o la local.
+        
+        Returns:
+            tuple: Diccionarios con las puntuaciones (no se copia en cada llamada)
+        """
+        if self.leaderboard is not None and self.leaderboard.top is not None:
+            return self.leaderboard.top
+        return self._rankings
+    
+    def rankings_are_global(self):
+        """
+        Indica si get_rankings() devuelve la clasificación global. El
+        récord de la partida (get_highscore, is_highscore) es siempre el
+        local, así que la pantalla de rankings debe indicarlo.
+        
+        Returns:
+            bool: True si la clasificación es la del servidor
+        """
+        return self.leaderboard is not None and self.leaderboard.top is not None
+    
+    def rankings_version(self):
+        """
+        Obtiene una clave que cambia cada vez que cambia get_rankings().
         
         Returns:
-            list: Lista de diccionarios con las puntuaciones
+            tuple: Versión de los récords locales y de la clasificación global
         """
-        return sorted(self.highscores, key=lambda x: x["score"], reverse=True)
+        if self.leaderboard is None:
+            return self.version, 0
+        return self.version, self.leaderboard.version, self.leaderboard.top is None
     
     def format_score(self, score=None):
         """
@@ -187,5 +342,4 @@ class ScoreManager:
         if score is None:
             score = self.current_score
             
-        # Formatear con separadores de miles
-        return f"{score:,}".replace(",", ".")
+        return format_points(score)
@@ -0,0 +1,314 @@
+# score_db.py
+# Módulo con los récords guardados en una base de datos SQLite (historial completo)
+
+import os
+import json
+import sqlite3
+import logging
+import datetime
+
+from score import ScoreManager, DATE_FORMAT, make_highscore, validate_highscores
+
+# Base de datos por defecto
+DB_FILE = "highscores.db"
+
+# Esquema: una fila por récord (el id conserva el orden de llegada, que
+# desempata las puntuaciones iguales) e índices para cada tipo de consulta
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    lines INTEGER NOT NULL,
+    date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC);
+CREATE INDEX IF NOT EXISTS scores_by_player ON scores (player, score DESC);
+CREATE INDEX IF NOT EXISTS scores_by_date ON scores (date);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Columnas de un récord, en el orden de las consultas
+COLUMNS = "player, score, level, lines, date"
+
+# Periodos de las clasificaciones por fecha
+PERIODS = ("daily", "weekly")
+
+def period_bounds(period, now=None):
+    """
+    Calcula el intervalo de fechas de una clasificación por periodo.
+
+    Args:
+        period (str): "daily" (hoy) o "weekly" (desde el lunes de esta semana)
+        now (datetime.datetime, opcional): Momento de referencia (por defecto, ahora)
+
+    Returns:
+        tuple: (inicio, fin) como texto en DATE_FORMAT; el fin no se incluye
+
+    Raises:
+        ValueError: Si el periodo no existe
+    """
+    if now is None:
+        now = datetime.datetime.now()
+    start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    if period == "daily":
+        end = start + datetime.timedelta(days=1)
+    elif period == "weekly":
+        start -= datetime.timedelta(days=start.weekday())
+        end = start + datetime.timedelta(days=7)
+    else:
+        raise ValueError(f"Periodo desconocido: {period} (usar {', '.join(PERIODS)})")
+    return start.strftime(DATE_FORMAT), end.strftime(DATE_FORMAT)
+
+class SqliteScoreManager(ScoreManager):
+    """
+    Gestor de puntuaciones que guarda todo el historial en SQLite en lugar
+    de los 10 mejores en highscores.json. Cada partida terminada es una
+    fila nueva, sea récord o no (inserción O(log n) en los índices, sin
+    reescribir el fichero), y la
+    base de datos usa WAL, así que confirmar una inserción no espera a
+    vaciar el fichero entero a disco.
+
+    La tabla del juego (highscores, get_rankings) sigue siendo la de los
+    max_records mejores, cacheada como en ScoreManager; además hay
+    consultas paginadas del historial, la mejor puntuación de cada
+    jugador y clasificaciones diarias y semanales de las partidas.
+
+    La primera vez se importan los récords de highscores.json (o de su
+    copia .bak si el principal no es válido); los ficheros no se modifican.
+    """
+
+    def __init__(self, db_file=DB_FILE, highscore_file="highscores.json", max_records=10):
+        """
+        Abre (o crea) la base de datos y carga la tabla de récords.
+
+        Args:
+            db_file (str): Fichero de la base de datos
+            highscore_file (str): highscores.json a importar la primera vez
+            max_records (int): Récords de la tabla del juego y de cada página
+
+        Raises:
+            sqlite3.Error: Si no se puede abrir la base de datos
+        """
+        self.db_file: str = db_file
+        self._connection: sqlite3.Connection = sqlite3.connect(db_file)
+        self._connection.row_factory = sqlite3.Row
+        journal_mode = self._connection.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        if journal_mode != "wal":
+            logging.warning(f"La base de datos '{db_file}' no admite WAL (modo {journal_mode})")
+        # Con WAL, NORMAL solo sincroniza el disco en los checkpoints
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.executescript(SCHEMA)
+
+        super().__init__(highscore_file, max_records)
+
+    def load_highscores(self):
+        """
+        Importa highscores.json si es la primera vez y carga la tabla de récords.
+        """
+        self._migrate_json()
+        self._refresh()
+
+    def _migrate_json(self):
+        """
+        Importa los récords de highscores.json (una sola vez) en una transacción.
+        """
+        if self._get_meta("json_migrated") is not None:
+            return
+
+        highscores = self._read_json()
+        with self._connection:
+            # Ya vienen ordenados: el id mantiene su orden en los empates
+            self._connection.executemany(
+                f"INSERT INTO scores ({COLUMNS}) VALUES (:player, :score, :level, :lines, :date)",
+                highscores
+            )
+            self._connection.execute(
+                "INSERT INTO meta (key, value) VALUES ('json_migrated', ?)",
+                (datetime.datetime.now().strftime(DATE_FORMAT),)
+            )
+        if highscores:
+            logging.info(f"Importados {len(highscores)} récords de {self.highscore_file} a {self.db_file}")
+
+    def _read_json(self):
+        """
+        Lee los récords a importar de highscores.json o, si no es válido,
+        de su copia .bak. Solo se leen: un fichero corrupto no se aparta
+        (eso lo hace ScoreManager al usarlo).
+
+        Returns:
+            list: Récords válidos, o una lista vacía si no hay ninguno
+        """
+        for path in (self.highscore_file, self.highscore_file + ".bak"):
+            if not os.path.exists(path):
+                continue
+            try:
+                with open(path, "r", encoding="utf-8") as file:
+                    return validate_highscores(json.load(file))
+            except (json.JSONDecodeError, UnicodeDecodeError, ValueError, OSError) as e:
+                logging.error(f"No se pueden importar los récords de '{path}': {e}")
+        return []
+
+    def _get_meta(self, key):
+        """
+        Lee un valor de la tabla meta.
+
+        Args:
+            key (str): Clave
+
+        Returns:
+            str: Valor, o None si no existe
+        """
+        row = self._connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _refresh(self):
+        """
+        Vuelve a leer la tabla de récords (y su caché) tras un cambio.
+        """
+        self.highscores = self.get_top(self.max_records)
+        self._records_changed()
+
+    def save_highscores(self, wait=False):
+        """
+        No hace nada: cada récord se confirma en la base de datos al añadirlo.
+
+        Args:
+            wait (bool): Sin efecto (se mantiene por compatibilidad)
+
+        Returns:
+            bool: Siempre True
+        """
+        return True
+
+    def close(self):
+        """
+        Cierra la base de datos y el cliente de la clasificación global (al salir).
+        """
+        self._connection.close()
+        super().close()
+
+    def add_highscore(self, player_name, score=None, level=1, lines=0):
+        """
+        Añade una partida terminada al historial. Se guardan todas; solo
+        las que son récord cambian la tabla del juego y se envían a la
+        clasificación global.
+
+        Args:
+            player_name (str): Nombre del jugador
+            score (int, opcional): Puntuación. Si es None, se usa la puntuación actual.
+            level (int): Nivel alcanzado
+            lines (int): Líneas eliminadas
+
+        Returns:
+            bool: True si se añadió como récord, False en caso contrario
+        """
+        if score is None:
+            score = self.current_score
+        is_highscore = self.is_highscore(score)
+
+        new_entry: dict = make_highscore(player_name, score, level, lines)
+        try:
+            with self._connection:
+                self._connection.execute(
+                    f"INSERT INTO scores ({COLUMNS}) VALUES (:player, :score, :level, :lines, :date)",
+                    new_entry
+                )
+        except sqlite3.Error as e:
+            logging.error(f"Error al guardar la partida en '{self.db_file}': {e}")
+            return False
+
+        if not is_highscore:
+            return False
+        self._refresh()
+        if self.leaderboard is not None:
+            self.leaderboard.submit(new_entry)
+        return True
+
+    def count(self):
+        """
+        Obtiene el número de partidas del historial.
+
+        Returns:
+            int: Partidas guardadas
+        """
+        return self._connection.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def get_top(self, limit=10, offset=0):
+        """
+        Obtiene una página de las mejores puntuaciones de todo el historial.
+
+        Args:
+            limit (int): Récords por página
+            offset (int): Récords a saltar (página * limit)
+
+        Returns:
+            list: Diccionarios con las puntuaciones, de mayor a menor
+        """
+        rows = self._connection.execute(
+            f"SELECT {COLUMNS} FROM scores ORDER BY score DESC, id LIMIT ? OFFSET ?",
+            (limit, offset)
+        )
+        return [dict(row) for row in rows]
+
+    def get_player_best(self, player_name):
+        """
+        Obtiene la mejor puntuación de un jugador.
+
+        Args:
+            player_name (str): Nombre del jugador
+
+        Returns:
+            dict: Su mejor récord, o None si no tiene ninguno
+        """
+        row = self._connection.execute(
+            f"SELECT {COLUMNS} FROM scores WHERE player = ? ORDER BY score DESC, id LIMIT 1",
+            (player_name,)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def get_player_bests(self, limit=10, offset=0):
+        """
+        Obtiene una página de la clasificación por jugadores (el mejor
+        récord de cada uno).
+
+        Args:
+            limit (int): Jugadores por página
+            offset (int): Jugadores a saltar
+
+        Returns:
+            list: Diccionarios con el mejor récord de cada jugador, de mayor a menor
+        """
+        # Con MAX(), SQLite toma el resto de columnas de la fila del máximo
+        rows = self._connection.execute(
+            "SELECT player, MAX(score) AS score, level, lines, date FROM scores "
+            "GROUP BY player ORDER BY score DESC, MIN(id) LIMIT ? OFFSET ?",
+            (limit, offset)
+        )
+        return [dict(row) for row in rows]
+
+    def get_leaderboard(self, period="daily", limit=10, offset=0, now=None):
+        """
+        Obtiene una página de la clasificación de un periodo.
+
+        Args:
+            period (str): "daily" (hoy) o "weekly" (esta semana, desde el lunes)
+            limit (int): Récords por página
+            offset (int): Récords a saltar
+            now (datetime.datetime, opcional): Momento de referencia (por defecto, ahora)
+
+        Returns:
+            list: Diccionarios con las puntuaciones del periodo, de mayor a menor
+        """
+        start, end = period_bounds(period, now)
+        rows = self._connection.execute(
+            f"SELECT {COLUMNS} FROM scores WHERE date >= ? AND date < ? "
+            "ORDER BY score DESC, id LIMIT ? OFFSET ?",
+            (start, end, limit, offset)
+        )
+        return [dict(row) for row in rows]
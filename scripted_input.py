@@ -0,0 +1,194 @@
+# scripted_input.py
+# Módulo para jugar sesiones reproducibles: entrada grabada o generada por el bot
+
+import json
+import logging
+import pygame
+
+from bot import best_move
+
+class InputRecorder:
+    """
+    Graba los eventos de teclado de una sesión, con el frame en que
+    llegaron, en un fichero JSON Lines. La primera línea guarda la
+    semilla aleatoria para poder reproducir las mismas piezas.
+    """
+
+    def __init__(self, path, seed):
+        """
+        Abre el fichero de grabación.
+
+        Args:
+            path (str): Fichero de destino
+            seed (int): Semilla aleatoria de la sesión
+        """
+        self.path: str = path
+        self._file = open(path, "w", encoding="utf-8")
+        self._file.write(json.dumps({"seed": seed}) + "\n")
+        self.last_frame = 0
+
+    def record(self, frame_index, events):
+        """
+        Graba los eventos de teclado de un frame.
+
+        Args:
+            frame_index (int): Frame en el que se procesan
+            events (list): Eventos de pygame del frame
+        """
+        self.last_frame = frame_index
+        for event in events:
+            if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+                self._file.write(json.dumps({
+                    "frame": frame_index,
+                    "type": "down" if event.type == pygame.KEYDOWN else "up",
+                    "key": event.key,
+                    "unicode": getattr(event, "unicode", ""),
+                }) + "\n")
+
+    def close(self):
+        """Cierra la grabación marcando el último frame de la sesión."""
+        self._file.write(json.dumps({"end": self.last_frame}) + "\n")
+        self._file.close()
+        logging.info(f"Entrada grabada en {self.path} ({self.last_frame} frames)")
+
+class InputReplay:
+    """
+    Reproduce una grabación de InputRecorder: antes de cada frame publica
+    en la cola de pygame los eventos grabados para ese frame, de modo que
+    pasan por el mismo camino que la entrada real.
+    """
+
+    def __init__(self, path):
+        """
+        Carga la grabación.
+
+        Args:
+            path (str): Fichero grabado con InputRecorder
+        """
+        self.seed: int | None = None
+        self.end_frame = 0
+        self.events: dict[int, list[dict]] = {}
+        with open(path, "r", encoding="utf-8") as file:
+            for line in file:
+                entry = json.loads(line)
+                if "seed" in entry:
+                    self.seed = entry["seed"]
+                elif "end" in entry:
+                    self.end_frame = entry["end"]
+                else:
+                    self.events.setdefault(entry["frame"], []).append(entry)
+                    self.end_frame = max(self.end_frame, entry["frame"])
+
+    def before_frame(self, game):
+        """
+        Publica los eventos grabados para el frame actual.
+
+        Args:
+            game (Game): Juego en curso
+        """
+        for entry in self.events.get(game.frame_index, ()):
+            event_type = pygame.KEYDOWN if entry["type"] == "down" else pygame.KEYUP
+            pygame.event.post(pygame.event.Event(event_type, key=entry["key"], unicode=entry["unicode"]))
+        if game.frame_index >= self.end_frame:
+            game.running = False
+
+def _key_event(key, unicode=""):
+    """
+    Publica una pulsación (KEYDOWN seguido de KEYUP) en la cola de pygame.
+
+    Args:
+        key (int): Código de la tecla
+        unicode (str): Carácter asociado
+    """
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, unicode=unicode))
+    pygame.event.post(pygame.event.Event(pygame.KEYUP, key=key, unicode=unicode))
+
+class BotDriver:
+    """
+    Conduce una sesión completa con pulsaciones simuladas: recorre el menú
+    y los rankings, juega con el jugador automático (una tecla cada pocos
+    frames), pausa de vez en cuando y empieza otra partida al perder. Así
+    todos los estados aparecen en los perfiles y, con una semilla fija,
+    la sesión es reproducible.
+    """
+
+    def __init__(self, action_interval=4, pause_every=900, state_frames=60):
+        """
+        Inicializa el conductor.
+
+        Args:
+            action_interval (int): Frames entre dos pulsaciones durante la partida
+            pause_every (int): Frames de partida entre dos pausas
+            state_frames (int): Frames que se pasa en cada pantalla de menú
+        """
+        self.action_interval: int = action_interval
+        self.pause_every: int = pause_every
+        self.state_frames: int = state_frames
+
+        self._state = None
+        self._state_frames = 0
+        self._played_frames = 0
+        self._visited_rankings = False
+        self._piece = None
+        self._target = None
+
+    def before_frame(self, game):
+        """
+        Decide y publica la pulsación de este frame según el estado del juego.
+
+        Args:
+            game (Game): Juego en curso
+        """
+        state = game.state.name
+        if state != self._state:
+            self._state = state
+            self._state_frames = 0
+        self._state_frames += 1
+        waited = self._state_frames >= self.state_frames
+
+        if state == "MENU" and waited:
+            # Primero los rankings y después a jugar
+            if not self._visited_rankings:
+                self._visited_rankings = True
+                _key_event(pygame.K_DOWN)
+            elif game.ui.selected_option != 0:
+                _key_event(pygame.K_UP)
+                return
+            _key_event(pygame.K_RETURN)
+        elif state == "RANKINGS" and waited:
+            _key_event(pygame.K_ESCAPE)
+        elif state == "PAUSED" and waited:
+            _key_event(pygame.K_RETURN)  # Continuar
+        elif state == "GAME_OVER" and waited:
+            # Nueva partida sin pasar por la entrada del nombre
+            game.start_game()
+        elif state == "PLAYING":
+            self._played_frames += 1
+            if self._played_frames % self.pause_every == 0:
+                _key_event(pygame.K_p)
+            elif self._state_frames % self.action_interval == 0:
+                self._play(game)
+
+    def _play(self, game):
+        """
+        Acerca la pieza actual a la jugada del bot con una pulsación.
+
+        Args:
+            game (Game): Juego en curso
+        """
+        piece = game.current_piece
+        if piece is not self._piece:
+            self._piece = piece
+            self._target = best_move(game.board, piece)
+        if self._target is None:
+            _key_event(pygame.K_SPACE)
+            return
+        rotation, x = self._target
+        if piece.rotation != rotation:
+            _key_event(pygame.K_UP)
+        elif piece.x < x:
+            _key_event(pygame.K_RIGHT)
+        elif piece.x > x:
+            _key_event(pygame.K_LEFT)
+        else:
+            _key_event(pygame.K_SPACE)
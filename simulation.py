@@ -0,0 +1,231 @@
+# simulation.py
+# Módulo con la simulación del juego a paso fijo en un hilo propio
+
+import time
+import logging
+import threading
+from collections import deque
+from typing import NamedTuple
+
+from metrics import percentile
+
+# Intervalos entre ticks que se conservan para la estadística final (a
+# 60 ticks por segundo, algo más de un cuarto de hora)
+TICK_HISTORY = 60_000
+
+class BoardSnapshot(NamedTuple):
+    """Copia inmutable del tablero (compatible con GameUI.draw_board)."""
+    grid: bytes
+    version: int
+    score: int
+    level: int
+    lines_cleared: int
+
+class PieceSnapshot(NamedTuple):
+    """Copia inmutable de una pieza (compatible con GameUI.draw_piece)."""
+    shape_name: str
+    shape: list
+    color: tuple
+    rotation: int
+    x: int
+    y: int
+
+class GameSnapshot(NamedTuple):
+    """Estado completo de un tick de la simulación, listo para dibujar."""
+    tick: int
+    time: float
+    state: object
+    board: BoardSnapshot
+    piece: PieceSnapshot
+    new_piece: bool
+    ghost_y: int
+    next_pieces: tuple
+    score: int
+    highscore: int
+
+def _piece_snapshot(piece):
+    """
+    Copia el estado visible de una pieza.
+
+    Args:
+        piece (Piece): Pieza a copiar
+
+    Returns:
+        PieceSnapshot: Copia inmutable de la pieza
+    """
+    return PieceSnapshot(piece.shape_name, piece.shape, piece.color, piece.rotation, piece.x, piece.y)
+
+class SimulationThread:
+    """
+    Ejecuta la lógica de la partida (gravedad, repetición de teclas,
+    fijación de piezas) a un ritmo fijo en un hilo propio, independiente
+    del coste de renderizado.
+
+    Tras cada tick publica una instantánea inmutable del estado. Se guardan
+    dos (la anterior y la actual) y se sustituyen juntas con una sola
+    asignación, de modo que el bucle de render siempre lee un par
+    coherente sin bloquear la simulación y puede interpolar la caída de
+    la pieza entre ambas.
+
+    Los eventos de pygame se siguen leyendo en el hilo principal (SDL lo
+    exige); el juego los aplica con el mismo cerrojo que usa cada tick.
+    """
+
+    def __init__(self, game, tick_rate):
+        """
+        Inicializa la simulación (sin arrancar el hilo).
+
+        Args:
+            game (Game): Juego a simular
+            tick_rate (int): Ticks de simulación por segundo
+        """
+        self.game = game
+        self.interval: float = 1.0 / tick_rate
+        self.tick = 0
+
+        # Par (anterior, actual) de instantáneas publicadas
+        self._snapshots: tuple = (None, None)
+        self._last_piece = None
+        self._last_grid: bytes | None = None
+        self._last_grid_key: tuple | None = None
+
+        # Últimos intervalos reales entre ticks (ms), para medir su
+        # regularidad, y máximo desde el arranque
+        self.tick_intervals: deque[float] = deque(maxlen=TICK_HISTORY)
+        self.max_tick_interval = 0.0
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        """Publica el estado inicial y arranca el hilo de simulación."""
+        self.publish()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+        self._thread.start()
+        logging.info(f"Simulación en hilo propio a {1 / self.interval:.0f} ticks por segundo")
+
+    def stop(self):
+        """Detiene el hilo y registra la regularidad de los ticks."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        intervals = sorted(self.tick_intervals)
+        if intervals:
+            logging.info(
+                f"Simulación: {self.tick} ticks, intervalo medio {sum(intervals) / len(intervals):.3f} ms, "
+                f"p99 {percentile(intervals, 0.99):.3f} ms (últimos {len(intervals)}), "
+                f"máx {self.max_tick_interval:.3f} ms"
+            )
+
+    def _run(self):
+        """
+        Bucle del hilo: ejecuta un tick cada intervalo fijo. Si se acumula
+        mucho retraso, se descarta en lugar de encadenar ticks seguidos.
+        """
+        next_tick = time.perf_counter()
+        last_start = None
+        while not self._stop.is_set():
+            now = time.perf_counter()
+            if now < next_tick:
+                time.sleep(next_tick - now)
+                continue
+
+            if last_start is not None:
+                interval_ms = (now - last_start) * 1000
+                self.tick_intervals.append(interval_ms)
+                if interval_ms > self.max_tick_interval:
+                    self.max_tick_interval = interval_ms
+            last_start = now
+
+            with self.game.state_lock:
+                self.game.simulation_tick()
+                self.tick += 1
+                self._publish_locked(advance=True)
+
+            next_tick += self.interval
+            if now - next_tick > 5 * self.interval:
+                next_tick = now
+
+    def publish(self):
+        """
+        Publica el estado actual sin avanzar la simulación (por ejemplo,
+        tras aplicar la entrada del jugador en el hilo principal).
+        """
+        with self.game.state_lock:
+            self._publish_locked(advance=False)
+
+    def _publish_locked(self, advance):
+        """
+        Crea la instantánea del estado actual. Debe llamarse con el cerrojo
+        del juego adquirido.
+
+        Args:
+            advance (bool): True si viene de un tick (la actual pasa a ser
+                la anterior); False si solo sustituye a la actual
+        """
+        game = self.game
+        board = game.board
+
+        # El tablero solo se copia si ha cambiado
+        grid_key = (id(board), board.version)
+        if grid_key != self._last_grid_key:
+            self._last_grid = bytes(board.grid)
+            self._last_grid_key = grid_key
+
+        piece = game.current_piece
+        new_piece = piece is not self._last_piece
+        self._last_piece = piece
+
+        snapshot = GameSnapshot(
+            tick=self.tick,
+            time=time.perf_counter(),
+            state=game.state,
+            board=BoardSnapshot(self._last_grid, board.version, board.score, board.level, board.lines_cleared),
+            piece=_piece_snapshot(piece),
+            new_piece=new_piece,
+            ghost_y=game._get_ghost_y(),
+            next_pieces=tuple(_piece_snapshot(p) for p in game.piece_generator.peek_next_pieces()),
+            score=game.score_manager.get_current_score(),
+            highscore=game.score_manager.get_highscore()
+        )
+
+        previous, current = self._snapshots
+        if advance or current is None:
+            self._snapshots = (current, snapshot)
+        else:
+            # Mantener el instante del tick para que la interpolación siga
+            self._snapshots = (previous, snapshot._replace(time=current.time, new_piece=current.new_piece or new_piece))
+
+    def snapshots(self):
+        """
+        Obtiene el último par de instantáneas publicadas.
+
+        Returns:
+            tuple: (anterior, actual); la anterior puede ser None
+        """
+        return self._snapshots
+
+    def interpolated_piece_y(self, previous, current, now=None):
+        """
+        Calcula la fila (fraccionaria) en la que dibujar la pieza actual,
+        interpolando la caída entre los dos últimos ticks.
+
+        Args:
+            previous (GameSnapshot): Instantánea anterior (o None)
+            current (GameSnapshot): Instantánea actual
+            now (float, opcional): Instante de render (perf_counter)
+
+        Returns:
+            float: Fila de la pieza
+        """
+        y = current.piece.y
+        if previous is None or current.new_piece or y - previous.piece.y != 1:
+            # Pieza nueva, sin caída o salto (hard drop): sin interpolar
+            return y
+        if now is None:
+            now = time.perf_counter()
+        alpha = min(1.0, max(0.0, (now - current.time) / self.interval))
+        return previous.piece.y + alpha
@@ -0,0 +1,272 @@
+# startup.py
+# Módulo para un arranque en frío rápido: inicialización perezosa de pygame,
+# caché en disco del driver de video y de las fuentes, e informe de tiempos
+
+import os
+import sys
+import json
+import time
+import logging
+from contextlib import contextmanager
+
+import pygame
+
+# Objetivo de tiempo hasta el primer frame del menú (ms)
+STARTUP_TARGET_MS = 300
+
+# Fichero con el último driver de video que funcionó y las rutas de las fuentes
+CACHE_FILE = "startup_cache.json"
+
+class StartupReport:
+    """
+    Mide el tiempo de cada fase del arranque (importaciones, driver de
+    video, ventana, fuentes...) y, al dibujarse el primer frame, registra
+    el desglose y el total desde que empezó el proceso.
+    """
+
+    def __init__(self, target_ms=STARTUP_TARGET_MS):
+        """
+        Inicializa el informe; el tiempo empieza a contar aquí.
+
+        Args:
+            target_ms (float): Objetivo hasta el primer frame
+        """
+        self.target_ms: float = target_ms
+        self.start: float = time.perf_counter()
+        self.phases: list[tuple[str, float]] = []
+        self.reported = False
+        self._last_mark: float = self.start
+
+    def begin(self, start):
+        """
+        Adelanta el inicio del informe (por ejemplo, al principio de main.py,
+        para incluir la importación de pygame).
+
+        Args:
+            start (float): Marca de time.perf_counter() del inicio
+        """
+        self.start = start
+        self._last_mark = start
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Mide una fase del arranque (usar con with).
+
+        Args:
+            name (str): Nombre de la fase
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.phases.append((name, (end - start) * 1000))
+            self._last_mark = end
+
+    def mark(self, name):
+        """
+        Registra como fase el tiempo transcurrido desde la fase anterior.
+
+        Args:
+            name (str): Nombre de la fase
+        """
+        now = time.perf_counter()
+        self.phases.append((name, (now - self._last_mark) * 1000))
+        self._last_mark = now
+
+    def first_frame(self, state_name):
+        """
+        Cierra el informe al presentarse el primer frame (solo la primera vez).
+
+        Args:
+            state_name (str): Estado del juego en ese frame
+        """
+        if self.reported:
+            return
+        self.reported = True
+        self.mark("primer frame")
+        total = (time.perf_counter() - self.start) * 1000
+
+        lines = [f"  {name}: {duration:.1f} ms" for name, duration in self.phases]
+        logging.info(
+            f"Arranque: primer frame ({state_name}) en {total:.1f} ms "
+            f"(objetivo {self.target_ms:.0f} ms)\n" + "\n".join(lines)
+        )
+        if total > self.target_ms:
+            logging.warning(f"El arranque supera el objetivo de {self.target_ms:.0f} ms")
+
+class StartupCache:
+    """
+    Caché en disco de lo que más cuesta resolver al arrancar: el driver de
+    video que funcionó la última vez (se prueba el primero) y la ruta de
+    cada fuente del sistema (evita el escaneo de fuentes de SysFont). Se
+    descarta entera si cambia la plataforma o la versión de pygame.
+    """
+
+    def __init__(self, path=CACHE_FILE):
+        """
+        Inicializa la caché (el fichero se lee al primer uso).
+
+        Args:
+            path (str): Fichero de la caché
+        """
+        self.path: str = path
+        self.signature: str = f"{sys.platform}|{pygame.version.ver}"
+        self._data: dict | None = None
+        self._dirty = False
+
+    def _load(self):
+        """
+        Lee el fichero de la caché (una sola vez).
+
+        Returns:
+            dict: Contenido de la caché
+        """
+        if self._data is None:
+            self._data = {"signature": self.signature, "video_driver": None, "fonts": {}}
+            try:
+                if os.path.exists(self.path):
+                    with open(self.path, "r", encoding="utf-8") as file:
+                        data = json.load(file)
+                    if isinstance(data, dict) and data.get("signature") == self.signature:
+                        self._data.update(data)
+            except (json.JSONDecodeError, IOError, OSError) as e:
+                logging.warning(f"Caché de arranque ignorada: {e}")
+        return self._data
+
+    @property
+    def video_driver(self):
+        """str: Último driver de video que funcionó (o None)."""
+        return self._load()["video_driver"]
+
+    @video_driver.setter
+    def video_driver(self, driver):
+        data = self._load()
+        if data["video_driver"] != driver:
+            data["video_driver"] = driver
+            self._dirty = True
+
+    def get_font(self, key):
+        """
+        Obtiene una fuente resuelta en una ejecución anterior.
+
+        Args:
+            key (str): Nombre y estilo de la fuente
+
+        Returns:
+            list: [ruta (o None para la fuente por defecto), negrita, cursiva],
+                o None si no está en la caché o el fichero ya no existe
+        """
+        entry = self._load()["fonts"].get(key)
+        if entry is None or (entry[0] is not None and not os.path.isfile(entry[0])):
+            return None
+        return entry
+
+    def set_font(self, key, entry):
+        """
+        Guarda la resolución de una fuente.
+
+        Args:
+            key (str): Nombre y estilo de la fuente
+            entry (list): [ruta, negrita, cursiva]
+        """
+        self._load()["fonts"][key] = entry
+        self._dirty = True
+
+    def save(self):
+        """Escribe la caché en disco si ha cambiado."""
+        if not self._dirty:
+            return
+        try:
+            with open(self.path, "w", encoding="utf-8") as file:
+                json.dump(self._data, file, indent=4)
+            self._dirty = False
+        except (IOError, OSError) as e:
+            logging.warning(f"No se pudo guardar la caché de arranque: {e}")
+
+# Informe y caché del proceso (el informe empieza a contar al importar el módulo)
+report = StartupReport()
+cache = StartupCache()
+
+def init_video(drivers):
+    """
+    Inicializa el subsistema de video con el primer driver que funcione,
+    probando antes el que funcionó en la ejecución anterior.
+
+    Args:
+        drivers (list): Drivers candidatos, en orden de preferencia
+
+    Returns:
+        str: Driver inicializado, o None si ninguno funciona
+    """
+    cached = cache.video_driver
+    if cached in drivers:
+        drivers = [cached] + [driver for driver in drivers if driver != cached]
+
+    with report.phase("driver de video"):
+        for driver in drivers:
+            try:
+                os.environ["SDL_VIDEODRIVER"] = driver
+                pygame.display.init()
+                logging.info(f"Driver de video '{driver}' inicializado correctamente")
+                cache.video_driver = driver
+                return driver
+            except pygame.error:
+                logging.warning(f"No se pudo inicializar el driver '{driver}'")
+                pygame.display.quit()
+    return None
+
+def init_pygame():
+    """
+    Inicializa solo los módulos de pygame que el juego usa siempre (video,
+    temporizador y fuentes), en lugar de pygame.init(), que abre también
+    el dispositivo de audio y los joysticks. Se puede llamar varias veces.
+    """
+    if not pygame.display.get_init():
+        pygame.display.init()
+
+    # pygame.time.get_ticks() devuelve 0 hasta que se inicializa el
+    # temporizador de SDL, y pygame no tiene una función para hacerlo
+    # aparte: programar (y cancelar) un temporizador lo inicializa
+    if pygame.time.get_ticks() == 0:
+        pygame.time.set_timer(pygame.USEREVENT, 1000)
+        pygame.time.set_timer(pygame.USEREVENT, 0)
+
+    if not pygame.font.get_init():
+        pygame.font.init()
+
+def sys_font(name, size, bold=False, italic=False):
+    """
+    Equivalente a pygame.font.SysFont con la ruta de la fuente cacheada en
+    disco: solo la primera ejecución paga el escaneo de fuentes del sistema.
+
+    Args:
+        name (str): Nombre de la fuente del sistema
+        size (int): Tamaño
+        bold (bool): Negrita
+        italic (bool): Cursiva
+
+    Returns:
+        pygame.font.Font: Fuente cargada
+    """
+    key = f"{name}|{int(bold)}|{int(italic)}"
+    entry = cache.get_font(key)
+    if entry is None:
+        # SysFont decide la ruta y si la negrita/cursiva es sintética;
+        # el constructor solo apunta su decisión
+        resolved = []
+
+        def constructor(path, font_size, font_bold, font_italic):
+            resolved.append([path, font_bold, font_italic])
+            return None
+
+        pygame.font.SysFont(name, size, bold, italic, constructor=constructor)
+        entry = resolved[0]
+        cache.set_font(key, entry)
+
+    path, font_bold, font_italic = entry
+    font = pygame.font.Font(path, size)
+    font.bold = font_bold
+    font.italic = font_italic
+    return font
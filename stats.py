@@ -0,0 +1,475 @@
+# stats.py
+# Módulo con el registro de estadísticas de las partidas (historial en disco y totales)
+
+import os
+import json
+import queue
+import logging
+import datetime
+import threading
+
+from persistence import atomic_write_json, read_json_with_backup
+from score import DATE_FORMAT
+
+# Directorio del historial
+STATS_DIR = "stats"
+
+# Tamaño a partir del cual se empieza un segmento nuevo, y segmentos
+# cerrados que se acumulan antes de compactarlos en uno
+SEGMENT_BYTES = 1_000_000
+COMPACT_SEGMENTS = 4
+
+# Fichero con los totales y la posición del historial que ya incluyen
+AGGREGATES_FILE = "aggregates.json"
+
+# Nombres de las jugadas según las líneas completadas a la vez
+CLEAR_NAMES = ("Simples", "Dobles", "Triples", "Tetris")
+
+def _segment_name(first, last=None):
+    """
+    Obtiene el nombre del fichero de un segmento del historial. Un
+    segmento compactado lleva en el nombre los segmentos que contiene.
+
+    Args:
+        first (int): Número del segmento (o del primero que contiene)
+        last (int, opcional): Último segmento que contiene, si está compactado
+
+    Returns:
+        str: Nombre del fichero
+    """
+    if last is None:
+        return f"stats-{first:06d}.jsonl"
+    return f"stats-{first:06d}-{last:06d}.jsonl"
+
+def _parse_segment_name(name):
+    """
+    Obtiene los segmentos que contiene un fichero del historial.
+
+    Args:
+        name (str): Nombre del fichero
+
+    Returns:
+        tuple: (primero, último), o None si no es un segmento
+    """
+    if not (name.startswith("stats-") and name.endswith(".jsonl")):
+        return None
+    try:
+        numbers = [int(part) for part in name[6:-6].split("-")]
+    except ValueError:
+        return None
+    if len(numbers) == 1:
+        return numbers[0], numbers[0]
+    if len(numbers) == 2 and numbers[0] <= numbers[1]:
+        return numbers[0], numbers[1]
+    return None
+
+def _new_aggregates():
+    """
+    Crea unos totales vacíos.
+
+    Returns:
+        dict: Totales (se guardan tal cual en AGGREGATES_FILE)
+    """
+    return {
+        "games": 0,
+        "total_score": 0,
+        "best_score": 0,
+        "total_lines": 0,
+        "total_pieces": 0,
+        "play_ms": 0,
+        "pieces": {},
+        "clears": [0, 0, 0, 0],
+        # Segmento y byte del historial hasta donde llegan los totales
+        "position": [1, 0],
+    }
+
+def _validate_aggregates(data):
+    """
+    Comprueba que los totales leídos de disco tienen todos los campos.
+
+    Args:
+        data (object): Datos leídos del JSON
+
+    Returns:
+        dict: Totales
+
+    Raises:
+        ValueError: Si faltan campos o no son del tipo esperado
+    """
+    expected = _new_aggregates()
+    if not isinstance(data, dict) or any(
+        not isinstance(data.get(field), type(value)) for field, value in expected.items()
+    ):
+        raise ValueError("los totales no tienen el formato esperado")
+    return data
+
+def summarize(aggregates):
+    """
+    Calcula los valores de la pantalla de estadísticas a partir de los totales.
+
+    Args:
+        aggregates (dict): Totales
+
+    Returns:
+        dict: Valores derivados (medias, líneas por minuto, reparto de piezas...)
+    """
+    games = aggregates["games"]
+    minutes = aggregates["play_ms"] / 60000
+    total_pieces = aggregates["total_pieces"]
+    return {
+        "games": games,
+        "best_score": aggregates["best_score"],
+        "average_score": aggregates["total_score"] / games if games else 0,
+        "total_lines": aggregates["total_lines"],
+        "average_lines": aggregates["total_lines"] / games if games else 0,
+        "lines_per_minute": aggregates["total_lines"] / minutes if minutes else 0,
+        "play_ms": aggregates["play_ms"],
+        "total_pieces": total_pieces,
+        "pieces": {
+            shape: count / total_pieces for shape, count in sorted(aggregates["pieces"].items())
+        } if total_pieces else {},
+        "clears": tuple(aggregates["clears"]),
+    }
+
+class StatsLog:
+    """
+    Historial de partidas en disco, en segmentos JSONL de solo añadir:
+    una línea por partida terminada y, opcionalmente, una por pieza
+    fijada. Junto al historial se mantienen los totales (partidas,
+    puntuación, líneas, tiempo, reparto de piezas...), que se actualizan
+    con cada partida, así que la pantalla de estadísticas no tiene que
+    recorrer el historial.
+
+    Todo el trabajo con ficheros se hace en un hilo propio: el juego solo
+    cuenta piezas en memoria y encola un registro por partida. Los totales
+    guardan hasta qué punto del historial llegan; si el juego se cierra de
+    golpe, al arrancar se suman las partidas que faltaban.
+
+    Cuando un segmento pasa de SEGMENT_BYTES se empieza otro, y cada
+    COMPACT_SEGMENTS segmentos cerrados sin compactar se juntan en uno que
+    solo conserva las partidas (las piezas ya están resumidas en ellas);
+    los ya compactados no se vuelven a copiar. El compactado se llama como el rango que cubre (stats-000001-000004.jsonl),
+    así que si la compactación se corta antes de borrar los originales,
+    se sabe que ya están incluidos y no se cuentan dos veces.
+    """
+
+    def __init__(self, directory=STATS_DIR, log_pieces=False, segment_bytes=SEGMENT_BYTES,
+                 compact_segments=COMPACT_SEGMENTS):
+        """
+        Inicializa el historial (se abre en segundo plano con start).
+
+        Args:
+            directory (str): Directorio de los segmentos y los totales
+            log_pieces (bool): Registrar también cada pieza fijada
+            segment_bytes (int): Tamaño a partir del cual se rota de segmento
+            compact_segments (int): Segmentos cerrados que disparan la compactación
+        """
+        self.directory: str = directory
+        self.log_pieces: bool = log_pieces
+        self.segment_bytes: int = segment_bytes
+        self.compact_segments: int = compact_segments
+
+        # Resumen de los totales (se sustituye entero al cambiar) y su versión
+        self.summary: dict = summarize(_new_aggregates())
+        self.version = 0
+
+        # Partida en curso (hilo del juego)
+        self._pieces: dict[str, int] = {}
+        self._clears = [0, 0, 0, 0]
+
+        self._aggregates: dict = _new_aggregates()
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._file = None
+        self._segment = 1
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        """Arranca el hilo del historial (lee los totales en segundo plano)."""
+        self._thread = threading.Thread(target=self._run, name="stats-log", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Escribe lo pendiente, guarda los totales y detiene el hilo."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def begin_game(self):
+        """Empieza a contar una partida nueva."""
+        self._pieces = {}
+        self._clears = [0, 0, 0, 0]
+
+    def piece_locked(self, shape, lines):
+        """
+        Cuenta una pieza fijada en la partida en curso.
+
+        Args:
+            shape (str): Forma de la pieza
+            lines (int): Líneas que completó al fijarse
+        """
+        self._pieces[shape] = self._pieces.get(shape, 0) + 1
+        if lines:
+            self._clears[min(lines, 4) - 1] += 1
+        if self.log_pieces:
+            self._queue.put({"type": "piece", "shape": shape, "lines": lines})
+
+    def end_game(self, score, lines, level, play_ms):
+        """
+        Registra una partida terminada.
+
+        Args:
+            score (int): Puntuación final
+            lines (int): Líneas eliminadas
+            level (int): Nivel alcanzado
+            play_ms (float): Tiempo jugado (sin contar las pausas)
+        """
+        self._queue.put({
+            "type": "game",
+            "date": datetime.datetime.now().strftime(DATE_FORMAT),
+            "score": score,
+            "lines": lines,
+            "level": level,
+            "play_ms": int(play_ms),
+            "pieces": dict(self._pieces),
+            "clears": list(self._clears),
+        })
+
+    def _run(self):
+        """Bucle del hilo: escribe los registros y mantiene los totales."""
+        try:
+            self._open()
+        except OSError as e:
+            logging.error(f"No se pudo abrir el historial de estadísticas: {e}")
+            while self._queue.get() is not None:
+                pass
+            return
+
+        dirty = False
+        while True:
+            record = self._queue.get()
+            if record is None:
+                break
+            try:
+                self._append(record)
+                dirty = True
+                # Los totales se guardan cuando no queda nada en cola
+                if self._queue.empty():
+                    self._save_aggregates()
+                    dirty = False
+            except OSError as e:
+                logging.error(f"Error al escribir el historial de estadísticas: {e}")
+
+        if dirty:
+            self._save_aggregates()
+        self._file.close()
+
+    def _open(self):
+        """
+        Lee los totales, suma lo que falte del historial y abre el último
+        segmento para añadir (hilo del historial).
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, AGGREGATES_FILE)
+        aggregates, source = read_json_with_backup(path, _validate_aggregates)
+        self._aggregates = aggregates if source is not None else _new_aggregates()
+
+        # Sumar lo escrito después de guardar los totales (o todo, si no había)
+        segments = self._segments()
+        segment, offset = self._aggregates["position"]
+        recovered = 0
+        for first, last, name in segments:
+            if last < segment:
+                continue
+            recovered += self._replay(name, offset if first == segment else 0)
+        if recovered:
+            logging.info(f"Estadísticas: {recovered} partidas recuperadas del historial")
+            self._save_aggregates()
+
+        # Se sigue escribiendo en el último segmento, salvo que esté compactado
+        self._segment = 1
+        if segments:
+            first, last, name = segments[-1]
+            self._segment = last if name == _segment_name(last) else last + 1
+        segment_path = self._segment_path(self._segment)
+        self._truncate_partial_line(segment_path)
+        self._file = open(segment_path, "ab")
+        self._aggregates["position"] = [self._segment, self._file.tell()]
+        self._publish()
+
+    def _segments(self):
+        """
+        Lista los ficheros del historial. Los que ya están incluidos en un
+        segmento compactado (restos de una compactación cortada) se borran.
+
+        Returns:
+            list: (primer segmento, último segmento, nombre del fichero), en orden
+        """
+        found = []
+        for name in os.listdir(self.directory):
+            numbers = _parse_segment_name(name)
+            if numbers is not None:
+                found.append((numbers[0], -numbers[1], name))
+        # A igual inicio, primero el rango más amplio
+        found.sort()
+
+        segments = []
+        covered = 0
+        for first, last, name in found:
+            last = -last
+            if last <= covered:
+                logging.info(f"Estadísticas: se borra {name}, ya incluido en un segmento compactado")
+                os.remove(os.path.join(self.directory, name))
+                continue
+            segments.append((first, last, name))
+            covered = last
+        return segments
+
+    def _segment_path(self, number):
+        """
+        Obtiene la ruta de un segmento.
+
+        Args:
+            number (int): Número del segmento
+
+        Returns:
+            str: Ruta del fichero
+        """
+        return os.path.join(self.directory, _segment_name(number))
+
+    def _replay(self, name, offset):
+        """
+        Suma a los totales las partidas de un segmento desde un byte.
+
+        Args:
+            name (str): Fichero del segmento
+            offset (int): Byte desde el que leer
+
+        Returns:
+            int: Partidas sumadas
+        """
+        games = 0
+        with open(os.path.join(self.directory, name), "rb") as file:
+            file.seek(offset)
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break  # Línea a medio escribir (se descarta al abrir)
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.get("type") == "game":
+                    self._apply(record)
+                    games += 1
+        return games
+
+    @staticmethod
+    def _truncate_partial_line(path):
+        """
+        Quita del final de un segmento una línea a medio escribir (por un
+        cierre brusco), para que el siguiente registro no se pegue a ella.
+
+        Args:
+            path (str): Ruta del segmento
+        """
+        if not os.path.exists(path):
+            return
+        with open(path, "rb+") as file:
+            data = file.read()
+            if data and not data.endswith(b"\n"):
+                file.truncate(data.rfind(b"\n") + 1)
+
+    def _append(self, record):
+        """
+        Añade un registro al segmento actual y lo suma a los totales (hilo del historial).
+
+        Args:
+            record (dict): Registro de partida o de pieza
+        """
+        self._file.write(json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n")
+        self._file.flush()
+        if record["type"] == "game":
+            self._apply(record)
+            self._publish()
+        self._aggregates["position"] = [self._segment, self._file.tell()]
+
+        if self._file.tell() >= self.segment_bytes:
+            self._rotate()
+
+    def _apply(self, record):
+        """
+        Suma una partida a los totales.
+
+        Args:
+            record (dict): Registro de partida
+        """
+        aggregates = self._aggregates
+        aggregates["games"] += 1
+        aggregates["total_score"] += record["score"]
+        aggregates["best_score"] = max(aggregates["best_score"], record["score"])
+        aggregates["total_lines"] += record["lines"]
+        aggregates["play_ms"] += record["play_ms"]
+        for shape, count in record["pieces"].items():
+            aggregates["pieces"][shape] = aggregates["pieces"].get(shape, 0) + count
+            aggregates["total_pieces"] += count
+        for i, count in enumerate(record["clears"][:4]):
+            aggregates["clears"][i] += count
+
+    def _publish(self):
+        """Publica el resumen de los totales para la pantalla de estadísticas."""
+        self.summary = summarize(self._aggregates)
+        self.version += 1
+
+    def _save_aggregates(self):
+        """Guarda los totales de forma atómica."""
+        try:
+            atomic_write_json(os.path.join(self.directory, AGGREGATES_FILE), self._aggregates)
+        except (IOError, OSError) as e:
+            logging.error(f"No se pudieron guardar los totales de estadísticas: {e}")
+
+    def _rotate(self):
+        """Cierra el segmento actual, empieza otro y compacta si toca."""
+        self._file.close()
+        self._segment += 1
+        self._file = open(self._segment_path(self._segment), "ab")
+        self._aggregates["position"] = [self._segment, 0]
+        # Los totales tienen que apuntar al segmento nuevo antes de compactar
+        self._save_aggregates()
+
+        # Solo se compactan los segmentos que aún no lo están: los ya
+        # compactados no se vuelven a copiar
+        closed = [
+            segment for segment in self._segments()
+            if segment[1] < self._segment and segment[2] == _segment_name(segment[0])
+        ]
+        if len(closed) >= self.compact_segments:
+            self._compact(closed)
+
+    def _compact(self, segments):
+        """
+        Junta varios segmentos cerrados en uno, conservando solo las
+        partidas. El resultado se escribe aparte y se renombra con el rango
+        que cubre; después se borran los originales. Si se corta antes de
+        borrarlos, al listar el historial se ve que el compactado ya los
+        incluye y se borran entonces.
+
+        Args:
+            segments (list): Segmentos a compactar, en orden (ver _segments)
+        """
+        target = os.path.join(self.directory, _segment_name(segments[0][0], segments[-1][1]))
+        temp_path = target + ".tmp"
+        games = 0
+        with open(temp_path, "wb") as output:
+            for _, _, name in segments:
+                with open(os.path.join(self.directory, name), "rb") as file:
+                    for line in file:
+                        if line.endswith(b"\n") and b'"type":"game"' in line:
+                            output.write(line)
+                            games += 1
+            output.flush()
+            os.fsync(output.fileno())
+        os.replace(temp_path, target)
+        for _, _, name in segments:
+            os.remove(os.path.join(self.directory, name))
+        logging.info(f"Estadísticas: {len(segments)} segmentos compactados ({games} partidas)")
@@ -0,0 +1,84 @@
+# test_leaderboard.py
+# Pruebas del cliente de la clasificación global contra un servidor local
+
+import time
+import asyncio
+import threading
+
+import pytest
+
+from leaderboard_client import LeaderboardClient
+from leaderboard_server import LeaderboardServer
+from score import make_highscore
+
+@pytest.fixture
+def server(tmp_path):
+    """Servidor de clasificación en un puerto libre de localhost, en su propio hilo."""
+    server = LeaderboardServer(str(tmp_path / "leaderboard.json"))
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+    ports = []
+
+    def on_ready(port):
+        ports.append(port)
+        ready.set()
+
+    task = loop.create_task(server.serve("127.0.0.1", 0, on_ready))
+    thread = threading.Thread(
+        target=lambda: loop.run_until_complete(asyncio.gather(task, return_exceptions=True)),
+        daemon=True
+    )
+    thread.start()
+    assert ready.wait(5)
+    server.port = ports[0]
+    yield server
+    loop.call_soon_threadsafe(task.cancel)
+    thread.join(5)
+    loop.close()
+
+@pytest.fixture
+def client(server):
+    """Cliente conectado al servidor de prueba."""
+    client = LeaderboardClient("127.0.0.1", server.port, limit=3)
+    client.start()
+    yield client
+    client.close()
+
+def wait_for_top(client, predicate, timeout=5.0):
+    """Espera a que la clasificación cacheada del cliente cumpla la condición."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if client.top is not None and predicate(client.top):
+            return client.top
+        time.sleep(0.01)
+    raise AssertionError(f"clasificación no actualizada: {client.top!r}")
+
+def test_submit_flush_and_top(server, client):
+    for player, score in (("ana", 300), ("bea", 900), ("carl", 100), ("dani", 500)):
+        client.submit(make_highscore(player, score, 1, 0))
+    assert client.flush(5)
+    assert len(server.rankings) == 4
+
+    client.refresh()
+    top = wait_for_top(client, lambda top: len(top) == 3)
+    assert [entry["player"] for entry in top] == ["bea", "dani", "ana"]
+    assert client.version == server.version
+
+def test_resubmitted_records_are_counted_once(server, client):
+    entry = make_highscore("ana", 300, 1, 0)
+    client.submit(entry)
+    client.submit(entry)
+    assert client.flush(5)
+    client.submit(entry)
+    assert client.flush(5)
+    assert len(server.rankings) == 1
+
+def test_records_are_kept_while_the_server_is_down():
+    # Nadie escucha en el puerto 1: el envío queda pendiente y se reintenta
+    client = LeaderboardClient("127.0.0.1", 1, limit=3)
+    client.start()
+    client.submit(make_highscore("ana", 300, 1, 0))
+    assert not client.flush(0.2)
+    assert not client.connected
+    assert client.top is None
+    client.close(0)
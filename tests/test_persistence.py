@@ -0,0 +1,111 @@
+# test_persistence.py
+# Pruebas de la escritura segura de ficheros JSON (persistence.py)
+
+import json
+import threading
+
+import persistence
+from persistence import JsonWriter, atomic_write_json, read_json_with_backup
+
+def validate_list(data):
+    """Validador de prueba: los datos tienen que ser una lista."""
+    if not isinstance(data, list):
+        raise ValueError("no es una lista")
+    return data
+
+def read(path):
+    """Lee un JSON de disco."""
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+def test_atomic_write_keeps_previous_version_as_backup(tmp_path):
+    path = str(tmp_path / "data.json")
+    atomic_write_json(path, [1])
+    assert not (tmp_path / "data.json.bak").exists()
+
+    atomic_write_json(path, [2])
+    assert read(path) == [2]
+    assert read(path + ".bak") == [1]
+    assert not (tmp_path / "data.json.tmp").exists()
+
+def test_atomic_write_without_backup(tmp_path):
+    path = str(tmp_path / "data.json")
+    atomic_write_json(path, [1], backup=False)
+    atomic_write_json(path, [2], backup=False)
+    assert read(path) == [2]
+    assert not (tmp_path / "data.json.bak").exists()
+
+def test_read_main_file(tmp_path):
+    path = str(tmp_path / "data.json")
+    atomic_write_json(path, [1])
+    assert read_json_with_backup(path, validate_list) == ([1], "main")
+
+def test_corrupt_main_file_is_moved_aside_and_backup_is_used(tmp_path):
+    path = str(tmp_path / "data.json")
+    atomic_write_json(path, [1])
+    atomic_write_json(path, [2])
+    (tmp_path / "data.json").write_text("[2, ", encoding="utf-8")
+
+    assert read_json_with_backup(path, validate_list) == ([1], "backup")
+    assert not (tmp_path / "data.json").exists()
+    assert (tmp_path / "data.json.corrupt").read_text(encoding="utf-8") == "[2, "
+
+    # La siguiente escritura no convierte el fichero corrupto en la copia
+    atomic_write_json(path, [3])
+    assert read(path) == [3]
+    assert read(path + ".bak") == [1]
+
+def test_invalid_main_file_falls_back_to_backup(tmp_path):
+    path = str(tmp_path / "data.json")
+    atomic_write_json(path, [1])
+    atomic_write_json(path, {"no": "lista"})
+    assert read_json_with_backup(path, validate_list) == ([1], "backup")
+
+def test_missing_files(tmp_path):
+    assert read_json_with_backup(str(tmp_path / "data.json"), validate_list) == (None, None)
+
+def test_writer_flush_and_close(tmp_path):
+    path = str(tmp_path / "data.json")
+    writer = JsonWriter(path)
+    data = [1, 2]
+    writer.submit(data)
+    data.append(3)  # El escritor guarda una copia del momento de submit
+    assert writer.flush(5)
+    assert read(path) == [1, 2]
+
+    writer.submit([4])
+    writer.close()
+    assert read(path) == [4]
+    assert writer.writes == 2
+
+def test_close_without_writes(tmp_path):
+    writer = JsonWriter(str(tmp_path / "data.json"))
+    writer.close()
+    assert not (tmp_path / "data.json").exists()
+
+def test_writer_coalesces_saves_while_writing(tmp_path, monkeypatch):
+    path = str(tmp_path / "data.json")
+    started = threading.Event()
+    release = threading.Event()
+    written = []
+
+    def slow_write(target, data, backup=True):
+        written.append(data)
+        started.set()
+        assert release.wait(5)
+
+    monkeypatch.setattr(persistence, "atomic_write_json", slow_write)
+    writer = JsonWriter(path)
+    writer.submit([1])
+    assert started.wait(5)
+
+    # Mientras se escribe la primera versión llegan tres más: solo se
+    # escribe la última
+    for version in (2, 3, 4):
+        writer.submit([version])
+    assert not writer.flush(0.05)
+    release.set()
+    assert writer.flush(5)
+    writer.close()
+    assert written == [[1], [4]]
+    assert writer.writes == 2
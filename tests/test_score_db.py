@@ -0,0 +1,105 @@
+# test_score_db.py
+# Pruebas de los récords en SQLite (score_db.py): importación, historial y clasificaciones
+
+import json
+import datetime
+
+import pytest
+
+from score_db import SqliteScoreManager, period_bounds
+
+# Miércoles de referencia para las clasificaciones por periodo
+NOW = datetime.datetime(2026, 10, 14, 12, 30)
+
+RECORDS = [
+    {"player": "carol", "score": 900, "level": 9, "lines": 90, "date": "2026-10-11 23:59:59"},
+    {"player": "alice", "score": 500, "level": 5, "lines": 50, "date": "2026-10-14 09:00:00"},
+    {"player": "bob", "score": 300, "level": 3, "lines": 30, "date": "2026-10-13 18:00:00"},
+    {"player": "alice", "score": 200, "level": 2, "lines": 20, "date": "2026-10-12 00:00:00"},
+    {"player": "bob", "score": 100, "level": 1, "lines": 10, "date": "2026-10-15 00:00:00"},
+]
+
+def write_json(path, data):
+    """Escribe un JSON de prueba."""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file)
+
+@pytest.fixture
+def manager(tmp_path):
+    """Gestor con los récords de prueba importados de highscores.json."""
+    write_json(tmp_path / "highscores.json", RECORDS)
+    manager = SqliteScoreManager(
+        str(tmp_path / "highscores.db"), str(tmp_path / "highscores.json"), max_records=3
+    )
+    yield manager
+    manager.close()
+
+def scores(entries):
+    """Puntuaciones de una lista de récords."""
+    return [entry["score"] for entry in entries]
+
+def test_migration_imports_json_once(tmp_path, manager):
+    assert manager.count() == 5
+    assert scores(manager.highscores) == [900, 500, 300]
+    manager.close()
+
+    # Al volver a abrir no se importa otra vez
+    reopened = SqliteScoreManager(
+        str(tmp_path / "highscores.db"), str(tmp_path / "highscores.json"), max_records=3
+    )
+    assert reopened.count() == 5
+    reopened.close()
+
+def test_migration_falls_back_to_backup_without_touching_files(tmp_path):
+    (tmp_path / "highscores.json").write_text("{roto", encoding="utf-8")
+    write_json(tmp_path / "highscores.json.bak", RECORDS[:2])
+
+    manager = SqliteScoreManager(
+        str(tmp_path / "highscores.db"), str(tmp_path / "highscores.json"), max_records=3
+    )
+    assert scores(manager.get_top()) == [900, 500]
+    manager.close()
+
+    # El fichero corrupto no se aparta: solo se lee
+    assert (tmp_path / "highscores.json").read_text(encoding="utf-8") == "{roto"
+    assert not (tmp_path / "highscores.json.corrupt").exists()
+
+def test_get_top_pages(manager):
+    assert scores(manager.get_top(2)) == [900, 500]
+    assert scores(manager.get_top(2, offset=2)) == [300, 200]
+    assert scores(manager.get_top(2, offset=4)) == [100]
+    assert manager.get_top(2, offset=6) == []
+
+def test_get_player_bests(manager):
+    bests = manager.get_player_bests()
+    assert [(entry["player"], entry["score"]) for entry in bests] == [
+        ("carol", 900), ("alice", 500), ("bob", 300)
+    ]
+    # El resto de columnas son las de la fila del máximo
+    assert bests[1]["level"] == 5
+    assert [entry["player"] for entry in manager.get_player_bests(1, offset=1)] == ["alice"]
+    assert manager.get_player_best("bob")["score"] == 300
+    assert manager.get_player_best("nadie") is None
+
+def test_period_bounds():
+    assert period_bounds("daily", NOW) == ("2026-10-14 00:00:00", "2026-10-15 00:00:00")
+    assert period_bounds("weekly", NOW) == ("2026-10-12 00:00:00", "2026-10-19 00:00:00")
+    with pytest.raises(ValueError):
+        period_bounds("monthly", NOW)
+
+def test_get_leaderboard_by_period(manager):
+    assert scores(manager.get_leaderboard("daily", now=NOW)) == [500]
+    assert scores(manager.get_leaderboard("weekly", now=NOW)) == [500, 300, 200, 100]
+    assert scores(manager.get_leaderboard("weekly", limit=2, offset=1, now=NOW)) == [300, 200]
+
+def test_every_game_goes_to_history(manager):
+    # No es récord: se guarda en el historial, pero la tabla no cambia
+    version = manager.version
+    assert not manager.add_highscore("Anónimo", score=50, level=1, lines=5)
+    assert manager.count() == 6
+    assert manager.version == version
+    assert scores(manager.highscores) == [900, 500, 300]
+
+    assert manager.add_highscore("dave", score=600, level=6, lines=60)
+    assert manager.count() == 7
+    assert scores(manager.highscores) == [900, 600, 500]
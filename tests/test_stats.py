@@ -0,0 +1,80 @@
+# test_stats.py
+# Pruebas del historial de estadísticas (stats.py): rotación, compactación y recuperación
+
+import os
+
+from stats import AGGREGATES_FILE, StatsLog
+
+def play_games(log, count):
+    """Registra partidas de prueba (una pieza y una línea simple cada una)."""
+    for i in range(count):
+        log.begin_game()
+        log.piece_locked("T", 1)
+        log.end_game(score=40 * (i + 1), lines=1, level=1, play_ms=1000)
+
+def segment_files(directory):
+    """Lista los segmentos del historial que hay en disco."""
+    return sorted(name for name in os.listdir(directory) if name.endswith(".jsonl"))
+
+def test_rotation_compacts_only_new_segments(tmp_path, monkeypatch):
+    # Con un byte por segmento se rota después de cada registro
+    log = StatsLog(str(tmp_path), log_pieces=True, segment_bytes=1, compact_segments=2)
+    compacted = []
+    original = StatsLog._compact
+
+    def record_compact(self, segments):
+        compacted.append([name for _, _, name in segments])
+        original(self, segments)
+
+    monkeypatch.setattr(StatsLog, "_compact", record_compact)
+    log.start()
+    play_games(log, 4)
+    log.stop()
+
+    # Cada compactación junta segmentos sin compactar, nunca un rango anterior
+    assert compacted
+    for names in compacted:
+        assert all(name.count("-") == 1 for name in names)
+
+    files = segment_files(tmp_path)
+    # Pieza y partida por juego: ocho registros, cuatro rangos de dos
+    assert [name for name in files if name.count("-") == 2] == [
+        "stats-000001-000002.jsonl",
+        "stats-000003-000004.jsonl",
+        "stats-000005-000006.jsonl",
+        "stats-000007-000008.jsonl",
+    ]
+    assert log.summary["games"] == 4
+    assert log.summary["best_score"] == 160
+
+def test_full_replay_without_aggregates(tmp_path):
+    log = StatsLog(str(tmp_path), log_pieces=True, segment_bytes=1, compact_segments=2)
+    log.start()
+    play_games(log, 5)
+    log.stop()
+    expected = log.summary
+
+    # Sin totales, al abrir se recorre el historial entero
+    for name in (AGGREGATES_FILE, AGGREGATES_FILE + ".bak"):
+        path = tmp_path / name
+        if path.exists():
+            path.unlink()
+
+    reopened = StatsLog(str(tmp_path), segment_bytes=1, compact_segments=2)
+    reopened.start()
+    reopened.stop()
+    assert reopened.summary == expected
+    assert reopened.summary["games"] == 5
+    assert reopened.summary["clears"] == (5, 0, 0, 0)
+
+def test_reopen_continues_after_saved_position(tmp_path):
+    log = StatsLog(str(tmp_path), segment_bytes=1, compact_segments=2)
+    log.start()
+    play_games(log, 3)
+    log.stop()
+
+    reopened = StatsLog(str(tmp_path), segment_bytes=1, compact_segments=2)
+    reopened.start()
+    play_games(reopened, 2)
+    reopened.stop()
+    assert reopened.summary["games"] == 5
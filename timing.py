@@ -0,0 +1,280 @@
+# timing.py
+# Módulo para medir el coste de cada fase del frame (eventos, lógica, render, flip)
+
+import csv
+import json
+import time
+import logging
+from array import array
+from collections import deque
+
+from metrics import percentile
+
+# Fases medidas en cada frame ("frame" es el total)
+PHASES: tuple[str, ...] = (
+    "events",
+    "update",
+    "render",
+    "render.board",
+    "render.piece",
+    "render.effects",
+    "render.preview",
+    "render.panel",
+    "render.overlay",
+    "flip",
+    "frame",
+)
+
+# Límites (ms) de los intervalos del histograma exportado
+BUCKET_EDGES_MS: tuple[float, ...] = (0.25, 0.5, 1, 2, 4, 8, 16.7, 33.3, 66.7)
+
+class RollingHistogram:
+    """
+    Ventana deslizante con las últimas muestras de una fase (en ns), de la
+    que se obtienen percentiles, y máximo histórico desde el arranque.
+    """
+
+    def __init__(self, capacity):
+        """
+        Inicializa la ventana.
+
+        Args:
+            capacity (int): Número de muestras que se conservan
+        """
+        self.samples: deque[int] = deque(maxlen=capacity)
+        self.count = 0
+        self.max_ns = 0
+
+    def add(self, value_ns):
+        """
+        Añade una muestra.
+
+        Args:
+            value_ns (int): Duración en nanosegundos
+        """
+        self.samples.append(value_ns)
+        self.count += 1
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def stats(self):
+        """
+        Calcula las estadísticas de la ventana actual.
+
+        Returns:
+            dict: Muestras, media, p50, p95, p99 y máximo de la ventana (ms),
+                y máximo histórico (ms)
+        """
+        values = sorted(self.samples)
+        count = len(values)
+        return {
+            "samples": count,
+            "mean_ms": sum(values) / count / 1e6 if count else 0.0,
+            "p50_ms": percentile(values, 0.50) / 1e6,
+            "p95_ms": percentile(values, 0.95) / 1e6,
+            "p99_ms": percentile(values, 0.99) / 1e6,
+            "max_ms": values[-1] / 1e6 if values else 0.0,
+            "max_all_ms": self.max_ns / 1e6,
+        }
+
+    def buckets(self):
+        """
+        Reparte las muestras de la ventana en los intervalos de BUCKET_EDGES_MS.
+
+        Returns:
+            list: Número de muestras por intervalo (el último, por encima del mayor límite)
+        """
+        counts = [0] * (len(BUCKET_EDGES_MS) + 1)
+        for value in self.samples:
+            ms = value / 1e6
+            index = 0
+            while index < len(BUCKET_EDGES_MS) and ms > BUCKET_EDGES_MS[index]:
+                index += 1
+            counts[index] += 1
+        return counts
+
+class FrameTimer:
+    """
+    Temporizador por fases basado en perf_counter_ns. Cada frame acumula
+    el tiempo de cada fase; al cerrarlo, las fases medidas se añaden a su
+    histograma y la fila completa a un historial para exportarla.
+
+    Está siempre activo, así que no crea objetos por frame: la fila en
+    curso se pone a cero en su sitio y el historial es un anillo
+    preasignado (array de enteros) en el que se sobrescriben las filas.
+
+    Uso: begin_frame(), y para cada fase start = time.perf_counter_ns(),
+    trabajo, add(fase, start); al final, end_frame().
+    """
+
+    def __init__(self, capacity=600, budget_ms=1000 / 60, phases=PHASES):
+        """
+        Inicializa el temporizador.
+
+        Args:
+            capacity (int): Frames que se conservan en cada ventana
+            budget_ms (float): Presupuesto por frame; los frames que lo
+                superan cuentan como tirones
+            phases (tuple): Nombres de las fases
+        """
+        self.phases: tuple[str, ...] = tuple(phases)
+        self._indices: dict[str, int] = {name: i for i, name in enumerate(self.phases)}
+        self._frame_index: int = self._indices["frame"]
+        self.histograms: dict[str, RollingHistogram] = {
+            name: RollingHistogram(capacity) for name in self.phases
+        }
+        self.capacity: int = capacity
+        self.budget_ns = int(budget_ms * 1e6)
+        self.hitches = 0
+        self.frame_count = 0
+
+        # Historial: capacity filas de una columna por fase, y el número
+        # de frame de cada fila
+        self._history = array("q", [0]) * (capacity * len(self.phases))
+        self._history_frames = array("q", [0]) * capacity
+
+        self._histogram_list: tuple[RollingHistogram, ...] = tuple(self.histograms.values())
+        self._zeros: tuple[int, ...] = (0,) * len(self.phases)
+        self._current: list[int] = list(self._zeros)
+        self._frame_start = time.perf_counter_ns()
+
+    def begin_frame(self):
+        """Empieza a medir un frame nuevo."""
+        self._current[:] = self._zeros
+        self._frame_start = time.perf_counter_ns()
+
+    def add(self, phase, start_ns):
+        """
+        Acumula en una fase el tiempo transcurrido desde start_ns.
+
+        Args:
+            phase (str): Nombre de la fase
+            start_ns (int): Marca de perf_counter_ns() al empezar la fase
+        """
+        self._current[self._indices[phase]] += time.perf_counter_ns() - start_ns
+
+    def end_frame(self):
+        """Cierra el frame actual y guarda sus tiempos."""
+        current = self._current
+        current[self._frame_index] = time.perf_counter_ns() - self._frame_start
+        if current[self._frame_index] > self.budget_ns:
+            self.hitches += 1
+
+        # Solo cuentan las fases que se han ejecutado en este frame; la
+        # fila se copia en el anillo del historial
+        phase_count = len(current)
+        base = (self.frame_count % self.capacity) * phase_count
+        history = self._history
+        for i in range(phase_count):
+            value = current[i]
+            history[base + i] = value
+            if value:
+                self._histogram_list[i].add(value)
+
+        self._history_frames[self.frame_count % self.capacity] = self.frame_count + 1
+        self.frame_count += 1
+
+    def history(self):
+        """
+        Obtiene el historial de frames, del más antiguo al más reciente.
+
+        Returns:
+            list: (número de frame, tiempos por fase en ns) de cada frame guardado
+        """
+        phase_count = len(self.phases)
+        stored = min(self.frame_count, self.capacity)
+        rows = []
+        for frame in range(self.frame_count - stored, self.frame_count):
+            slot = frame % self.capacity
+            base = slot * phase_count
+            rows.append((self._history_frames[slot], tuple(self._history[base:base + phase_count])))
+        return rows
+
+    def summary(self):
+        """
+        Calcula las estadísticas de todas las fases medidas.
+
+        Returns:
+            dict: Fase -> estadísticas (ver RollingHistogram.stats)
+        """
+        return {
+            name: histogram.stats()
+            for name, histogram in self.histograms.items()
+            if histogram.count
+        }
+
+    def overlay_rows(self):
+        """
+        Genera las filas del panel de tiempos en pantalla.
+
+        Returns:
+            tuple: Filas (fase, p50, p95, p99, máximo en ms) con una cabecera
+                y una última fila con los tirones
+        """
+        rows = [("fase", "p50", "p95", "p99", "máx")]
+        for name, stats in self.summary().items():
+            rows.append((
+                name,
+                f"{stats['p50_ms']:.2f}",
+                f"{stats['p95_ms']:.2f}",
+                f"{stats['p99_ms']:.2f}",
+                f"{stats['max_ms']:.2f}",
+            ))
+        rows.append((f"tirones > {self.budget_ns / 1e6:.1f} ms", str(self.hitches), "", "", ""))
+        return tuple(rows)
+
+    def export_csv(self, path):
+        """
+        Exporta el historial de frames (ms por fase, 0 = fase no ejecutada).
+
+        Args:
+            path (str): Fichero CSV de destino
+        """
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["frame"] + [f"{name}_ms" for name in self.phases])
+            for frame, values in self.history():
+                writer.writerow([frame] + [f"{value / 1e6:.4f}" for value in values])
+
+    def export_json(self, path):
+        """
+        Exporta el resumen por fase con su histograma.
+
+        Args:
+            path (str): Fichero JSON de destino
+        """
+        report = {
+            "frames": self.frame_count,
+            "budget_ms": self.budget_ns / 1e6,
+            "hitches": self.hitches,
+            "bucket_edges_ms": list(BUCKET_EDGES_MS),
+            "phases": {
+                name: dict(stats, buckets=self.histograms[name].buckets())
+                for name, stats in self.summary().items()
+            },
+        }
+        with open(path, "w") as file:
+            json.dump(report, file, indent=4)
+
+    def export(self, base_path):
+        """
+        Exporta el historial (CSV) y el resumen (JSON) con un nombre común.
+
+        Args:
+            base_path (str): Ruta sin extensión (se añaden .csv y .json)
+        """
+        try:
+            self.export_csv(base_path + ".csv")
+            self.export_json(base_path + ".json")
+            logging.info(f"Tiempos por fase exportados a {base_path}.csv y {base_path}.json")
+        except (IOError, OSError) as e:
+            logging.error(f"Error al exportar los tiempos por fase: {e}")
+
+    def log_summary(self):
+        """Registra en el log el resumen de cada fase."""
+        for name, stats in self.summary().items():
+            logging.info(
+                f"Fase {name}: p50 {stats['p50_ms']:.3f} ms, p95 {stats['p95_ms']:.3f} ms, "
+                f"p99 {stats['p99_ms']:.3f} ms, máx {stats['max_all_ms']:.3f} ms"
+            )
+        logging.info(f"Frames por encima de {self.budget_ns / 1e6:.1f} ms: {self.hitches} de {self.frame_count}")
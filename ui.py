@@ -5,10 +5,14 @@ import pygame
 import logging
 
 from pygame.font import Font
+from animation import AnimationTimeline, TimedEffect, Tween, ease_out_quad
+from render_backend import create_backend
+from startup import report as startup_report, init_pygame, sys_font
+from stats import CLEAR_NAMES
 from constants import (
     WINDOW_WIDTH, WINDOW_HEIGHT, GRID_WIDTH, GRID_HEIGHT, 
     CELL_SIZE, COLORS, BG_COLOR, GRID_COLOR, TEXT_COLOR,
-    UI_BG_COLOR, BORDER_COLOR
+    UI_BG_COLOR, BORDER_COLOR, PALETTE
 )
 
 # Inicialización básica de pygame
@@ -20,31 +24,45 @@ class GameUI:
     Se encarga de la visualización del tablero, piezas, puntuaciones y menús.
     """
     
-    def __init__(self, score_manager):
+    # Colores de destello de las líneas eliminadas
+    FLASH_COLORS: list[tuple[int, int, int]] = [
+        (255, 255, 255),  # Blanco
+        (220, 220, 100),  # Amarillo claro
+        (180, 180, 255)   # Azul claro
+    ]
+    
+    def __init__(self, score_manager, backend="surface", software_renderer=False, board_count=1):
         """
         Inicializa la interfaz gráfica del juego.
         
         Args:
             score_manager (ScoreManager): Gestor de puntuaciones
+            backend (str): Backend de renderizado ("surface" o "texture")
+            software_renderer (bool): Si es True, el backend de texturas usa
+                el renderer por software de SDL (máquinas sin GPU)
+            board_count (int): Número de tableros en pantalla (2 en el modo versus)
         """
+        # Cada tablero ocupa una columna con su propio panel lateral
+        self.window_width: int = WINDOW_WIDTH * board_count
+        self.window_height: int = WINDOW_HEIGHT
         try:
-            # Inicialización básica de pygame
-            pygame.init()
-            
-            # Verificar que el display se puede inicializar
-            if not pygame.display.get_init():
-                pygame.display.init()
-            
-            pygame.display.set_caption("Tetris")
+            # Solo los módulos necesarios (no hace nada si ya están inicializados)
+            init_pygame()
             
             # Crear ventana con configuración básica
-            logging.info("Creando ventana con configuración básica...")
-            self.window: pygame.Surface = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+            logging.info(f"Creando ventana con el backend '{backend}'...")
+            with startup_report.phase("ventana"):
+                self.backend = create_backend(
+                    backend,
+                    (self.window_width, self.window_height),
+                    "Tetris" if board_count == 1 else "Tetris - Versus",
+                    software=software_renderer,
+                    block_colors=PALETTE[1:] + self.FLASH_COLORS,
+                    block_sizes=(CELL_SIZE,)
+                )
+            # Superficie de la ventana (None con el backend de texturas)
+            self.window: pygame.Surface | None = self.backend.surface
             logging.info("Ventana creada correctamente")
-            
-            # Inicializar el subsistema de fuentes
-            if not pygame.font.get_init():
-                pygame.font.init()
         except Exception as e:
             logging.error(f"Error al crear ventana: {e}")
             import traceback
@@ -52,12 +70,13 @@ class GameUI:
             pygame.quit()
             raise
         
-        # Fuentes para texto
-        self.title_font: Font = pygame.font.SysFont('Arial', 48, bold=True)
-        self.large_font: Font = pygame.font.SysFont('Arial', 38, bold=True)  # Aumentado de 36 a 38
-        self.score_font: Font = pygame.font.SysFont('Arial', 42, bold=True)  # Nueva fuente más grande para puntuación
-        self.medium_font: Font = pygame.font.SysFont('Arial', 26)  # Aumentado de 24 a 26
-        self.small_font: Font = pygame.font.SysFont('Arial', 18)
+        # Fuentes para texto (rutas cacheadas en disco, ver startup.sys_font)
+        with startup_report.phase("fuentes"):
+            self.title_font: Font = sys_font('Arial', 48, bold=True)
+            self.large_font: Font = sys_font('Arial', 38, bold=True)  # Aumentado de 36 a 38
+            self.score_font: Font = sys_font('Arial', 42, bold=True)  # Nueva fuente más grande para puntuación
+            self.medium_font: Font = sys_font('Arial', 26)  # Aumentado de 24 a 26
+            self.small_font: Font = sys_font('Arial', 18)
         
         # Gestor de puntuaciones
         self.score_manager = score_manager
@@ -66,22 +85,75 @@ class GameUI:
         self.clock = pygame.time.Clock()
         
         # Calcular dimensiones y posiciones
-        self._calculate_layout()
+        self._calculate_layout(board_count)
+        
+        # Superficies reutilizables para dibujar el tablero
+        self._init_board_renderer()
         
         # Estado actual del menú (main, game, pause, gameover)
         self.current_state = "main"
         
         # Opciones de menú
         self.menu_options: dict[str, list[str]] = {
-            "main": ["Jugar", "Rankings", "Salir"],
+            "main": ["Jugar", "Rankings", "Estadísticas", "Salir"],
             "pause": ["Continuar", "Reiniciar", "Salir al Menú"]
         }
         self.selected_option = 0
+
+        # Paneles laterales cacheados por tablero (se reconstruyen solo si
+        # cambian sus datos)
+        self._next_panel_surfaces: list[pygame.Surface | None] = [None] * board_count
+        self._next_panel_keys: list[tuple | None] = [None] * board_count
+        self._next_panel_sources: list = [None] * board_count
+        self._score_panel_surfaces: list[pygame.Surface | None] = [None] * board_count
+        self._score_panel_keys: list[tuple | None] = [None] * board_count
+
+        # Fondo congelado con el oscurecimiento ya aplicado (pausa / game over)
+        self._overlay_background: pygame.Surface | None = None
+
+        # Tabla de rankings cacheada y posición de desplazamiento
+        self.rankings_rows = 10
+        self.rankings_offset = 0
+        self._rankings_surface: pygame.Surface | None = None
+        self._rankings_key: tuple | None = None
         
-    def _calculate_layout(self):
+        # Pantalla de estadísticas cacheada (se reconstruye si cambian los totales)
+        self._stats_surface: pygame.Surface | None = None
+        self._stats_key: tuple | None = None
+        
+        # Textos ya renderizados que se dibujan directamente en la ventana
+        self._text_cache: dict[tuple, pygame.Surface] = {}
+        
+        # Fondo decorativo de la pantalla de juego (se renderiza una vez)
+        self._background_surface: pygame.Surface | None = None
+        
+        # Una línea de tiempo de animaciones (destellos, puntos, ...) por
+        # tablero: la cola secuencial de un jugador no espera a la del otro
+        self.animations: list[AnimationTimeline] = [AnimationTimeline() for _ in range(self.board_count)]
+        
+        # Portada de la pantalla de carga, escalada una vez
+        self._splash_source: pygame.Surface | None = None
+        self._splash_surface: pygame.Surface | None = None
+        
+        # Panel de tiempos por fase (se reconstruye solo si cambian sus filas)
+        self.timing_font: Font = sys_font('Consolas', 14)
+        self._timing_surface: pygame.Surface | None = None
+        self._timing_rows: tuple | None = None
+
+    def _calculate_layout(self, board_count=1):
         """
         Calcula las dimensiones y posiciones de los elementos de la interfaz.
+        Con varios tableros, cada uno ocupa una columna de WINDOW_WIDTH
+        píxeles con la misma distribución que la partida individual.
+        
+        Args:
+            board_count (int): Número de tableros en pantalla
         """
+        self.board_count = board_count
+        
+        # Desplazamiento horizontal de la columna de cada tablero
+        self.slot_offsets: list[int] = [slot * WINDOW_WIDTH for slot in range(board_count)]
+        
         # Área del tablero
         self.board_width = GRID_WIDTH * CELL_SIZE
         self.board_height = GRID_HEIGHT * CELL_SIZE
@@ -98,62 +170,175 @@ class GameUI:
         self.next_pieces_x = self.sidebar_x + 10
         self.next_pieces_y = self.sidebar_y + 40
         self.next_piece_size: float = CELL_SIZE * 0.8
-        
-    def draw_board(self, board):
+
+        # Dimensiones de los paneles laterales
+        self.next_panel_height = 250
+        self.score_panel_y: int = self.next_pieces_y + self.next_panel_height
+        self.score_panel_height = 190
+
+    def _init_board_renderer(self):
         """
-        Dibuja el tablero del juego.
+        Prepara las superficies reutilizables para dibujar el tablero.
+        El tablero se dibuja con pocas copias de superficie en lugar de
+        una llamada de dibujo por celda:
         
-        Args:
-            board (Board): Objeto tablero con el estado actual
+        1. Fondo estático (borde, fondo y cuadrícula), renderizado una vez.
+        2. El buffer de índices del tablero, compartido sin copia con una
+           superficie de 8 bits con paleta y escalado a CELL_SIZE.
+        3. El borde oscuro de cada celda ocupada, restando una máscara.
+        
+        El resultado se guarda en una superficie por tablero que solo se
+        vuelve a componer cuando cambia su contenido; las superficies de
+        trabajo, las paletas y el fondo se comparten entre tableros.
         """
-        # Dibujar fondo del tablero
+        # Fondo estático del tablero (incluye el borde de 2 píxeles)
+        self._board_background = pygame.Surface((self.board_width + 4, self.board_height + 4))
+        self._board_background.fill(BORDER_COLOR)
         pygame.draw.rect(
-            self.window,
-            BORDER_COLOR,
-            (self.board_x - 2, self.board_y - 2, self.board_width + 4, self.board_height + 4)
-        )
-        pygame.draw.rect(
-            self.window,
+            self._board_background,
             BG_COLOR,
-            (self.board_x, self.board_y, self.board_width, self.board_height)
+            (2, 2, self.board_width, self.board_height)
         )
+        self.draw_grid(surface=self._board_background, origin=(2, 2))
         
-        # Dibujar cuadrícula
-        self.draw_grid()
+        # Paletas: colores de las piezas y máscara de oscurecimiento del borde
+        self._board_palette: list[tuple[int, int, int]] = PALETTE + [(0, 0, 0)] * (256 - len(PALETTE))
+        self._board_mask_palette: list[tuple[int, int, int]] = (
+            [(0, 0, 0)] + [(50, 50, 50)] * (len(PALETTE) - 1) + [(0, 0, 0)] * (256 - len(PALETTE))
+        )
         
-        # Dibujar piezas en el tablero
-        grid_state = board.get_board_state()
+        # Superficie de índices a tamaño real (celdas vacías transparentes)
+        self._board_cells = pygame.Surface((self.board_width, self.board_height), depth=8)
+        self._board_cells.set_palette(self._board_palette)
+        self._board_cells.set_colorkey(0)
+        
+        # Patrón con el contorno de cada celda (blanco) para recortar la máscara
+        self._board_edges = pygame.Surface((self.board_width, self.board_height))
+        self._board_edges.fill((0, 0, 0))
         for y in range(GRID_HEIGHT):
             for x in range(GRID_WIDTH):
-                if grid_state[y][x]:
-                    color = grid_state[y][x]
-                    self.draw_cell(x, y, color)
+                pygame.draw.rect(
+                    self._board_edges,
+                    (255, 255, 255),
+                    (x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE),
+                    1
+                )
+        
+        # Superficie de trabajo para la máscara de bordes
+        self._board_shade = pygame.Surface((self.board_width, self.board_height))
+        
+        # Por tablero: superficie de 8 bits que comparte memoria con su buffer
+        self._board_index_surfaces: list[pygame.Surface | None] = [None] * self.board_count
+        self._board_buffers: list[bytearray | None] = [None] * self.board_count
+        
+        # Por tablero: tablero ya compuesto y versión del contenido dibujado
+        self._board_surfaces: list[pygame.Surface | None] = [None] * self.board_count
+        self._board_keys: list[tuple | None] = [None] * self.board_count
+    
+    def draw_board(self, board, slot=0):
+        """
+        Dibuja el tablero del juego.
+        Con el backend por software, el buffer de índices del tablero se lee
+        directamente (sin copia) a través de una superficie de 8 bits, y el
+        tablero compuesto se cachea hasta que cambia su versión: los frames
+        sin cambios son una sola copia.
+        
+        Args:
+            board (Board): Objeto tablero con el estado actual
+            slot (int): Índice del tablero en pantalla
+        """
+        board_x = self.board_x + self.slot_offsets[slot]
+        
+        # Con el backend de texturas, cada celda es una copia del atlas de bloques
+        if self.window is None:
+            self.backend.blit(self._board_background, (board_x - 2, self.board_y - 2))
+            grid = board.grid
+            for index in range(GRID_WIDTH * GRID_HEIGHT):
+                if grid[index]:
+                    y, x = divmod(index, GRID_WIDTH)
+                    self.draw_cell(x, y, PALETTE[grid[index]], slot=slot)
+            return
+        
+        key = (id(board.grid), board.version)
+        if key != self._board_keys[slot] or self._board_surfaces[slot] is None:
+            self._compose_board(board, slot)
+            self._board_keys[slot] = key
+        
+        self.window.blit(self._board_surfaces[slot], (board_x - 2, self.board_y - 2))
+    
+    def _compose_board(self, board, slot):
+        """
+        Compone el tablero (fondo, celdas y bordes) en su superficie cacheada.
+        
+        Args:
+            board (Board): Objeto tablero con el estado actual
+            slot (int): Índice del tablero en pantalla
+        """
+        target = self._board_surfaces[slot]
+        if target is None:
+            target = pygame.Surface(self._board_background.get_size())
+            self._board_surfaces[slot] = target
+        
+        # Fondo, borde y cuadrícula
+        target.blit(self._board_background, (0, 0))
+        
+        # Enlazar la superficie de 8 bits al buffer del tablero (solo si cambia)
+        if self._board_buffers[slot] is not board.grid:
+            self._board_index_surfaces[slot] = pygame.image.frombuffer(
+                board.grid, (GRID_WIDTH, GRID_HEIGHT), 'P'
+            )
+            self._board_buffers[slot] = board.grid
+        
+        # Escalar los índices al tamaño de celda
+        pygame.transform.scale(
+            self._board_index_surfaces[slot],
+            (self.board_width, self.board_height),
+            self._board_cells
+        )
+        
+        # Dibujar las celdas ocupadas con su color
+        self._board_cells.set_palette(self._board_palette)
+        target.blit(self._board_cells, (2, 2))
+        
+        # Oscurecer el contorno de las celdas ocupadas (efecto 3D)
+        self._board_cells.set_palette(self._board_mask_palette)
+        self._board_shade.fill((0, 0, 0))
+        self._board_shade.blit(self._board_cells, (0, 0))
+        self._board_shade.blit(self._board_edges, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+        target.blit(self._board_shade, (2, 2), special_flags=pygame.BLEND_RGB_SUB)
     
-    def draw_grid(self):
+    def draw_grid(self, surface=None, origin=None):
         """
         Dibuja la cuadrícula del tablero.
+        
+        Args:
+            surface (pygame.Surface, opcional): Superficie destino (por defecto la ventana)
+            origin (tuple, opcional): Esquina superior izquierda del tablero en la superficie
         """
+        target = surface if surface is not None else self.window
+        origin_x, origin_y = origin if origin is not None else (self.board_x, self.board_y)
+        
         # Líneas verticales
         for x in range(GRID_WIDTH + 1):
             pygame.draw.line(
-                self.window,
+                target,
                 GRID_COLOR,
-                (self.board_x + x * CELL_SIZE, self.board_y),
-                (self.board_x + x * CELL_SIZE, self.board_y + self.board_height),
+                (origin_x + x * CELL_SIZE, origin_y),
+                (origin_x + x * CELL_SIZE, origin_y + self.board_height),
                 1
             )
         
         # Líneas horizontales
         for y in range(GRID_HEIGHT + 1):
             pygame.draw.line(
-                self.window,
+                target,
                 GRID_COLOR,
-                (self.board_x, self.board_y + y * CELL_SIZE),
-                (self.board_x + self.board_width, self.board_y + y * CELL_SIZE),
+                (origin_x, origin_y + y * CELL_SIZE),
+                (origin_x + self.board_width, origin_y + y * CELL_SIZE),
                 1
             )
     
-    def draw_cell(self, x, y, color, offset_x=0, offset_y=0, size=None):
+    def draw_cell(self, x, y, color, offset_x=0, offset_y=0, size=None, slot=0):
         """
         Dibuja una celda en el tablero o en la vista previa.
         
@@ -164,157 +349,172 @@ class GameUI:
             offset_x (int): Desplazamiento X adicional
             offset_y (int): Desplazamiento Y adicional
             size (int, optional): Tamaño de la celda (si es diferente al estándar)
+            slot (int): Índice del tablero en pantalla
         """
         cell_size = size if size is not None else CELL_SIZE
         
         # Calcular posición real en pantalla
-        screen_x = self.board_x + x * cell_size + offset_x
+        screen_x = self.board_x + self.slot_offsets[slot] + x * cell_size + offset_x
         screen_y = self.board_y + y * cell_size + offset_y
         
-        # Dibujar celda (con borde más oscuro)
-        pygame.draw.rect(
-            self.window,
-            color,
-            (screen_x, screen_y, cell_size, cell_size)
-        )
-        
-        # Borde para dar efecto 3D
-        darker_color = tuple(max(0, c - 50) for c in color)
-        pygame.draw.rect(
-            self.window,
-            darker_color,
-            (screen_x, screen_y, cell_size, cell_size),
-            1
-        )
+        # Dibujar celda (con borde más oscuro para dar efecto 3D)
+        self.backend.draw_block(color, screen_x, screen_y, cell_size)
     
-    def draw_piece(self, piece, board_offset=True, preview=False, size=None):
+    def draw_piece(self, piece, board_offset=True, preview=False, size=None, y=None, slot=0):
         """
         Dibuja una pieza en la pantalla.
         
         Args:
             piece (Piece): La pieza a dibujar
             board_offset (bool): Si es True, dibuja con offset del tablero
-            preview (bool): Si es True, dibuja como vista previa
+            preview (bool): Si es True, dibuja como vista previa (semi-transparente)
             size (int, optional): Tamaño de la celda (para vistas previas)
+            y (int, optional): Fila donde dibujarla (por defecto la de la pieza)
+            slot (int): Índice del tablero en pantalla
         """
         # Obtener coordenadas
         rot_index = piece.rotation // 90
         shape = piece.shape[rot_index]
         color = piece.color
+        piece_y = piece.y if y is None else y
         
         # Tamaño de la celda
         cell_size = size if size is not None else CELL_SIZE
         
         # Offset del tablero (solo si no es vista previa)
-        offset_x: int = self.board_x if board_offset else 0
+        offset_x: int = self.board_x + self.slot_offsets[slot] if board_offset else 0
         offset_y: int = self.board_y if board_offset else 0
         
-        # Si es vista previa, añadir transparencia
-        draw_color = color
-        if preview:
-            draw_color = color[0], color[1], color[2], 128
+        # Si es vista previa, el relleno es semi-transparente
+        alpha = 90 if preview else 255
         
         # Dibujar cada bloque de la pieza
         for i in range(len(shape)):
             for j in range(len(shape[0])):
                 if shape[i][j]:
                     screen_x = offset_x + (piece.x + j) * cell_size
-                    screen_y = offset_y + (piece.y + i) * cell_size
-                    
-                    # Dibujar bloque
-                    pygame.draw.rect(
-                        self.window,
-                        draw_color,
-                        (screen_x, screen_y, cell_size, cell_size)
-                    )
-                    
-                    # Borde
-                    darker_color = tuple(max(0, c - 50) for c in color[:3])
-                    pygame.draw.rect(
-                        self.window,
-                        darker_color,
-                        (screen_x, screen_y, cell_size, cell_size),
-                        1
-                    )
+                    # La fila puede ser fraccionaria (caída interpolada)
+                    screen_y = offset_y + round((piece_y + i) * cell_size)
+                    self.backend.draw_block(color, screen_x, screen_y, cell_size, alpha)
     
-    def draw_next_pieces(self, next_pieces):
+    def draw_next_pieces(self, next_pieces, slot=0):
         """
         Dibuja las próximas piezas en el panel lateral.
+        El panel se renderiza en una superficie propia que solo se reconstruye
+        cuando cambia la cola de piezas; el resto de frames solo se copia.
         
         Args:
             next_pieces (list): Lista de piezas siguientes
+            slot (int): Índice del tablero en pantalla
         """
-        # Dibujar fondo
-        pygame.draw.rect(
-            self.window,
-            UI_BG_COLOR,
-            (self.sidebar_x, self.next_pieces_y - 30, self.sidebar_width, 250)
+        # La misma secuencia que el frame anterior: ni siquiera hace falta la clave
+        if next_pieces is not self._next_panel_sources[slot] or self._next_panel_surfaces[slot] is None:
+            key = tuple((piece.shape_name, piece.rotation) for piece in next_pieces)
+            if key != self._next_panel_keys[slot] or self._next_panel_surfaces[slot] is None:
+                self._next_panel_surfaces[slot] = self._render_next_panel(next_pieces)
+                self._next_panel_keys[slot] = key
+            self._next_panel_sources[slot] = next_pieces
+        
+        self.backend.blit(
+            self._next_panel_surfaces[slot],
+            (self.sidebar_x + self.slot_offsets[slot], self.next_pieces_y - 30)
         )
+    
+    def _render_next_panel(self, next_pieces):
+        """
+        Renderiza el panel de próximas piezas en una superficie nueva.
+        
+        Args:
+            next_pieces (list): Lista de piezas siguientes
+            
+        Returns:
+            pygame.Surface: Superficie con el panel completo
+        """
+        panel = pygame.Surface((self.sidebar_width, self.next_panel_height))
+        panel.fill(UI_BG_COLOR)
         
         # Título
-        self.draw_text("Próximas Piezas", self.medium_font, TEXT_COLOR, 
-                    self.sidebar_x + 10, self.next_pieces_y - 25)
+        self.draw_text("Próximas Piezas", self.medium_font, TEXT_COLOR, 10, 5, surface=panel)
         
         # Dibujar cada pieza en la lista
         for i, piece in enumerate(next_pieces):
-            # Posición de cada pieza
-            piece_y: int = self.next_pieces_y + i * 60
+            # Posición de cada pieza (relativa al panel)
+            piece_y: int = 30 + i * 60
             
             # Ajustar coordenadas para centrar la pieza en el panel
             rot_index = piece.rotation // 90
             shape = piece.shape[rot_index]
             width: float = len(shape[0]) * self.next_piece_size
-            height: float = len(shape) * self.next_piece_size
             
             # Centrar en x
-            piece_x: float = self.sidebar_x + (self.sidebar_width - width) // 2
+            piece_x: float = (self.sidebar_width - width) // 2
             
             # Dibujar cada bloque
+            darker_color = tuple(max(0, c - 50) for c in piece.color)
             for y in range(len(shape)):
                 for x in range(len(shape[0])):
                     if shape[y][x]:
                         draw_x: float = piece_x + x * self.next_piece_size
                         draw_y: float = piece_y + y * self.next_piece_size
                         pygame.draw.rect(
-                            self.window,
+                            panel,
                             piece.color,
                             (draw_x, draw_y, self.next_piece_size, self.next_piece_size)
                         )
                         # Borde
-                        darker_color = tuple(max(0, c - 50) for c in piece.color)
                         pygame.draw.rect(
-                            self.window,
+                            panel,
                             darker_color,
                             (draw_x, draw_y, self.next_piece_size, self.next_piece_size),
                             1
                         )
+        
+        return panel
     
-    def draw_score_panel(self, current_score, level, lines, highscore):
+    def draw_score_panel(self, current_score, level, lines, highscore, slot=0):
         """
         Dibuja el panel con puntuación, nivel y líneas.
-        Mejorado con mejor visibilidad y espacio optimizado.
+        El panel se cachea y solo se vuelve a renderizar cuando cambia
+        alguno de sus valores.
         
         Args:
             current_score (int): Puntuación actual
             level (int): Nivel actual
             lines (int): Líneas eliminadas
             highscore (int): Puntuación máxima
+            slot (int): Índice del tablero en pantalla
         """
-        # Posición en y (debajo de próximas piezas)
-        y_pos: int = self.next_pieces_y + 250
+        key = (current_score, level, lines, highscore)
+        if key != self._score_panel_keys[slot] or self._score_panel_surfaces[slot] is None:
+            self._score_panel_surfaces[slot] = self._render_score_panel(current_score, level, lines, highscore)
+            self._score_panel_keys[slot] = key
         
-        # Dibujar fondo principal
-        pygame.draw.rect(
-            self.window,
-            UI_BG_COLOR,
-            (self.sidebar_x, y_pos, self.sidebar_width, 190)  # Aumentado altura de 180 a 190
+        self.backend.blit(
+            self._score_panel_surfaces[slot],
+            (self.sidebar_x + self.slot_offsets[slot], self.score_panel_y)
         )
+    
+    def _render_score_panel(self, current_score, level, lines, highscore):
+        """
+        Renderiza el panel de puntuación en una superficie nueva.
+        
+        Args:
+            current_score (int): Puntuación actual
+            level (int): Nivel actual
+            lines (int): Líneas eliminadas
+            highscore (int): Puntuación máxima
+            
+        Returns:
+            pygame.Surface: Superficie con el panel completo
+        """
+        panel = pygame.Surface((self.sidebar_width, self.score_panel_height))
+        panel.fill(UI_BG_COLOR)
         
         # Añadir borde sutil para mejorar la visibilidad
         pygame.draw.rect(
-            self.window,
+            panel,
             BORDER_COLOR,
-            (self.sidebar_x, y_pos, self.sidebar_width, 190),
+            (0, 0, self.sidebar_width, self.score_panel_height),
             2  # Borde de 2 píxeles
         )
         
@@ -323,50 +523,73 @@ class GameUI:
         high_str = self.score_manager.format_score(highscore)
         
         # Dibujar textos con mejor espaciado
-        self.draw_text("Puntuación", self.medium_font, TEXT_COLOR, 
-                    self.sidebar_x + 10, y_pos + 10)
+        self.draw_text("Puntuación", self.medium_font, TEXT_COLOR, 10, 10, surface=panel)
                     
         # Fondo destacado para la puntuación actual
         score_width = self.score_font.size(score_str)[0] + 20  # Ancho del texto + margen
         score_height = self.score_font.get_height() + 8  # Alto del texto + margen
         
-        # Dibujar fondo semi-transparente para destacar la puntuación
+        # Fondo semi-transparente para destacar la puntuación
         score_bg = pygame.Surface((score_width, score_height), pygame.SRCALPHA)
         score_bg.fill((100, 100, 255, 60))  # Azul semi-transparente
-        self.window.blit(score_bg, (self.sidebar_x + 5, y_pos + 38))
+        panel.blit(score_bg, (5, 38))
         
         # Dibujar puntuación con fuente más grande
-        self.draw_text(score_str, self.score_font, TEXT_COLOR, 
-                    self.sidebar_x + 15, y_pos + 40)
+        self.draw_text(score_str, self.score_font, TEXT_COLOR, 15, 40, surface=panel)
         
         # Nivel y líneas en una sola fila para mejor distribución
-        self.draw_text("Nivel:", self.medium_font, TEXT_COLOR, 
-                    self.sidebar_x + 10, y_pos + 90)
-        self.draw_text(str(level), self.large_font, TEXT_COLOR, 
-                    self.sidebar_x + 80, y_pos + 88)
+        self.draw_text("Nivel:", self.medium_font, TEXT_COLOR, 10, 90, surface=panel)
+        self.draw_text(str(level), self.large_font, TEXT_COLOR, 80, 88, surface=panel)
         
-        self.draw_text("Líneas:", self.medium_font, TEXT_COLOR, 
-                    self.sidebar_x + 130, y_pos + 90)
-        self.draw_text(str(lines), self.large_font, TEXT_COLOR, 
-                    self.sidebar_x + 200, y_pos + 88)
+        self.draw_text("Líneas:", self.medium_font, TEXT_COLOR, 130, 90, surface=panel)
+        self.draw_text(str(lines), self.large_font, TEXT_COLOR, 200, 88, surface=panel)
         
         # Récord con mejor visibilidad
-        self.draw_text("Récord", self.medium_font, TEXT_COLOR, 
-                    self.sidebar_x + 10, y_pos + 140)
-        self.draw_text(high_str, self.medium_font, TEXT_COLOR, 
-                    self.sidebar_x + 90, y_pos + 140)
+        self.draw_text("Récord", self.medium_font, TEXT_COLOR, 10, 140, surface=panel)
+        self.draw_text(high_str, self.medium_font, TEXT_COLOR, 90, 140, surface=panel)
+        
+        return panel
+    
+    def draw_splash(self, image, progress):
+        """
+        Dibuja la pantalla de carga: la imagen de portada y una barra con
+        el progreso de la carga de recursos.
+        
+        Args:
+            image (pygame.Surface): Imagen de portada (o None si no se pudo cargar)
+            progress (float): Fracción de recursos cargados (0.0 a 1.0)
+        """
+        self.backend.fill(BG_COLOR)
+        
+        # Portada a doble tamaño (escalada una sola vez)
+        if image is not None:
+            if self._splash_source is not image:
+                width, height = image.get_size()
+                self._splash_surface = pygame.transform.smoothscale(image, (width * 2, height * 2))
+                self._splash_source = image
+            splash_rect = self._splash_surface.get_rect(center=(self.window_width // 2, WINDOW_HEIGHT // 2 - 40))
+            self.backend.blit(self._splash_surface, splash_rect)
+        
+        # Barra de progreso
+        bar_width = self.window_width // 2
+        bar_x = (self.window_width - bar_width) // 2
+        bar_y = WINDOW_HEIGHT - 100
+        self.backend.draw_rect(UI_BG_COLOR, (bar_x, bar_y, bar_width, 16))
+        fill_width = int(bar_width * min(1.0, max(0.0, progress)))
+        if fill_width:
+            self.backend.draw_rect(COLORS["I"], (bar_x, bar_y, fill_width, 16))
+        self.backend.draw_rect(BORDER_COLOR, (bar_x, bar_y, bar_width, 16), 1)
     
     def draw_main_menu(self):
         """
         Dibuja el menú principal del juego.
         """
         # Fondo
-        self.window.fill(BG_COLOR)
+        self.backend.fill(BG_COLOR)
         
         # Título
-        title_text: pygame.Surface = self.title_font.render("TETRIS", True, COLORS["I"])
-        title_rect: pygame.Rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 4))
-        self.window.blit(title_text, title_rect)
+        self.draw_text("TETRIS", self.title_font, COLORS["I"],
+                    WINDOW_WIDTH // 2, WINDOW_HEIGHT // 4, center=True)
         
         # Opciones de menú
         for i, option in enumerate(self.menu_options["main"]):
@@ -379,31 +602,24 @@ class GameUI:
                 font = self.medium_font
                 
             # Dibujar opción
-            option_text: pygame.Surface = font.render(option, True, color)
-            option_rect: pygame.Rect = option_text.get_rect(
-                center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + i * 50)
-            )
-            self.window.blit(option_text, option_rect)
+            self.draw_text(option, font, color,
+                        WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + i * 50, center=True)
             
         # Instrucciones
         instructions = "Usa ↑↓ para seleccionar, ENTER para confirmar"
-        inst_text: pygame.Surface = self.small_font.render(instructions, True, TEXT_COLOR)
-        inst_rect: pygame.Rect = inst_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 50))
-        self.window.blit(inst_text, inst_rect)
+        self.draw_text(instructions, self.small_font, TEXT_COLOR,
+                    WINDOW_WIDTH // 2, WINDOW_HEIGHT - 50, center=True)
     
     def draw_pause_menu(self):
         """
         Dibuja el menú de pausa.
         """
-        # Fondo semi-transparente
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))  # Negro semi-transparente
-        self.window.blit(overlay, (0, 0))
+        # Fondo semi-transparente (congelado al entrar en pausa)
+        self._draw_overlay_background(128)  # Negro semi-transparente
         
         # Título del menú de pausa
-        title_text: pygame.Surface = self.large_font.render("PAUSA", True, TEXT_COLOR)
-        title_rect: pygame.Rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 3))
-        self.window.blit(title_text, title_rect)
+        self.draw_text("PAUSA", self.large_font, TEXT_COLOR,
+                    self.window_width // 2, WINDOW_HEIGHT // 3, center=True)
         
         # Opciones de menú
         for i, option in enumerate(self.menu_options["pause"]):
@@ -416,11 +632,8 @@ class GameUI:
                 font = self.medium_font
                 
             # Dibujar opción
-            option_text: pygame.Surface = font.render(option, True, color)
-            option_rect: pygame.Rect = option_text.get_rect(
-                center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + i * 50)
-            )
-            self.window.blit(option_text, option_rect)
+            self.draw_text(option, font, color,
+                        self.window_width // 2, WINDOW_HEIGHT // 2 + i * 50, center=True)
     
     def draw_game_over(self, score, level, lines):
         """
@@ -431,15 +644,12 @@ class GameUI:
             level (int): Nivel alcanzado
             lines (int): Líneas eliminadas
         """
-        # Fondo semi-transparente
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))  # Negro más opaco
-        self.window.blit(overlay, (0, 0))
+        # Fondo semi-transparente (congelado al entrar en game over)
+        self._draw_overlay_background(200)  # Negro más opaco
         
         # Título
-        title_text: pygame.Surface = self.title_font.render("GAME OVER", True, COLORS["Z"])
-        title_rect: pygame.Rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 4))
-        self.window.blit(title_text, title_rect)
+        self.draw_text("GAME OVER", self.title_font, COLORS["Z"],
+                    WINDOW_WIDTH // 2, WINDOW_HEIGHT // 4, center=True)
         
         # Formatear puntuación
         score_str = self.score_manager.format_score(score)
@@ -473,7 +683,69 @@ class GameUI:
                         self.small_font, TEXT_COLOR, 
                           WINDOW_WIDTH // 2, y_offset + 30, center=True)
     
-    def draw_text(self, text, font, color, x, y, center=False):
+    def draw_versus_result(self, winner, wins):
+        """
+        Dibuja el resultado de una partida del modo versus.
+        
+        Args:
+            winner (int | None): Índice del jugador ganador (None = empate)
+            wins (list): Partidas ganadas por cada jugador
+        """
+        # Fondo semi-transparente (congelado al terminar la partida)
+        self._draw_overlay_background(200)
+        
+        center_x = self.window_width // 2
+        if winner is None:
+            title, color = "EMPATE", TEXT_COLOR
+        else:
+            title, color = f"GANA EL JUGADOR {winner + 1}", COLORS["O"]
+        self.draw_text(title, self.title_font, color,
+                    center_x, self.window_height // 3, center=True)
+        
+        # Marcador
+        marker = "  -  ".join(str(count) for count in wins)
+        self.draw_text(marker, self.large_font, TEXT_COLOR,
+                    center_x, self.window_height // 2, center=True)
+        
+        # Instrucciones
+        self.draw_text("ENTER para la revancha, ESC para salir", self.small_font, TEXT_COLOR,
+                    center_x, self.window_height // 2 + 80, center=True)
+    
+    def has_overlay_background(self):
+        """
+        Indica si ya hay un fondo congelado para la pantalla superpuesta actual.
+        
+        Returns:
+            bool: True si el fondo ya está congelado, False en caso contrario
+        """
+        return self._overlay_background is not None
+    
+    def invalidate_overlay_background(self):
+        """
+        Descarta el fondo congelado. Debe llamarse al cambiar de estado
+        para que la siguiente pantalla superpuesta capture la escena actual.
+        """
+        self._overlay_background = None
+    
+    def _draw_overlay_background(self, alpha):
+        """
+        Dibuja el fondo oscurecido de las pantallas superpuestas.
+        La primera vez captura el contenido actual de la ventana y le aplica
+        el oscurecimiento; los frames siguientes solo copian esa superficie.
+        
+        Args:
+            alpha (int): Opacidad del oscurecimiento (0-255)
+        """
+        if self._overlay_background is None:
+            background = self.backend.snapshot()
+            overlay = pygame.Surface((self.window_width, self.window_height), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, alpha))
+            background.blit(overlay, (0, 0))
+            self._overlay_background = background
+        
+        self.backend.blit(self._overlay_background, (0, 0))
+    
+    def draw_text(self, text, font, color, x, y, center=False, surface=None):
         """
         Dibuja texto en la pantalla.
         
@@ -484,23 +756,57 @@ class GameUI:
             x (int): Posición X
             y (int): Posición Y
             center (bool): Si es True, centra el texto en (x, y)
+            surface (pygame.Surface, opcional): Superficie destino (por defecto la ventana)
         """
-        text_surface = font.render(text, True, color)
+        if surface is not None:
+            text_surface = font.render(text, True, color)
+        else:
+            text_surface = self._render_cached_text(text, font, color)
         if center:
             text_rect = text_surface.get_rect(center=(x, y))
         else:
             text_rect = text_surface.get_rect(topleft=(x, y))
-        self.window.blit(text_surface, text_rect)
+        if surface is not None:
+            surface.blit(text_surface, text_rect)
+        else:
+            self.backend.blit(text_surface, text_rect)
+    
+    def _render_cached_text(self, text, font, color):
+        """
+        Renderiza un texto reutilizando el resultado de frames anteriores.
+        Evita volver a rasterizar (y, con texturas, volver a subir) los
+        textos de los menús en cada frame.
+        
+        Args:
+            text (str): Texto a renderizar
+            font (pygame.font.Font): Fuente a utilizar
+            color (tuple): Color RGB del texto
+            
+        Returns:
+            pygame.Surface: Superficie con el texto
+        """
+        key = (text, id(font), tuple(color))
+        text_surface = self._text_cache.get(key)
+        if text_surface is None:
+            # Limitar el tamaño de la caché (p. ej. al escribir el nombre)
+            if len(self._text_cache) >= 256:
+                self._text_cache.clear()
+            text_surface = font.render(text, True, color)
+            self._text_cache[key] = text_surface
+        return text_surface
 
-    def show_score_effect(self, points, level=1):
+    def show_score_effect(self, points, level=1, slot=0):
         """
         Muestra un efecto visual cuando el jugador obtiene puntos.
+        El efecto se encola en la línea de tiempo de animaciones de su
+        tablero y se dibuja frame a frame, sin bloquear el bucle principal.
         
         Args:
             points (int): Puntos obtenidos
             level (int): Nivel actual
+            slot (int): Índice del tablero en pantalla
         """
-        if not points or not pygame.display.get_surface():
+        if not points:
             return
             
         # Calcular puntos totales con multiplicador de nivel
@@ -509,62 +815,77 @@ class GameUI:
         # Formatear puntos
         points_str = f"+{self.score_manager.format_score(total_points)}"
         
-        # Crear texto
+        # Crear texto (una sola vez, se reutiliza en cada frame)
         color = (255, 255, 150)  # Amarillo claro
         points_text = self.large_font.render(points_str, True, color)
         
         # Posición centrada sobre el tablero
-        text_rect = points_text.get_rect(
-            center=(self.board_x + self.board_width // 2, self.board_y + self.board_height // 3)
-        )
+        center_x = self.board_x + self.slot_offsets[slot] + self.board_width // 2
+        center_y = self.board_y + self.board_height // 3
+        
+        # El texto sube y se desvanece durante 600ms
+        rise = Tween(0, -40, 600, ease_out_quad)
+        fade = Tween(255, 0, 600)
+        
+        def draw(elapsed, progress):
+            text_rect = points_text.get_rect(center=(center_x, center_y + rise.value(elapsed)))
+            self.backend.blit(points_text, text_rect, alpha=int(fade.value(elapsed)))
         
-        # Mostrar efecto por un breve momento
-        self.window.blit(points_text, text_rect)
-        pygame.display.update(text_rect)
-        pygame.time.delay(600)  # 600ms
+        self.animations[slot].queue(TimedEffect(600, draw))
     
-    def flash_lines(self, board, lines_to_clear):
+    def flash_lines(self, cleared_rows, slot=0):
         """
-        Crea un efecto visual de destello para las líneas que se van a eliminar.
+        Crea un efecto visual de destello para las líneas eliminadas.
+        El efecto se encola en la línea de tiempo de animaciones de su tablero.
         
         Args:
-            board: Tablero de juego
-            lines_to_clear (list): Lista de índices de las líneas a eliminar
+            cleared_rows (dict): Índice de cada línea eliminada -> índices de
+                paleta de sus celdas antes de eliminarla
+            slot (int): Índice del tablero en pantalla
         """
-        if not lines_to_clear or not pygame.display.get_surface():
+        if not cleared_rows:
             return
             
-        # Guardar el estado original de las líneas
-        original_grid = board.get_board_state()
-        
         # Realizar el efecto de flash (3 destellos)
-        flash_colors = [
-            (255, 255, 255),  # Blanco
-            (220, 220, 100),  # Amarillo claro
-            (180, 180, 255)   # Azul claro
-        ]
+        flash_colors = self.FLASH_COLORS
+        flash_time = 100  # ms de cada destello
+        restore_time = 50  # ms entre destellos
+        phase_time = flash_time + restore_time
         
-        for flash_color in flash_colors:
-            # Cambiar el color de las líneas a eliminar
-            for y in lines_to_clear:
-                for x in range(len(original_grid[y])):
-                    if original_grid[y][x] is not None:
-                        # Dibujar celda con el color de destello
-                        self.draw_cell(x, y, flash_color)
-                        
-            # Actualizar la pantalla
-            pygame.display.update()
-            pygame.time.delay(100)  # 100ms entre destellos
-            
-            # Restaurar el color original
-            for y in lines_to_clear:
-                for x in range(len(original_grid[y])):
-                    if original_grid[y][x] is not None:
-                        self.draw_cell(x, y, original_grid[y][x])
-                        
-            # Actualizar la pantalla
-            pygame.display.update()
-            pygame.time.delay(50)  # 50ms entre restauraciones
+        def draw(elapsed, progress):
+            phase = min(int(elapsed // phase_time), len(flash_colors) - 1)
+            flashing = elapsed - phase * phase_time < flash_time
+            for y, row in cleared_rows.items():
+                for x, cell in enumerate(row):
+                    if cell:
+                        # Alternar entre el color de destello y el original
+                        self.draw_cell(x, y, flash_colors[phase] if flashing else PALETTE[cell], slot=slot)
+        
+        self.animations[slot].queue(TimedEffect(phase_time * len(flash_colors), draw))
+    
+    def update_animations(self, dt):
+        """
+        Avanza las animaciones en curso de todos los tableros.
+        
+        Args:
+            dt (int): Milisegundos transcurridos desde el último frame
+        """
+        for timeline in self.animations:
+            timeline.update(dt)
+    
+    def draw_animations(self):
+        """
+        Dibuja las animaciones en curso sobre la escena actual.
+        """
+        for timeline in self.animations:
+            timeline.draw()
+    
+    def clear_animations(self):
+        """
+        Cancela las animaciones de todos los tableros.
+        """
+        for timeline in self.animations:
+            timeline.clear()
     
     def handle_menu_input(self, event, options):
         """
@@ -593,31 +914,175 @@ class GameUI:
     def draw_background(self):
         """
         Dibuja el fondo general de la pantalla de juego.
+        El fondo es estático: se renderiza una vez y luego solo se copia.
+        """
+        if self._background_surface is None:
+            width, height = self.window_width, self.window_height
+            background = pygame.Surface((width, height))
+            
+            # Fondo principal
+            background.fill(BG_COLOR)
+            
+            # Dibujar bordes o elementos decorativos
+            # Aquí puedes añadir elementos visuales adicionales como patrones,
+            # líneas o formas decorativas en el fondo
+            
+            # Ejemplo: patrón de cuadrícula tenue en el fondo
+            for x in range(0, width, 40):
+                pygame.draw.line(background, GRID_COLOR, (x, 0), (x, height), 1)
+            for y in range(0, height, 40):
+                pygame.draw.line(background, GRID_COLOR, (0, y), (width, y), 1)
+            
+            self._background_surface = background
+        
+        self.backend.blit(self._background_surface, (0, 0))
+    
+    def draw_name_input(self, player_name, ticks=None):
+        """
+        Dibuja el cuadro de entrada del nombre del jugador (nuevo récord).
+        
+        Args:
+            player_name (str): Nombre introducido hasta ahora
+            ticks (int, opcional): Tiempo actual en ms (para el cursor parpadeante)
+        """
+        # Fondo para texto
+        text_bg_rect = pygame.Rect(
+            WINDOW_WIDTH // 4,
+            WINDOW_HEIGHT // 2 + 100,
+            WINDOW_WIDTH // 2,
+            40
+        )
+        self.backend.draw_rect((50, 50, 50), text_bg_rect)
+        self.backend.draw_rect((100, 100, 100), text_bg_rect, 2)
+        
+        # Mostrar texto de entrada
+        name_text: str = f"Nombre: {player_name}"
+        if ticks is None:
+            ticks = pygame.time.get_ticks()
+        if ticks % 1000 < 500:
+            name_text += "|"  # Cursor parpadeante
+        self.draw_text(
+            name_text,
+            self.medium_font,
+            (255, 255, 255),
+            WINDOW_WIDTH // 2,
+            WINDOW_HEIGHT // 2 + 120,
+            center=True
+        )
+    
+    def draw_timing_overlay(self, rows):
+        """
+        Dibuja el panel semi-transparente con los tiempos por fase.
+        
+        Args:
+            rows (tuple): Filas de texto (la primera es la cabecera), ver
+                FrameTimer.overlay_rows
+        """
+        if rows != self._timing_rows or self._timing_surface is None:
+            self._timing_surface = self._render_timing_overlay(rows)
+            self._timing_rows = rows
+        self.backend.blit(self._timing_surface, (8, 8))
+    
+    def _render_timing_overlay(self, rows):
         """
-        # Fondo principal
-        self.window.fill(BG_COLOR)
+        Renderiza el panel de tiempos por fase en una superficie nueva.
         
-        # Dibujar bordes o elementos decorativos
-        # Aquí puedes añadir elementos visuales adicionales como patrones,
-        # líneas o formas decorativas en el fondo
+        Args:
+            rows (tuple): Filas de texto (fase y columnas numéricas)
+            
+        Returns:
+            pygame.Surface: Superficie con el panel completo
+        """
+        line_height = self.timing_font.get_linesize()
+        name_width = max(self.timing_font.size(row[0])[0] for row in rows) + 12
+        column_width = self.timing_font.size("000.00")[0] + 10
+        width = name_width + column_width * (len(rows[0]) - 1) + 8
+        height = line_height * len(rows) + 8
         
-        # Ejemplo: patrón de cuadrícula tenue en el fondo
-        for x in range(0, WINDOW_WIDTH, 40):
-            pygame.draw.line(self.window, GRID_COLOR, (x, 0), (x, WINDOW_HEIGHT), 1)
-        for y in range(0, WINDOW_HEIGHT, 40):
-            pygame.draw.line(self.window, GRID_COLOR, (0, y), (WINDOW_WIDTH, y), 1)
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for i, row in enumerate(rows):
+            color = COLORS["O"] if i == 0 else TEXT_COLOR
+            y = 4 + i * line_height
+            panel.blit(self.timing_font.render(row[0], True, color), (4, y))
+            # Columnas numéricas alineadas a la derecha
+            for j, cell in enumerate(row[1:]):
+                if cell:
+                    text = self.timing_font.render(cell, True, color)
+                    right = 4 + name_width + (j + 1) * column_width
+                    panel.blit(text, (right - text.get_width(), y))
+        return panel
+    
+    def present(self):
+        """
+        Muestra en pantalla el frame dibujado.
+        """
+        self.backend.present()
     
     def draw_rankings(self):
         """
         Dibuja la pantalla de rankings.
+        La tabla se renderiza en una superficie cacheada que solo se
+        reconstruye cuando cambian los récords o la posición de desplazamiento.
+        """
+        key = (id(self.score_manager), self.score_manager.rankings_version(), self.rankings_offset)
+        if key != self._rankings_key or self._rankings_surface is None:
+            self._rankings_surface = self._render_rankings()
+            self._rankings_key = key
+        
+        self.backend.blit(self._rankings_surface, (0, 0))
+    
+    def scroll_rankings(self, delta):
+        """
+        Desplaza la tabla de rankings.
+        
+        Args:
+            delta (int): Número de filas a desplazar (negativo hacia arriba)
+        """
+        max_offset = max(0, len(self.score_manager.get_rankings()) - self.rankings_rows)
+        self.rankings_offset = min(max_offset, max(0, self.rankings_offset + delta))
+    
+    def handle_rankings_input(self, event):
+        """
+        Maneja el desplazamiento y la paginación de la tabla de rankings.
+        
+        Args:
+            event (pygame.event.Event): Evento de teclado
+        """
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_UP:
+            self.scroll_rankings(-1)
+        elif event.key == pygame.K_DOWN:
+            self.scroll_rankings(1)
+        elif event.key == pygame.K_PAGEUP:
+            self.scroll_rankings(-self.rankings_rows)
+        elif event.key == pygame.K_PAGEDOWN:
+            self.scroll_rankings(self.rankings_rows)
+        elif event.key == pygame.K_HOME:
+            self.rankings_offset = 0
+        elif event.key == pygame.K_END:
+            self.scroll_rankings(len(self.score_manager.get_rankings()))
+    
+    def _render_rankings(self):
+        """
+        Renderiza la pantalla de rankings en una superficie nueva.
+        
+        Returns:
+            pygame.Surface: Superficie con la pantalla completa
         """
+        screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        
         # Fondo
-        self.window.fill(BG_COLOR)
+        screen.fill(BG_COLOR)
         
-        # Título
-        title_text: pygame.Surface = self.large_font.render("MEJORES PUNTUACIONES", True, COLORS["I"])
+        # Título (la clasificación global se distingue de los récords locales)
+        title: str = (
+            "CLASIFICACIÓN GLOBAL" if self.score_manager.rankings_are_global() else "MEJORES PUNTUACIONES"
+        )
+        title_text: pygame.Surface = self.large_font.render(title, True, COLORS["I"])
         title_rect: pygame.Rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 50))
-        self.window.blit(title_text, title_rect)
+        screen.blit(title_text, title_rect)
         
         # Obtener rankings
         rankings = self.score_manager.get_rankings()
@@ -626,7 +1091,7 @@ class GameUI:
         if not rankings:
             self.draw_text("No hay puntuaciones registradas aún", 
                         self.medium_font, TEXT_COLOR, 
-                        WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2, center=True)
+                        WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2, center=True, surface=screen)
         else:
             # Encabezados
             headers: list[str] = ["Pos", "Jugador", "Puntuación", "Nivel", "Fecha"]
@@ -643,45 +1108,140 @@ class GameUI:
             y_pos = 120
             for i, header in enumerate(headers):
                 self.draw_text(header, self.medium_font, COLORS["J"], 
-                            header_positions[i], y_pos)
+                            header_positions[i], y_pos, surface=screen)
             
             # Dibujar línea separadora
             pygame.draw.line(
-                self.window, 
+                screen, 
                 TEXT_COLOR, 
                 (header_positions[0], y_pos + 30), 
                 (header_positions[-1] + header_widths[-1], y_pos + 30), 
                 1
             )
             
-            # Dibujar rankings
+            # Dibujar solo las filas visibles
             y_pos += 50
-            for i, rank in enumerate(rankings):
+            first = self.rankings_offset
+            visible = rankings[first:first + self.rankings_rows]
+            for i, rank in enumerate(visible, start=first):
                 # Posición
                 self.draw_text(f"{i+1}.", self.medium_font, TEXT_COLOR, 
-                            header_positions[0], y_pos)
+                            header_positions[0], y_pos, surface=screen)
                 
                 # Jugador
                 self.draw_text(rank["player"], self.medium_font, TEXT_COLOR, 
-                            header_positions[1], y_pos)
+                            header_positions[1], y_pos, surface=screen)
                 
                 # Puntuación
                 score_str = self.score_manager.format_score(rank["score"])
                 self.draw_text(score_str, self.medium_font, TEXT_COLOR, 
-                            header_positions[2], y_pos)
+                            header_positions[2], y_pos, surface=screen)
                 
                 # Nivel
                 self.draw_text(str(rank["level"]), self.medium_font, TEXT_COLOR, 
-                            header_positions[3], y_pos)
+                            header_positions[3], y_pos, surface=screen)
                 
                 # Fecha
                 date_str = rank["date"].split()[0]  # Solo la fecha, sin hora
                 self.draw_text(date_str, self.medium_font, TEXT_COLOR, 
-                            header_positions[4], y_pos)
+                            header_positions[4], y_pos, surface=screen)
                 
                 y_pos += 40
+            
+            # Indicador de página si hay más filas de las que caben
+            if len(rankings) > self.rankings_rows:
+                pages = (len(rankings) + self.rankings_rows - 1) // self.rankings_rows
+                page = (first + len(visible) + self.rankings_rows - 1) // self.rankings_rows
+                self.draw_text(f"Página {page}/{pages}  ({first + 1}-{first + len(visible)} de {len(rankings)})",
+                            self.small_font, TEXT_COLOR,
+                            WINDOW_WIDTH // 2, 95, center=True, surface=screen)
         
         # Instrucciones
-        self.draw_text("Presiona ESC para volver", self.small_font, TEXT_COLOR, 
-                      WINDOW_WIDTH // 2, WINDOW_HEIGHT - 50, center=True)
-
+        if len(rankings) > self.rankings_rows:
+            instructions = "↑↓ para desplazar, RePág/AvPág para cambiar de página, ESC para volver"
+        else:
+            instructions = "Presiona ESC para volver"
+        self.draw_text(instructions, self.small_font, TEXT_COLOR, 
+                      WINDOW_WIDTH // 2, WINDOW_HEIGHT - 30, center=True, surface=screen)
+        
+        return screen
+    
+    def draw_stats(self, stats):
+        """
+        Dibuja la pantalla de estadísticas.
+        La pantalla se renderiza en una superficie cacheada que solo se
+        reconstruye cuando cambian los totales.
+        
+        Args:
+            stats (StatsLog): Historial de estadísticas (se usa su resumen)
+        """
+        key = (id(stats), stats.version)
+        if key != self._stats_key or self._stats_surface is None:
+            self._stats_surface = self._render_stats(stats.summary)
+            self._stats_key = key
+        
+        self.backend.blit(self._stats_surface, (0, 0))
+    
+    def _render_stats(self, summary):
+        """
+        Renderiza la pantalla de estadísticas en una superficie nueva.
+        
+        Args:
+            summary (dict): Resumen de los totales (ver stats.summarize)
+            
+        Returns:
+            pygame.Surface: Superficie con la pantalla completa
+        """
+        screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        screen.fill(BG_COLOR)
+        
+        # Título
+        self.draw_text("ESTADÍSTICAS", self.large_font, COLORS["I"],
+                    WINDOW_WIDTH // 2, 50, center=True, surface=screen)
+        
+        if not summary["games"]:
+            self.draw_text("No hay partidas registradas aún",
+                        self.medium_font, TEXT_COLOR,
+                        WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2, center=True, surface=screen)
+        else:
+            # Totales y medias (columna izquierda)
+            minutes, seconds = divmod(int(summary["play_ms"] // 1000), 60)
+            hours, minutes = divmod(minutes, 60)
+            rows = [
+                ("Partidas", str(summary["games"])),
+                ("Mejor puntuación", self.score_manager.format_score(summary["best_score"])),
+                ("Puntuación media", self.score_manager.format_score(round(summary["average_score"]))),
+                ("Líneas", str(summary["total_lines"])),
+                ("Líneas por partida", f"{summary['average_lines']:.1f}"),
+                ("Líneas por minuto", f"{summary['lines_per_minute']:.1f}"),
+                ("Tiempo jugado", f"{hours}:{minutes:02d}:{seconds:02d}"),
+                ("Piezas", str(summary["total_pieces"])),
+            ]
+            rows += [(name, str(count)) for name, count in zip(CLEAR_NAMES, summary["clears"])]
+            y_pos = 110
+            for label, value in rows:
+                self.draw_text(label, self.small_font, TEXT_COLOR, 60, y_pos, surface=screen)
+                value_surface = self.small_font.render(value, True, COLORS["I"])
+                screen.blit(value_surface, value_surface.get_rect(topright=(390, y_pos)))
+                y_pos += 34
+            
+            # Reparto de piezas (columna derecha, una barra por forma,
+            # proporcional a la más frecuente)
+            self.draw_text("Reparto de piezas", self.medium_font, COLORS["J"],
+                        440, 110, surface=screen)
+            y_pos = 160
+            largest = max(summary["pieces"].values(), default=0)
+            for shape, share in summary["pieces"].items():
+                self.draw_text(shape, self.small_font, TEXT_COLOR, 440, y_pos, surface=screen)
+                bar_width = int(200 * share / largest)
+                pygame.draw.rect(screen, UI_BG_COLOR, (470, y_pos + 2, 200, 18))
+                if bar_width:
+                    pygame.draw.rect(screen, COLORS.get(shape, TEXT_COLOR), (470, y_pos + 2, bar_width, 18))
+                self.draw_text(f"{share * 100:.1f}%", self.small_font, TEXT_COLOR,
+                            680, y_pos, surface=screen)
+                y_pos += 34
+        
+        self.draw_text("Presiona ESC para volver", self.small_font, TEXT_COLOR,
+                      WINDOW_WIDTH // 2, WINDOW_HEIGHT - 30, center=True, surface=screen)
+        
+        return screen
@@ -0,0 +1,463 @@
+# versus.py
+# Módulo con el modo versus local: dos jugadores en pantalla dividida
+
+import time
+import random
+import logging
+import traceback
+import pygame
+
+from board import Board
+from pieces import PieceGenerator
+from score import ScoreManager
+from ui import GameUI
+from bot import best_move
+from constants import GRID_WIDTH, FPS, GARBAGE_LINES, VERSUS_CONTROLS
+
+class VersusPlayer:
+    """
+    Jugador del modo versus: su tablero, su pieza, sus teclas y la basura
+    pendiente que le ha enviado el rival.
+    """
+
+    def __init__(self, ui, slot, controls, bot=False):
+        """
+        Inicializa el jugador.
+
+        Args:
+            ui (GameUI): Interfaz compartida (para los efectos visuales)
+            slot (int): Índice de su tablero en pantalla
+            controls (dict): Teclas del jugador (left, right, down, rotate, hard_drop)
+            bot (bool): Si es True, lo controla el jugador automático
+        """
+        self.ui = ui
+        self.slot: int = slot
+        self.controls: dict[str, int] = controls
+        self.bot: bool = bot
+
+        # Tiempo para controlar la repetición de teclas
+        self.key_repeat_delay = 170  # ms
+        self.key_repeat_interval = 50  # ms
+
+        # Frames entre cada acción del jugador automático
+        self.bot_interval = 8
+
+        self.reset()
+
+    def reset(self):
+        """Prepara el jugador para una partida nueva."""
+        self.board = Board()
+        self.piece_generator = PieceGenerator(3)
+        self.current_piece = self.piece_generator.get_next_piece()
+        self.alive = True
+
+        self.fall_counter = 0
+        self.soft_drop_active = False
+        self.last_key = None
+        self.last_key_time = 0
+
+        # Líneas de basura recibidas (pendientes) y por enviar al rival
+        self.pending_garbage = 0
+        self.outgoing_garbage = 0
+
+        # Fila de aterrizaje cacheada de la pieza fantasma y su clave de validez
+        self._ghost_key = None
+        self._ghost_y = 0
+
+        # Jugada elegida por el jugador automático
+        self._bot_frame = 0
+        self._bot_target = best_move(self.board, self.current_piece) if self.bot else None
+
+    def handle_key_down(self, key, ticks):
+        """
+        Procesa una tecla pulsada.
+
+        Args:
+            key (int): Código de la tecla
+            ticks (int): Tiempo actual del juego en ms
+
+        Returns:
+            bool: True si la tecla pertenece a este jugador
+        """
+        if self.bot or key not in self.controls.values():
+            return False
+        if key == self.controls["hard_drop"]:
+            self._perform_hard_drop()
+            return True
+        if key == self.controls["down"]:
+            self.soft_drop_active = True
+
+        self.last_key = key
+        self.last_key_time = ticks
+        self._apply_key_movement(key)
+        return True
+
+    def handle_key_up(self, key):
+        """
+        Procesa una tecla soltada.
+
+        Args:
+            key (int): Código de la tecla
+        """
+        if key == self.controls["down"]:
+            self.soft_drop_active = False
+        if key == self.last_key:
+            self.last_key = None
+
+    def update(self, ticks):
+        """
+        Avanza un frame: repetición de teclas (o jugada automática) y gravedad.
+
+        Args:
+            ticks (int): Tiempo actual del juego en ms
+        """
+        if not self.alive:
+            return
+
+        if self.bot:
+            self._update_bot()
+        elif self.last_key and ticks - self.last_key_time > self.key_repeat_delay:
+            self._apply_key_movement(self.last_key)
+            self.last_key_time = ticks - (self.key_repeat_interval - self.key_repeat_delay)
+
+        # Misma velocidad de caída que la partida individual
+        level_fall_speed: int = max(5, 30 - (self.board.level - 1))
+        fall_speed: int = level_fall_speed // 4 if self.soft_drop_active else level_fall_speed
+
+        self.fall_counter += 1
+        if self.fall_counter >= fall_speed and self.alive:
+            self._move_piece_down()
+            self.fall_counter = 0
+
+    def _update_bot(self):
+        """
+        Acerca la pieza a la jugada elegida (una acción cada bot_interval
+        frames) y la deja caer cuando está en su sitio.
+        """
+        self._bot_frame += 1
+        if self._bot_frame % self.bot_interval:
+            return
+        piece = self.current_piece
+        if self._bot_target is None:
+            self._perform_hard_drop()
+            return
+        rotation, x = self._bot_target
+        if piece.rotation != rotation:
+            key = self.controls["rotate"]
+        elif piece.x < x:
+            key = self.controls["right"]
+        elif piece.x > x:
+            key = self.controls["left"]
+        else:
+            self._perform_hard_drop()
+            return
+        original = (piece.x, piece.rotation)
+        self._apply_key_movement(key)
+        if (piece.x, piece.rotation) == original:
+            # Movimiento bloqueado: abandonar la jugada
+            self._bot_target = None
+
+    def _apply_key_movement(self, key):
+        """
+        Aplica el movimiento según la tecla presionada.
+
+        Args:
+            key (int): Código de la tecla presionada
+        """
+        piece = self.current_piece
+        original_x = piece.x
+        original_rotation = piece.rotation
+
+        if key == self.controls["left"]:
+            piece.move_left()
+        elif key == self.controls["right"]:
+            piece.move_right()
+        elif key == self.controls["rotate"]:
+            piece.rotate()
+
+        # Restaurar posición si hay colisión
+        if not self.board.is_valid_position(piece):
+            piece.x = original_x
+            piece.rotation = original_rotation
+
+    def _move_piece_down(self):
+        """
+        Mueve la pieza actual hacia abajo y la fija si no puede bajar más.
+        """
+        piece = self.current_piece
+        piece.move_down()
+        if not self.board.is_valid_position(piece):
+            piece.y -= 1
+            self._lock_piece()
+
+    def _perform_hard_drop(self):
+        """
+        Realiza un hard drop (caída instantánea) de la pieza actual.
+        """
+        self.board.hard_drop(self.current_piece)
+        self._lock_piece()
+
+    def _lock_piece(self):
+        """
+        Fija la pieza actual, reparte la basura y saca la siguiente pieza.
+        Las líneas eliminadas primero cancelan la basura pendiente y el resto
+        se envía al rival; si no se elimina ninguna, la basura pendiente
+        entra por debajo del tablero.
+        """
+        score_before = self.board.score
+        if not self.board.add_piece(self.current_piece):
+            self.alive = False
+            return
+
+        cleared = self.board.last_cleared_rows
+        if cleared:
+            self.ui.flash_lines(cleared, slot=self.slot)
+            self.ui.show_score_effect(self.board.score - score_before, slot=self.slot)
+
+            sent = GARBAGE_LINES.get(len(cleared), 0)
+            cancelled = min(sent, self.pending_garbage)
+            self.pending_garbage -= cancelled
+            self.outgoing_garbage += sent - cancelled
+        elif self.pending_garbage:
+            hole = random.randrange(GRID_WIDTH)
+            if not self.board.add_garbage(self.pending_garbage, hole):
+                self.alive = False
+            self.pending_garbage = 0
+
+        # Generar nueva pieza
+        self.current_piece = self.piece_generator.get_next_piece()
+        if not self.board.is_valid_position(self.current_piece):
+            self.alive = False
+        if self.bot and self.alive:
+            self._bot_target = best_move(self.board, self.current_piece)
+
+    def get_ghost_y(self):
+        """
+        Obtiene la fila donde aterrizaría la pieza actual (pieza fantasma),
+        recalculándola solo si cambian la pieza o el tablero.
+
+        Returns:
+            int: Fila de aterrizaje de la pieza actual
+        """
+        piece = self.current_piece
+        key = (id(piece), piece.x, piece.y, piece.rotation, id(self.board), self.board.version)
+        if key != self._ghost_key:
+            self._ghost_y = self.board.preview_piece_position(piece)
+            self._ghost_key = key
+        return self._ghost_y
+
+class VersusGame:
+    """
+    Modo versus local: dos tableros en la misma ventana, cada uno con sus
+    teclas. Las líneas eliminadas envían basura al rival y pierde el
+    primero que no puede sacar una pieza nueva.
+    """
+
+    def __init__(self, render_backend="surface", software_renderer=False, bots=()):
+        """
+        Inicializa el modo versus.
+
+        Args:
+            render_backend (str): Backend de renderizado ("surface" o "texture")
+            software_renderer (bool): Si es True, el backend de texturas usa
+                el renderer por software de SDL
+            bots (iterable): Índices de los jugadores controlados por el bot
+        """
+        self.score_manager = ScoreManager()
+        self.ui = GameUI(self.score_manager, render_backend, software_renderer,
+                         board_count=len(VERSUS_CONTROLS))
+        self.players: list[VersusPlayer] = [
+            VersusPlayer(self.ui, slot, controls, bot=slot in bots)
+            for slot, controls in enumerate(VERSUS_CONTROLS)
+        ]
+        self.wins: list[int] = [0] * len(self.players)
+
+        self.clock = pygame.time.Clock()
+        self.running = True
+        self.paused = False
+        self.finished = False
+        self.winner: int | None = None
+
+        # Último estado renderizado (para invalidar fondos congelados)
+        self._rendered_state = None
+
+        # Reloj del juego: real, o simulado con un paso fijo por frame
+        self.frame_time_ms: float | None = None
+        self.frame_index = 0
+        self._last_update_ticks: int = self.get_ticks()
+
+        icon: pygame.Surface = pygame.image.load("./content/images/icon.ico")
+        self.ui.backend.set_icon(icon)
+        logging.info("Modo versus inicializado")
+
+    def get_ticks(self):
+        """
+        Obtiene el tiempo actual del juego en milisegundos (simulado si hay
+        un paso fijo por frame).
+
+        Returns:
+            int: Milisegundos transcurridos
+        """
+        if self.frame_time_ms is not None:
+            return int(self.frame_index * self.frame_time_ms)
+        return pygame.time.get_ticks()
+
+    def start_match(self):
+        """Empieza una partida nueva con los dos tableros vacíos."""
+        for player in self.players:
+            player.reset()
+        self.ui.clear_animations()
+        self.paused = False
+        self.finished = False
+        self.winner = None
+
+    def run(self, max_frames=None, recorder=None):
+        """
+        Ejecuta el bucle del modo versus.
+
+        Args:
+            max_frames (int, opcional): Número de frames tras el que se termina
+            recorder (FrameRecorder, opcional): Grabador de frames y tiempos de render
+        """
+        try:
+            while self.running:
+                self._handle_events()
+                self._update()
+
+                render_start: float = time.perf_counter()
+                self._render()
+                if recorder is not None:
+                    render_ms: float = (time.perf_counter() - render_start) * 1000
+                    recorder.record(self.frame_index + 1, self.ui.backend, render_ms)
+
+                self.frame_index += 1
+                if max_frames is not None and self.frame_index >= max_frames:
+                    self.running = False
+                if self.frame_time_ms is None:
+                    self.clock.tick(FPS)
+        except KeyboardInterrupt:
+            logging.info("Modo versus interrumpido manualmente")
+        except Exception as e:
+            logging.error(f"Error en el modo versus: {e}")
+            logging.error(traceback.format_exc())
+            raise
+        finally:
+            logging.info(f"Modo versus terminado, marcador {self.wins}")
+            pygame.quit()
+
+    def _handle_events(self):
+        """
+        Maneja los eventos de entrada de los dos jugadores.
+        """
+        ticks: int = self.get_ticks()
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+                return
+
+            if self.finished:
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_RETURN:
+                        self.start_match()
+                    elif event.key == pygame.K_ESCAPE:
+                        self.running = False
+            elif self.paused:
+                action = self.ui.handle_menu_input(event, self.ui.menu_options["pause"])
+                if action == "Continuar":
+                    self.paused = False
+                elif action == "Reiniciar":
+                    self.start_match()
+                elif action == "Salir al Menú":
+                    self.running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key in (pygame.K_p, pygame.K_ESCAPE):
+                    self.paused = True
+                    self.ui.selected_option = 0
+                    return
+                for player in self.players:
+                    if player.handle_key_down(event.key, ticks):
+                        break
+            elif event.type == pygame.KEYUP:
+                for player in self.players:
+                    player.handle_key_up(event.key)
+
+    def _update(self):
+        """
+        Avanza los dos tableros, intercambia la basura y comprueba el final.
+        """
+        current_ticks: int = self.get_ticks()
+        dt: int = current_ticks - self._last_update_ticks
+        self._last_update_ticks = current_ticks
+
+        if self.paused:
+            return
+        if self.finished:
+            # Entre bots, la revancha empieza sola
+            if all(player.bot for player in self.players):
+                self.start_match()
+            return
+
+        for player in self.players:
+            player.update(current_ticks)
+
+        # Enviar la basura de cada jugador al rival
+        for index, player in enumerate(self.players):
+            if player.outgoing_garbage:
+                rival = self.players[(index + 1) % len(self.players)]
+                rival.pending_garbage += player.outgoing_garbage
+                player.outgoing_garbage = 0
+
+        self.ui.update_animations(dt)
+
+        alive = [index for index, player in enumerate(self.players) if player.alive]
+        if len(alive) < len(self.players):
+            self.finished = True
+            self.winner = alive[0] if len(alive) == 1 else None
+            if self.winner is not None:
+                self.wins[self.winner] += 1
+            logging.info(f"Versus: gana {self.winner}, marcador {self.wins}")
+
+    def _render(self):
+        """
+        Renderiza los dos tableros y, si procede, la pausa o el resultado.
+        """
+        state = (self.paused, self.finished)
+        if state != self._rendered_state:
+            self.ui.invalidate_overlay_background()
+            self._rendered_state = state
+
+        if self.finished:
+            if not self.ui.has_overlay_background():
+                self._render_boards()
+            self.ui.draw_versus_result(self.winner, self.wins)
+        elif self.paused:
+            if not self.ui.has_overlay_background():
+                self._render_boards()
+            self.ui.draw_pause_menu()
+        else:
+            self._render_boards()
+
+        self.ui.present()
+
+    def _render_boards(self):
+        """
+        Dibuja los dos tableros con sus piezas y paneles. Los recursos
+        (fondo, atlas, superficies de trabajo) son compartidos y cada tablero
+        o panel solo se vuelve a componer cuando cambian sus datos.
+        """
+        self.ui.draw_background()
+        highscore = self.score_manager.get_highscore()
+        for player in self.players:
+            slot = player.slot
+            self.ui.draw_board(player.board, slot)
+            self.ui.draw_piece(player.current_piece, preview=True, y=player.get_ghost_y(), slot=slot)
+            self.ui.draw_piece(player.current_piece, slot=slot)
+            self.ui.draw_next_pieces(player.piece_generator.peek_next_pieces(), slot)
+            self.ui.draw_score_panel(
+                player.board.score,
+                player.board.level,
+                player.board.lines_cleared,
+                highscore,
+                slot
+            )
+        self.ui.draw_animations()